@@ -1,7 +1,30 @@
 """Initialize the aio-intex-spa package."""
 
 from aio_intex_spa.intex_spa import IntexSpa
+from aio_intex_spa.intex_spa_changes import IntexSpaStatusChange
+from aio_intex_spa.intex_spa_connection_manager import IntexSpaConnectionManager
+from aio_intex_spa.intex_spa_connection_pool import IntexSpaConnectionPool
+from aio_intex_spa.intex_spa_fleet import IntexSpaFleet
+from aio_intex_spa.intex_spa_history import IntexSpaHistory
+from aio_intex_spa.intex_spa_history_file import (
+    IntexSpaHistoryFile,
+    IntexSpaHistoryReader,
+)
+from aio_intex_spa.intex_spa_metrics import IntexSpaMetrics
+from aio_intex_spa.intex_spa_poll_scheduler import IntexSpaPollScheduler
+from aio_intex_spa.intex_spa_reconciler import IntexSpaReconciler
+from aio_intex_spa.intex_spa_rate_limiter import IntexSpaRateLimiter
+from aio_intex_spa.intex_spa_resolver import IntexSpaResolver
+from aio_intex_spa.intex_spa_tracing import IntexSpaTracer
+from aio_intex_spa.intex_spa_retry_policy import (
+    IntexSpaRetryPolicy,
+    IntexSpaRetryStrategy,
+)
 from aio_intex_spa.intex_spa_exceptions import (
     IntexSpaUnreachableException,
+    IntexSpaTimeoutException,
     IntexSpaDnsException,
+    IntexSpaMalformedResponseException,
+    IntexSpaChecksumException,
+    IntexSpaPreemptedException,
 )
@@ -2,15 +2,45 @@
 
 import logging
 import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Callable
 
+from .intex_spa_connection_pool import IntexSpaConnectionPool
 from .intex_spa_network_layer import IntexSpaNetworkLayer
-from .intex_spa_query import IntexSpaQuery
-from .intex_spa_object_status import IntexSpaStatus
+from .intex_spa_protocol import IntexSpaProtocolNetworkLayer
+from .intex_spa_priority_semaphore import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    PRIORITY_STATUS,
+    IntexSpaPrioritySemaphore,
+)
+from .intex_spa_metrics import IntexSpaMetrics
+from .intex_spa_rate_limiter import IntexSpaRateLimiter
+from .intex_spa_retry_policy import NETWORK_ERRORS, IntexSpaRetryStrategy
+from .intex_spa_query import COMMAND, IntexSpaQuery
+from .intex_spa_tracing import IntexSpaTracer, start_span
+from .intex_spa_changes import (
+    IntexSpaChangeFeed,
+    IntexSpaChangeSubscription,
+    IntexSpaStatusChange,
+)
+from .intex_spa_object_status import (
+    IntexSpaStatus,
+    IntexSpaStatusSnapshot,
+    changed_status_fields,
+)
 from .intex_spa_object_info import IntexSpaInfo
-from .intex_spa_exceptions import IntexSpaUnreachableException
+from .intex_spa_exceptions import (
+    IntexSpaUnreachableException,
+    IntexSpaTimeoutException,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Probes fail fast, for the connection manager to take over
+_PROBE_RETRY_STRATEGY = IntexSpaRetryStrategy(budget=1)
+
 
 class IntexSpa:
     """Interface the user with Intex Spa.
@@ -21,14 +51,42 @@ class IntexSpa:
     ----------
     network : IntexSpaNetworkLayer
       The network layer object for communications with intex spa wifi module
-    status : IntexSpaStatus
+    status : IntexSpaStatusSnapshot
       The status object of the spa
+    status_age : float | None
+      The age of the status object of the spa, in seconds
     info : IntexSpaInfo
       The info object of the spa
+    command_status_max_age : float | None
+      The maximum age of the known status, in seconds, for a command to skip
+      its preliminary status update
+    timeout : float | None
+      The deadline of any intent, retries included, in seconds
+    retry_strategy : IntexSpaRetryStrategy
+      The retry policies of the spa queries, by kind of error
+    rate_limiter : IntexSpaRateLimiter | None
+      The limiter of the rate of queries sent to the spa
+    metrics : IntexSpaMetrics | None
+      The metrics of the conversations with the spa
+    tracer : IntexSpaTracer | opentelemetry.trace.Tracer | None
+      The tracer of the conversations with the spa
 
     """
 
-    def __init__(self, address: str = "SPA_DEVICE", port: str = "8990"):
+    def __init__(
+        self,
+        address: str = "SPA_DEVICE",
+        port: str = "8990",
+        command_status_max_age: float = None,
+        max_in_flight: int = 1,
+        timeout: float = None,
+        retry_strategy: IntexSpaRetryStrategy = None,
+        use_protocol: bool = False,
+        pool: IntexSpaConnectionPool = None,
+        rate_limiter: IntexSpaRateLimiter = None,
+        metrics: IntexSpaMetrics = None,
+        tracer: IntexSpaTracer = None,
+    ):
         """Initialize IntexSpa object instance.
 
         Parameters
@@ -37,15 +95,311 @@ class IntexSpa:
           The fqdn or IP of the intex spa wifi module
         port : str, default = "8990"
           The TCP service port the intex spa wifi module
+        command_status_max_age : float, optional
+          The maximum age of the known status, in seconds, for a command to skip
+          its preliminary status update. By default, the status is always updated.
+        max_in_flight : int, default = 1
+          The maximum number of queries in flight at the same time on the connection.
+          Above 1, queries are pipelined, and only commands remain sequential.
+        timeout : float, optional
+          The deadline of any intent, retries included, in seconds.
+          The per-phase timeouts are set on the `network` object.
+        retry_strategy : IntexSpaRetryStrategy, optional
+          The retry policies of the spa queries, by kind of error.
+          By default, any error is retried 2 seconds later, 3 attempts at most.
+        use_protocol : bool, default = False
+          Whether to communicate through a low-level asyncio protocol,
+          instead of asyncio streams
+        pool : IntexSpaConnectionPool, optional
+          The pool capping the connections open to a fleet of spas, shared by
+          their IntexSpa instances. By default, the connection is not capped.
+        rate_limiter : IntexSpaRateLimiter, optional
+          The limiter of the rate of queries sent to the spa, retries included.
+          By default, the rate is not limited.
+        metrics : IntexSpaMetrics, optional
+          The metrics of the conversations with the spa, possibly shared with other
+          IntexSpa instances. By default, no metrics are collected.
+        tracer : IntexSpaTracer | opentelemetry.trace.Tracer, optional
+          The tracer of the conversations with the spa, emitting a span for each
+          stage, tagged with its intent and sid. By default, no spans are emitted.
 
         """
         _LOGGER.info("Initializing IntexSpa instance...")
-        self.network = IntexSpaNetworkLayer(address, port)
-        self._semaphore = asyncio.Semaphore(1)
-        self.status = IntexSpaStatus()
+        network_class = (
+            IntexSpaProtocolNetworkLayer if use_protocol else IntexSpaNetworkLayer
+        )
+        self.network = network_class(
+            address, port, max_in_flight, pool=pool, metrics=metrics, tracer=tracer
+        )
+        self.command_status_max_age = command_status_max_age
+        self.timeout = timeout
+        self.retry_strategy = retry_strategy or IntexSpaRetryStrategy()
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.tracer = tracer
+        self._semaphore = IntexSpaPrioritySemaphore(max_in_flight)
+        self._command_lock = asyncio.Lock()
+        self.status = IntexSpaStatusSnapshot()
+        self._status_time: float = None
+        self._change_feed = IntexSpaChangeFeed()
+        self._command_listeners: list[Callable[[str], None]] = []
+        self._status_task: asyncio.Task = None
+        self._status_priority = PRIORITY_STATUS
+        self._status_waiters = 0
         self.info = IntexSpaInfo()
         _LOGGER.info("IntexSpa instance initialized")
 
+    @property
+    def status_age(self) -> float | None:
+        """Age of the status object of the spa, in seconds, or None if unknown."""
+        if self._status_time is None:
+            return None
+        return time.monotonic() - self._status_time
+
+    @contextlib.asynccontextmanager
+    async def _async_deadline(self, intent: str) -> AsyncIterator[None]:
+        """Bound the handling of an intent by the `timeout` deadline, in its span."""
+        with start_span(self.tracer, "intex_spa.intent", intent):
+            if self.timeout is None:
+                yield
+                return
+            async with self._async_timeout(intent):
+                yield
+
+    @contextlib.asynccontextmanager
+    async def _async_timeout(self, intent: str) -> AsyncIterator[None]:
+        """Bound the handling of an intent by the `timeout` deadline."""
+        try:
+            async with asyncio.timeout(self.timeout) as deadline:
+                yield
+        except TimeoutError as err:
+            if not deadline.expired():
+                raise
+            _LOGGER.info("'%s' intent: deadline exceeded", intent)
+            raise IntexSpaTimeoutException(
+                f"Spa did not answer '{intent}' intent within {self.timeout}s"
+            ) from err
+
+    async def _async_query(
+        self,
+        intent: str = "status",
+        expected_state: bool | int = None,
+        retry_strategy: IntexSpaRetryStrategy = None,
+        keep_status: bool = False,
+    ) -> IntexSpaStatus | IntexSpaInfo:
+        """Query the spa wifi module, retrying as needed.
+
+        Must be called while holding the semaphore.
+
+        Parameters
+        ----------
+        intent : str
+          The intent to handle (i.e.: "status", "heater", "preset_temp", ...)
+        expected_state : bool | int, optional
+          The expected state of the function or the temperature preset
+        retry_strategy : IntexSpaRetryStrategy, optional
+          The retry policies of this query, `retry_strategy` attribute by default
+        keep_status : bool, default = False
+          Whether to keep the known status when the spa is unreachable,
+          instead of resetting it
+
+        Returns
+        -------
+        status_or_info : IntexSpaStatus | IntexSpaInfo
+          The info of the spa for an "info" intent, its status otherwise
+
+        """
+        retry_strategy = retry_strategy or self.retry_strategy
+        failures = {}
+        while True:
+            try:
+                _LOGGER.debug("'%s' intent: new spa query...", intent)
+                # Initialize a query to the spa
+                query = IntexSpaQuery(intent, expected_state, tracer=self.tracer)
+
+                with start_span(
+                    self.tracer, "intex_spa.query", intent, query.intex_timestamp
+                ):
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.async_acquire()
+
+                    # Send the raw request bytes and receive the raw response bytes
+                    # via the network object
+                    received_bytes = await self.network.async_request(
+                        query.request_bytes, query.intex_timestamp, intent
+                    )
+                    parse_start = (
+                        time.perf_counter() if self.metrics is not None else 0.0
+                    )
+                    # Give the raw received_bytes back to the query object
+                    # to render the new status
+                    query.render_response_data(received_bytes)
+                    if intent == "info":
+                        # Update the info object with the data received
+                        self.info = IntexSpaInfo(query.response_data)
+                        _LOGGER.debug("'%s' intent: new info is rendered", intent)
+                        result = self.info
+                    else:
+                        # Update the status object with the data received
+                        self._set_status(IntexSpaStatusSnapshot(query.response_data))
+                        self._status_time = time.monotonic()
+                        _LOGGER.debug("'%s' intent: new status is rendered", intent)
+                        result = self.status
+                    if self.metrics is not None:
+                        self.metrics.observe_latency(
+                            intent, "parse", time.perf_counter() - parse_start
+                        )
+                    return result
+
+            except asyncio.CancelledError:
+                # The conversation was interrupted: unless responses are dispatched
+                # by sid, the stream state is unknown
+                if not self.network.pipelined:
+                    await self.network.async_force_disconnect()
+                raise
+
+            except AssertionError as err:
+                _LOGGER.info("Malformed spa response during spa querying: %s", err)
+                if self.metrics is not None:
+                    self.metrics.record_retry(err)
+                delay = retry_strategy.get_delay(err, failures)
+
+            except NETWORK_ERRORS as err:
+                _LOGGER.info("Network raised an exception during spa querying")
+                if self.metrics is not None:
+                    self.metrics.record_retry(err)
+                await self.network.async_force_disconnect()
+                delay = retry_strategy.get_delay(err, failures)
+
+            if delay is None:
+                break
+            with start_span(self.tracer, "intex_spa.retry_sleep", intent):
+                await asyncio.sleep(delay)
+
+        # No retry has succeeded
+        _LOGGER.info("Spa is unreachable")
+        if not keep_status:
+            self._set_status(IntexSpaStatusSnapshot())
+            self._status_time = None
+        raise IntexSpaUnreachableException("Spa is unreachable")
+
+    def _set_status(self, status: IntexSpaStatusSnapshot) -> None:
+        """Set the status object, and publish its changes to the subscribers."""
+        previous, self.status = self.status, status
+        if not self._change_feed.subscribed:
+            return
+        fields = changed_status_fields(previous, status)
+        if fields:
+            self._change_feed.publish(IntexSpaStatusChange(fields, previous, status))
+
+    async def _async_command(
+        self, intent: str, expected_state: bool | int, status_from_cache: bool = False
+    ) -> IntexSpaStatus:
+        """Send a command to the spa wifi module.
+
+        Must be called while holding the semaphore.
+
+        Parameters
+        ----------
+        intent : str
+          The command intent to send (i.e.: "heater", "preset_temp", ...)
+        expected_state : bool | int
+          The expected state of the function or the temperature preset
+        status_from_cache : bool, default = False
+          Whether the command was decided from a known status, not freshly updated
+
+        Returns
+        -------
+        status : IntexSpaStatus
+          The status of the spa
+
+        """
+        await self._async_query(intent, expected_state)
+
+        if (
+            status_from_cache
+            and intent != "preset_temp"
+            and getattr(self.status, intent) != expected_state
+        ):
+            # The toggle was decided from a stale known status,
+            # and has flipped the function away from expected_state
+            _LOGGER.info("'%s' intent: known status was stale, toggling again", intent)
+            await self._async_query(intent, expected_state)
+
+        for listener in tuple(self._command_listeners):
+            # The command is sent anyway: a listener error must not fail it
+            try:
+                listener(intent)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("'%s' intent: command listener error", intent)
+        return self.status
+
+    @contextlib.asynccontextmanager
+    async def _async_turn(
+        self, intent: str, priority: int, key: str = None, command: bool = False
+    ) -> AsyncIterator[None]:
+        """Wait for the turn of an intent, then hold it for the context duration.
+
+        Parameters
+        ----------
+        intent : str
+          The intent waiting for its turn
+        priority : int
+          The priority of the intent, PRIORITY_COMMAND being the highest
+        key : str, optional
+          The key to find the waiting intent back, to give it a higher priority
+        command : bool, default = False
+          Whether to run the intent after concurrent commands, sequentially
+
+        """
+        wait_start = time.perf_counter()
+        with start_span(self.tracer, "intex_spa.semaphore_wait", intent):
+            if command:
+                await self._command_lock.acquire()
+            try:
+                await self._semaphore.async_acquire(priority, key)
+            except BaseException:
+                if command:
+                    self._command_lock.release()
+                raise
+        if self.metrics is not None:
+            self.metrics.observe_latency(
+                intent, "semaphore_wait", time.perf_counter() - wait_start
+            )
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+            if command:
+                self._command_lock.release()
+
+    async def _async_preliminary_update(self, intent: str) -> bool:
+        """Update the status before a command, unless it is fresh enough.
+
+        Must be called while holding the semaphore.
+
+        Returns
+        -------
+        status_from_cache : bool
+          Whether the known status was kept, not freshly updated
+
+        """
+        status_age = self.status_age
+        if (
+            self.command_status_max_age is not None
+            and status_age is not None
+            and status_age <= self.command_status_max_age
+        ):
+            _LOGGER.debug("'%s' intent: known status is fresh enough", intent)
+            if self.metrics is not None:
+                self.metrics.status_cache_hits += 1
+            return True
+
+        _LOGGER.debug("'%s' intent: triggering a preliminary 'update' query...", intent)
+        with start_span(self.tracer, "intex_spa.preliminary_update", intent):
+            await self._async_query("status")
+        return False
+
     async def _async_handle_intent(
         self, intent: str = "status", expected_state: bool | int = None
     ) -> IntexSpaStatus:
@@ -56,8 +410,10 @@ class IntexSpa:
         * *command*: to change the function state or temperature preset on the spa
 
         A conversation with the spa is made of one or more queries:
-        * A command intent always triggers a preliminary status update
+        * A command intent always triggers a preliminary status update,
+          unless the known status is younger than `command_status_max_age`
         * Command is sent and response is received
+        * A toggle command decided from a stale known status is sent again
         * Retries can happen as needed
 
         Parameters
@@ -76,83 +432,54 @@ class IntexSpa:
 
         _LOGGER.debug("'%s' intent: Handling new intent...", intent)
 
-        # Trigger a preliminary update status intent if the provided intent is a command
-        if intent != "status" and intent != "info":
-            _LOGGER.debug(
-                "'%s' intent: triggering a preliminary 'update' intent...", intent
-            )
-            await self.async_update_status()
-
-        # Run concurrent requests senquentially
-        async with self._semaphore:
-            if (
-                # the provided intent is an update status
-                intent == "status"
-                # the provided intent is an update info
-                or intent == "info"
-                # the provided intent is a command
-                # and its expected_state differs from the current state
-                or getattr(self.status, intent) != expected_state
-            ):
+        # Bound the whole conversation, retries included
+        async with self._async_deadline(intent):
+            if intent != "status" and intent != "info":
+                # Run concurrent commands sequentially, ahead of other queries,
+                # keeping the slot from the preliminary update to the command
+                async with self._async_turn(intent, PRIORITY_COMMAND, command=True):
+                    status_from_cache = await self._async_preliminary_update(intent)
+
+                    # Only query the spa if the expected_state differs from the current state
+                    if getattr(self.status, intent) != expected_state:
+                        _LOGGER.debug("'%s' intent: a spa query is needed", intent)
+                        return await self._async_command(
+                            intent, expected_state, status_from_cache
+                        )
+
+                # Return a status even when getattr(self.status, intent) == expected_state
+                # Fixes mathieu-mp/aio-intex-spa#17
+                return self.status
+
+            # Run concurrent queries sequentially, or within the in-flight window
+            priority = self._status_priority if intent == "status" else PRIORITY_STATUS
+            async with self._async_turn(intent, priority, intent):
                 _LOGGER.debug("'%s' intent: a spa query is needed", intent)
+                return await self._async_query(intent)
+
+    def _on_status_task_done(self, task: asyncio.Task) -> None:
+        """Forget the shared status update task once done."""
+        if self._status_task is task:
+            self._status_task = None
+        # Mark the exception as retrieved, even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def async_update_status(
+        self, max_age: float = None, priority: int = PRIORITY_STATUS
+    ) -> IntexSpaStatus:
+        """Update known status of the spa.
 
-                # Attempt maximum 3 times
-                for _ in range(3):
-                    try:
-                        _LOGGER.debug("'%s' intent: new spa query...", intent)
-                        # Initialize a query to the spa
-                        query = IntexSpaQuery(intent, expected_state)
-
-                        # Send the raw request bytes via the network object
-                        await self.network.async_send(query.request_bytes)
-
-                        # Receive the raw response bytes via the network object
-                        received_bytes = await self.network.async_receive()
-                        # Give the raw received_bytes back to the query object
-                        # to render the new status
-                        query.render_response_data(received_bytes)
-                        if intent == "info":
-                            # Update the info object with the data received
-                            self.info = IntexSpaInfo(query.response_data)
-                            _LOGGER.debug("'%s' intent: new info is rendered", intent)
-                            return self.info
-                        else:
-                            # Update the status object with the data received
-                            self.status = IntexSpaStatus(query.response_data)
-                            _LOGGER.debug("'%s' intent: new status is rendered", intent)
-                            return self.status
-
-                    except (AssertionError,):
-                        _LOGGER.info("Malformed spa response during spa querying")
-                        await asyncio.sleep(2)
-                        continue
-
-                    except (
-                        TimeoutError,
-                        asyncio.IncompleteReadError,
-                        ConnectionRefusedError,
-                        ConnectionResetError,
-                        ConnectionError,
-                        OSError,
-                    ):
-                        _LOGGER.info("Network raised an exception during spa querying")
-                        await self.network.async_force_disconnect()
-                        await asyncio.sleep(2)
-                        continue
-
-                    else:
-                        break
-                else:  # No retry has succeeded
-                    _LOGGER.info("Spa is unreachable")
-                    self.status = IntexSpaStatus()
-                    raise IntexSpaUnreachableException("Spa is unreachable")
-
-        # Return a status even when getattr(self.status, intent) == expected_state
-        # Fixes mathieu-mp/aio-intex-spa#17
-        return self.status
+        Concurrent calls share one in-flight status query, queued with the highest
+        priority of its callers.
 
-    async def async_update_status(self) -> IntexSpaStatus:
-        """Update known status of the spa.
+        Parameters
+        ----------
+        max_age : float, optional
+          The maximum age of the known status, in seconds, for it to be returned
+          without querying the spa. By default, the spa is always queried.
+        priority : int, default = PRIORITY_STATUS
+          The priority of the status query, PRIORITY_COMMAND being the highest
 
         Returns
         -------
@@ -160,7 +487,113 @@ class IntexSpa:
           The updated spa status
 
         """
-        return await self._async_handle_intent("status")
+        if max_age is not None:
+            status_age = self.status_age
+            if status_age is not None and status_age <= max_age:
+                _LOGGER.debug("'status' intent: known status is fresh enough")
+                if self.metrics is not None:
+                    self.metrics.status_cache_hits += 1
+                return self.status
+
+        if self._status_task is None:
+            if self.metrics is not None:
+                self.metrics.status_cache_misses += 1
+            self._status_priority = priority
+            self._status_task = asyncio.create_task(self._async_handle_intent("status"))
+            self._status_task.add_done_callback(self._on_status_task_done)
+        else:
+            _LOGGER.debug("'status' intent: joining the in-flight status query")
+            if self.metrics is not None:
+                self.metrics.status_coalesced += 1
+            if priority < self._status_priority:
+                self._status_priority = priority
+                self._semaphore.reprioritize("status", priority)
+
+        # Shield the shared query from the cancellation of any single caller,
+        # but cancel it when its last caller is cancelled
+        status_task = self._status_task
+        self._status_waiters += 1
+        try:
+            return await asyncio.shield(status_task)
+        except asyncio.CancelledError:
+            if self._status_waiters == 1 and self._status_task is status_task:
+                status_task.cancel()
+            raise
+        finally:
+            self._status_waiters -= 1
+
+    async def async_probe(self) -> IntexSpaStatus | None:
+        """Check the connection to the spa with a single status query.
+
+        The query is not retried, and is skipped while other queries are in
+        progress, so that probing never delays them. A failed probe closes the
+        connection, but keeps the known status.
+
+        Returns
+        -------
+        status : IntexSpaStatus | None
+          The updated spa status, or None if the probe was skipped
+
+        """
+        if self._semaphore.locked() or self._status_task is not None:
+            return None
+        async with self._semaphore.hold(PRIORITY_BACKGROUND):
+            return await self._async_query(
+                "status", retry_strategy=_PROBE_RETRY_STRATEGY, keep_status=True
+            )
+
+    def cancel_queued_queries(self, priority: int = PRIORITY_STATUS) -> int:
+        """Cancel the queries waiting for their turn, of the given priority or lower.
+
+        By default, commands go on, and queued status and info queries raise
+        IntexSpaPreemptedException.
+
+        Returns
+        -------
+        count : int
+          The number of cancelled queries
+
+        """
+        return self._semaphore.cancel_waiters(priority)
+
+    def changes(self) -> IntexSpaChangeSubscription:
+        """Iterate over the changes of the spa status, as they are received.
+
+        The status is not polled: the changes come from the queries sent to the
+        spa, by any intent. Each subscriber gets the changes from now on, in order,
+        skipping the oldest ones if it falls too far behind, until it is closed.
+
+        Returns
+        -------
+        changes : IntexSpaChangeSubscription
+          The changes of the spa status, holding the changed fields only
+
+        """
+        return self._change_feed.subscribe()
+
+    def add_command_listener(
+        self, listener: Callable[[str], None]
+    ) -> Callable[[], None]:
+        """Call `listener` with the intent of each command sent to the spa.
+
+        Errors raised by the listener are logged, not raised to the command caller.
+
+        Returns
+        -------
+        remove_listener : Callable[[], None]
+          The function removing the listener, once however many times it is called
+
+        """
+        self._command_listeners.append(listener)
+        removed = False
+
+        def remove_listener() -> None:
+            nonlocal removed
+            if not removed:
+                removed = True
+                self._command_listeners.remove(listener)
+
+        return remove_listener
 
     async def async_set(
         self, parameter: str, expected_state: bool = True
@@ -175,6 +608,52 @@ class IntexSpa:
         """
         return await self._async_handle_intent(parameter, expected_state)
 
+    async def async_apply(
+        self, expected_states: dict[str, bool | int]
+    ) -> IntexSpaStatus:
+        """Set several functions and the temperature preset in one conversation.
+
+        The status is updated once, then only the needed commands are sent
+        back-to-back, each one decided from the status returned by the previous one.
+        Power is turned on first, or turned off last.
+
+        Parameters
+        ----------
+        expected_states : dict[str, bool | int]
+          The expected state by function, or temperature preset
+          (i.e.: {"heater": True, "preset_temp": 38})
+
+        Returns
+        -------
+        status : IntexSpaStatus
+          The updated spa status
+
+        """
+        for parameter in expected_states:
+            if parameter not in COMMAND or parameter in ("status", "info"):
+                raise ValueError(f"Unknown spa function: {parameter}")
+
+        parameters = sorted(
+            expected_states,
+            key=lambda parameter: (
+                (0 if expected_states[parameter] else 2) if parameter == "power" else 1
+            ),
+        )
+
+        async with self._async_deadline("apply"):
+            async with self._async_turn("apply", PRIORITY_COMMAND, command=True):
+                status_from_cache = await self._async_preliminary_update("apply")
+                for parameter in parameters:
+                    expected_state = expected_states[parameter]
+                    if getattr(self.status, parameter) != expected_state:
+                        await self._async_command(
+                            parameter, expected_state, status_from_cache
+                        )
+                        # Next commands are decided from the status returned by this one
+                        status_from_cache = False
+
+            return self.status
+
     async def async_set_power(self, expected_state: bool = True) -> IntexSpaStatus:
         """Set power function to `expected_state`.
 
@@ -0,0 +1,206 @@
+"""Load IntexSpaStatusChange and IntexSpaChangeFeed classes."""
+
+import logging
+import asyncio
+from collections import deque
+
+from .intex_spa_object_status import IntexSpaStatusSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaStatusChange:
+    """Hold a change of the spa status.
+
+    Attributes
+    ----------
+    fields : tuple
+        The names of the changed fields, in `STATUS_FIELDS` order
+    previous : IntexSpaStatusSnapshot
+        The status before the change
+    status : IntexSpaStatusSnapshot
+        The status after the change
+
+    """
+
+    __slots__ = ("fields", "previous", "status")
+
+    def __init__(
+        self,
+        fields: tuple,
+        previous: IntexSpaStatusSnapshot,
+        status: IntexSpaStatusSnapshot,
+    ):
+        """Initialize IntexSpaStatusChange class.
+
+        Parameters
+        ----------
+        fields : tuple
+            The names of the changed fields
+        previous : IntexSpaStatusSnapshot
+            The status before the change
+        status : IntexSpaStatusSnapshot
+            The status after the change
+
+        """
+        self.fields = fields
+        self.previous = previous
+        self.status = status
+
+    def as_dict(self) -> dict:
+        """Return the new values of the changed fields, as dict.
+
+        Returns
+        -------
+        changed_fields : dict
+            The new values of the changed fields, None if the status is unknown
+
+        """
+        return {name: getattr(self.status, name, None) for name in self.fields}
+
+    def __repr__(self) -> str:
+        """Represent IntexSpaStatusChange changed fields."""
+        return f"IntexSpaStatusChange({self.as_dict()!r})"
+
+
+class IntexSpaChangeFeed:
+    """Broadcast the changes of a spa status to its subscribers.
+
+    The last `max_backlog` changes are kept in a ring, numbered in sequence, and
+    each subscriber only holds its position in the sequence. Publishing is O(1)
+    however many subscribers are attached, and each subscriber reads the changes
+    in order, at its own pace: a subscriber falling more than `max_backlog`
+    changes behind skips the oldest ones, so that memory stays bounded.
+
+    Attributes
+    ----------
+    max_backlog : int
+        The maximum number of changes kept for the slowest subscribers
+
+    """
+
+    def __init__(self, max_backlog: int = 100):
+        """Initialize IntexSpaChangeFeed class.
+
+        Parameters
+        ----------
+        max_backlog : int, default = 100
+            The maximum number of changes kept for the slowest subscribers
+
+        """
+        self.max_backlog = max_backlog
+        self._changes: deque[IntexSpaStatusChange] = deque(maxlen=max_backlog)
+        # Sequence number of the next change
+        self._sequence = 0
+        self._published: asyncio.Future | None = None
+        self._subscribers = 0
+
+    @property
+    def subscribed(self) -> bool:
+        """Whether the feed has open subscriptions."""
+        return self._subscribers > 0
+
+    def publish(self, change: IntexSpaStatusChange) -> None:
+        """Publish a change to the subscribers.
+
+        Parameters
+        ----------
+        change : IntexSpaStatusChange
+            The change of the spa status
+
+        """
+        if not self._subscribers:
+            return
+        self._changes.append(change)
+        self._sequence += 1
+        self._wake_up()
+
+    def subscribe(self) -> "IntexSpaChangeSubscription":
+        """Subscribe to the changes published from now on.
+
+        Returns
+        -------
+        changes : IntexSpaChangeSubscription
+            The changes, in order, until the subscription is closed
+
+        """
+        return IntexSpaChangeSubscription(self)
+
+    def _wake_up(self) -> None:
+        """Wake up the subscribers waiting for a change."""
+        future, self._published = self._published, None
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    async def _async_wait_published(self) -> None:
+        """Wait for the next change to be published."""
+        loop = asyncio.get_running_loop()
+        if self._published is None or self._published.get_loop() is not loop:
+            self._published = loop.create_future()
+        # Shield the future shared by all subscribers from cancellation
+        await asyncio.shield(self._published)
+
+
+class IntexSpaChangeSubscription:
+    """Iterate over the changes published by a feed, from the subscription on.
+
+    Attributes
+    ----------
+    dropped : int
+        The number of changes skipped while the subscriber was too far behind
+
+    """
+
+    def __init__(self, feed: IntexSpaChangeFeed):
+        """Initialize IntexSpaChangeSubscription class.
+
+        Parameters
+        ----------
+        feed : IntexSpaChangeFeed
+            The feed publishing the changes
+
+        """
+        self.dropped = 0
+        self._feed = feed
+        self._sequence = feed._sequence
+        self._closed = False
+        feed._subscribers += 1
+
+    def __aiter__(self) -> "IntexSpaChangeSubscription":
+        """Return the subscription, iterating over the changes."""
+        return self
+
+    async def __anext__(self) -> IntexSpaStatusChange:
+        """Return the next change, waiting for it if needed."""
+        feed = self._feed
+        while not self._closed:
+            if self._sequence < feed._sequence:
+                oldest = feed._sequence - len(feed._changes)
+                if self._sequence < oldest:
+                    _LOGGER.debug(
+                        "Subscriber too far behind, %s changes skipped",
+                        oldest - self._sequence,
+                    )
+                    self.dropped += oldest - self._sequence
+                    self._sequence = oldest
+                change = feed._changes[self._sequence - oldest]
+                self._sequence += 1
+                return change
+            await feed._async_wait_published()
+        raise StopAsyncIteration
+
+    def close(self) -> None:
+        """Stop receiving the changes."""
+        if not self._closed:
+            self._closed = True
+            self._feed._subscribers -= 1
+            # Let a consumer waiting for a change stop iterating
+            self._feed._wake_up()
+
+    async def aclose(self) -> None:
+        """Stop receiving the changes."""
+        self.close()
+
+    def __del__(self) -> None:
+        """Close the subscription once it is no longer referenced."""
+        self.close()
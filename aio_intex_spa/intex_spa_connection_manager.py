@@ -0,0 +1,159 @@
+"""Load IntexSpaConnectionManager class."""
+
+import logging
+import asyncio
+import contextlib
+import time
+
+from .intex_spa import IntexSpa
+from .intex_spa_exceptions import IntexSpaDnsException, IntexSpaUnreachableException
+from .intex_spa_retry_policy import NETWORK_ERRORS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaConnectionManager:
+    """Manage the lifecycle of the connection to a spa.
+
+    AsyncIO-enabled class running one background loop per spa, which checks the
+    connection every `check_interval` seconds:
+    * With `idle_timeout`, an unused connection is closed, and reopened on demand
+    * With `heartbeat_interval`, an unused connection is probed with a status
+      query, to keep it warm and notice silent failures before the next request
+    * A connection found lost, but not closed for idleness, is reopened in the
+      background, backing off exponentially while the spa is unreachable
+
+    Attributes
+    ----------
+    spa : IntexSpa
+      The spa whose connection is managed
+    idle_timeout : float | None
+      The idle time after which the connection is closed, in seconds
+    heartbeat_interval : float | None
+      The idle time after which the connection is probed, in seconds
+    check_interval : float
+      The delay between connection checks, in seconds
+    reconnect_delay : float
+      The delay before retrying a failed reconnection, in seconds
+    max_reconnect_delay : float
+      The maximum delay before retrying a failed reconnection, in seconds
+
+    """
+
+    def __init__(
+        self,
+        spa: IntexSpa,
+        idle_timeout: float = None,
+        heartbeat_interval: float = None,
+        check_interval: float = 1.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+    ):
+        """Initialize IntexSpaConnectionManager class.
+
+        Parameters
+        ----------
+        spa : IntexSpa
+          The spa whose connection is managed
+        idle_timeout : float, optional
+          The idle time after which the connection is closed, in seconds.
+          By default, the connection is kept open.
+        heartbeat_interval : float, optional
+          The idle time after which the connection is probed, in seconds,
+          for latency-critical spas. By default, the connection is not probed.
+        check_interval : float, default = 1.0
+          The delay between connection checks, in seconds
+        reconnect_delay : float, default = 1.0
+          The delay before retrying a failed reconnection, in seconds,
+          doubled after each failure until `max_reconnect_delay`
+        max_reconnect_delay : float, default = 60.0
+          The maximum delay before retrying a failed reconnection, in seconds
+
+        """
+        if idle_timeout is not None and heartbeat_interval is not None:
+            raise ValueError("A connection cannot both time out and be kept warm")
+        self.spa = spa
+        self.idle_timeout = idle_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.check_interval = check_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        # Whether the connection should be reopened once lost
+        self._keep_connected = heartbeat_interval is not None
+        self._next_reconnect = 0.0
+        self._current_reconnect_delay = reconnect_delay
+        self._task: asyncio.Task = None
+
+    async def _async_reconnect(self) -> None:
+        """Reopen the connection to the spa, backing off on failure."""
+        now = time.monotonic()
+        if now < self._next_reconnect:
+            return
+        _LOGGER.info("Reconnecting to the spa in the background...")
+        try:
+            await self.spa.network.async_connect()
+        except (IntexSpaDnsException, *NETWORK_ERRORS) as err:
+            _LOGGER.info(
+                "Background reconnection failed, retrying in %ss: %r",
+                self._current_reconnect_delay,
+                err,
+            )
+            self._next_reconnect = now + self._current_reconnect_delay
+            self._current_reconnect_delay = min(
+                self._current_reconnect_delay * 2, self.max_reconnect_delay
+            )
+        else:
+            self._current_reconnect_delay = self.reconnect_delay
+
+    async def _async_heartbeat(self) -> None:
+        """Probe the connection to the spa."""
+        _LOGGER.debug("Probing the idle connection to the spa...")
+        try:
+            await self.spa.async_probe()
+        except IntexSpaUnreachableException:
+            # The failed query has closed the connection: reopen it right away
+            _LOGGER.info("Spa connection probe failed")
+
+    async def async_check(self) -> None:
+        """Check the connection to the spa once, and act on its state."""
+        network = self.spa.network
+        if not network.connected:
+            if self._keep_connected:
+                await self._async_reconnect()
+            return
+
+        self._keep_connected = True
+        idle_time = network.idle_time
+        if self.idle_timeout is not None and idle_time >= self.idle_timeout:
+            _LOGGER.info("Closing the connection to the spa, idle for %.0fs", idle_time)
+            self._keep_connected = False
+            await network.async_force_disconnect()
+        elif self.heartbeat_interval is not None and (
+            idle_time >= self.heartbeat_interval
+        ):
+            await self._async_heartbeat()
+            if not network.connected:
+                await self._async_reconnect()
+
+    async def _async_run(self) -> None:
+        """Manage the connection until stopped."""
+        while True:
+            try:
+                await self.async_check()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.info("Spa connection check failed: %r", err)
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        """Start managing the connection in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._async_run())
+
+    async def async_stop(self) -> None:
+        """Stop managing the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
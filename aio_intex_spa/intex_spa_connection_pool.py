@@ -0,0 +1,169 @@
+"""Load IntexSpaConnectionPool class."""
+
+import logging
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .intex_spa_network_layer import IntexSpaNetworkLayer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaConnectionPool:
+    """Cap the number of connections open to a fleet of spas.
+
+    AsyncIO-enabled class shared by the network layers of many spas: a network layer
+    takes a slot from the pool before connecting, and gives it back once disconnected.
+    When all slots are taken, the least recently used idle connection is closed,
+    to be reopened on demand; if none is idle, the connection waits for a slot.
+
+    Attributes
+    ----------
+    max_connections : int
+        The maximum number of connections open at the same time
+    hits : int
+        The number of requests sent over an already open connection
+    misses : int
+        The number of requests which needed to open a connection first
+    evictions : int
+        The number of idle connections closed to free a slot
+    connects : int
+        The number of connections opened
+    connect_time : float
+        The total time spent opening connections, in seconds
+    wait_time : float
+        The total time spent waiting for a slot, in seconds
+
+    """
+
+    def __init__(self, max_connections: int = 256):
+        """Initialize IntexSpaConnectionPool class.
+
+        Parameters
+        ----------
+        max_connections : int, default = 256
+            The maximum number of connections open at the same time
+
+        """
+        self.max_connections = max_connections
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.connects = 0
+        self.connect_time = 0.0
+        self.wait_time = 0.0
+
+        # Network layers holding a slot, least recently used first
+        self._connections: OrderedDict[IntexSpaNetworkLayer, None] = OrderedDict()
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def open_connections(self) -> int:
+        """Number of slots taken."""
+        return len(self._connections)
+
+    def touch(self, network: "IntexSpaNetworkLayer") -> None:
+        """Record a request from a network layer, as the most recently used."""
+        if network.connected:
+            self.hits += 1
+            if network in self._connections:
+                self._connections.move_to_end(network)
+        else:
+            self.misses += 1
+
+    def _least_recently_used_idle(self) -> "IntexSpaNetworkLayer | None":
+        """Return the least recently used connection without request in progress."""
+        for network in self._connections:
+            if not network.busy:
+                return network
+        return None
+
+    async def async_acquire(self, network: "IntexSpaNetworkLayer") -> None:
+        """Take a slot for a network layer, evicting an idle connection if needed."""
+        if network in self._connections:
+            self._connections.move_to_end(network)
+            return
+
+        wait_start = time.monotonic()
+        while len(self._connections) >= self.max_connections:
+            victim = self._least_recently_used_idle()
+            if victim is not None:
+                _LOGGER.debug("Closing the least recently used spa connection")
+                self.evictions += 1
+                self.release(victim)
+                await victim.async_force_disconnect()
+                continue
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+        self.wait_time += time.monotonic() - wait_start
+
+        self._connections[network] = None
+
+    def _wake_waiter(self) -> None:
+        """Wake a connection waiting for a slot."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def release(self, network: "IntexSpaNetworkLayer") -> None:
+        """Give the slot of a network layer back, if it holds one."""
+        if self._connections.pop(network, False) is None:
+            self._wake_waiter()
+
+    def idle(self, network: "IntexSpaNetworkLayer") -> None:
+        """Record the end of a request, making its connection evictable."""
+        if self._waiters and not network.busy:
+            self._wake_waiter()
+
+    @contextlib.asynccontextmanager
+    async def async_connecting(
+        self, network: "IntexSpaNetworkLayer"
+    ) -> AsyncIterator[None]:
+        """Hold a slot while a network layer connects, and give it back on failure."""
+        await self.async_acquire(network)
+        connect_start = time.monotonic()
+        try:
+            yield
+        except BaseException:
+            self.release(network)
+            raise
+        self.connects += 1
+        self.connect_time += time.monotonic() - connect_start
+
+    def stats(self) -> dict:
+        """Return the statistics of the pool.
+
+        Returns
+        -------
+        stats : dict
+            The pool statistics, with the hit rate of requests and the mean time
+            to open a connection, in seconds
+
+        """
+        requests = self.hits + self.misses
+        return {
+            "max_connections": self.max_connections,
+            "open_connections": self.open_connections,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else None,
+            "evictions": self.evictions,
+            "connects": self.connects,
+            "mean_connect_time": (
+                self.connect_time / self.connects if self.connects else None
+            ),
+            "wait_time": self.wait_time,
+        }
@@ -0,0 +1,258 @@
+"""Load IntexSpaEmulator class."""
+
+import argparse
+import logging
+import asyncio
+import json
+import random
+
+from .intex_spa_rate_limiter import IntexSpaRateLimiter
+from .intex_spa_query import COMMAND, TYPE, checksum_as_int, checksum_as_str
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default raw status: power, filter and heater on, 34°C current and preset temperatures
+DEFAULT_RAW_STATUS = int("0x" + "FFFF110F010700220000000080808022000012", 16)
+
+FUNCTION_BITS: dict = {
+    "power": 104,
+    "filter": 105,
+    "heater": 106,
+    "jets": 107,
+    "bubbles": 108,
+    "sanitizer": 109,
+}
+
+TOGGLE_REQUESTS: dict = {COMMAND[intent]["request"]: intent for intent in FUNCTION_BITS}
+
+
+class IntexSpaEmulator:
+    """Emulate an Intex Spa wifi module.
+
+    AsyncIO TCP server speaking the Intex Spa protocol, for tests and benchmarks
+
+    Attributes
+    ----------
+    host : str
+        The address the emulator listens on
+    port : int
+        The TCP port the emulator listens on, known once started
+    raw_status : int
+        The raw integer-encoded status of the emulated spa, checksum included
+    info : dict
+        The info data of the emulated spa
+    latency : float
+        The delay before each reply, in seconds
+    drop_rate : float
+        The probability of closing the connection instead of replying
+    malformed_rate : float
+        The probability of replying with a corrupted checksum
+    max_rate : float | None
+        The rate of requests, per second, above which the emulated spa is
+        overloaded and replies with corrupted checksums
+    requests_count : int
+        The number of requests received since the emulator was created
+    malformed_count : int
+        The number of replies with a corrupted checksum
+
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        raw_status: int = DEFAULT_RAW_STATUS,
+        latency: float = 0,
+        drop_rate: float = 0,
+        malformed_rate: float = 0,
+        seed: int = None,
+        max_rate: float = None,
+        max_burst: int = 1,
+    ):
+        """Initialize IntexSpaEmulator class.
+
+        Parameters
+        ----------
+        host : str, default = "127.0.0.1"
+            The address the emulator listens on
+        port : int, default = 0
+            The TCP port the emulator listens on, 0 to pick a free port
+        raw_status : int, optional
+            The initial raw integer-encoded status of the emulated spa
+        latency : float, default = 0
+            The delay before each reply, in seconds
+        drop_rate : float, default = 0
+            The probability of closing the connection instead of replying
+        malformed_rate : float, default = 0
+            The probability of replying with a corrupted checksum
+        seed : int, optional
+            The seed of the random generator deciding drops and malformed replies
+        max_rate : float, optional
+            The rate of requests, per second, above which the emulated spa is
+            overloaded and replies with corrupted checksums. By default, unlimited.
+        max_burst : int, default = 1
+            The number of back-to-back requests the emulated spa can handle
+
+        """
+        self.host = host
+        self.port = port
+        self.raw_status = raw_status
+        self.info = {"ip": host, "uid": f"emulator-{id(self):x}", "dtype": "spa"}
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.malformed_rate = malformed_rate
+        self.max_rate = max_rate
+        self.requests_count = 0
+        self.malformed_count = 0
+
+        self._capacity = (
+            IntexSpaRateLimiter(max_rate, max_burst) if max_rate is not None else None
+        )
+
+        self._random = random.Random(seed)
+        self._server: asyncio.Server = None
+
+    async def async_start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._async_handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        _LOGGER.debug("Spa emulator listening on %s:%s", self.host, self.port)
+
+    async def async_stop(self) -> None:
+        """Stop listening and close the server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "IntexSpaEmulator":
+        """Start the emulator as an async context manager."""
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the emulator as an async context manager."""
+        await self.async_stop()
+
+    def _status_frame(self, malformed: bool = False) -> str:
+        """Return the current status as a hex frame, with its checksum."""
+        data = f"{self.raw_status >> 8:036X}"
+        checksum = checksum_as_int(data)
+        if malformed:
+            checksum = checksum % 0xFF + 1
+        return data + f"{checksum:02X}"
+
+    def _apply(self, request: str) -> None:
+        """Apply the request data, checksum excluded, to the emulated spa."""
+        if request in TOGGLE_REQUESTS:
+            self.raw_status ^= 1 << FUNCTION_BITS[TOGGLE_REQUESTS[request]]
+        elif request.startswith(COMMAND["preset_temp"]["request"]):
+            preset_temp = int(request[len(COMMAND["preset_temp"]["request"]) :], 16)
+            self.raw_status = (self.raw_status & ~(0xFF << 24)) | (preset_temp << 24)
+        elif request != COMMAND["status"]["request"]:
+            raise ValueError(f"Unknown request data: {request}")
+
+    def _reply(self, request: dict) -> bytes:
+        """Return the reply to the given request, as bytes."""
+        malformed = self._random.random() < self.malformed_rate
+        if self._capacity is not None and not self._capacity.try_acquire():
+            _LOGGER.debug("Spa emulator overloaded")
+            malformed = True
+
+        if request["type"] == TYPE["info"]:
+            response = {
+                "sid": request["sid"],
+                "data": json.dumps(self.info),
+                "result": "ok",
+                "type": TYPE["info"],
+            }
+        else:
+            data = request["data"]
+            if checksum_as_str(data[:-2]).zfill(2) != data[-2:]:
+                raise ValueError(f"Invalid request checksum: {data}")
+            self._apply(data[:-2])
+            if malformed:
+                self.malformed_count += 1
+            response = {
+                "sid": request["sid"],
+                "data": self._status_frame(malformed),
+                "result": "ok",
+                "type": TYPE["status"],
+            }
+
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+    async def _async_handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection until it is closed."""
+        decoder = json.JSONDecoder()
+        buffer = ""
+        try:
+            while data := await reader.read(4096):
+                buffer += data.decode()
+                # Requests are not newline-terminated: split concatenated JSON objects
+                while buffer := buffer.lstrip():
+                    try:
+                        request, end = decoder.raw_decode(buffer)
+                    except json.JSONDecodeError:
+                        # Wait for the rest of the request
+                        break
+                    buffer = buffer[end:]
+                    self.requests_count += 1
+
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    if self._random.random() < self.drop_rate:
+                        _LOGGER.debug("Spa emulator dropping the connection")
+                        return
+                    try:
+                        writer.write(self._reply(request))
+                    except (KeyError, ValueError) as err:
+                        _LOGGER.info("Spa emulator ignoring request: %s", err)
+                        continue
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve one emulated spa per port until interrupted."""
+    emulators = [
+        IntexSpaEmulator(
+            args.host,
+            args.port + index if args.port else 0,
+            latency=args.latency,
+            drop_rate=args.drop_rate,
+            malformed_rate=args.malformed_rate,
+            max_rate=args.max_rate,
+        )
+        for index in range(args.count)
+    ]
+    for emulator in emulators:
+        await emulator.async_start()
+    _LOGGER.info(
+        "%s spa emulator(s) listening on %s, ports %s-%s",
+        len(emulators),
+        args.host,
+        emulators[0].port,
+        emulators[-1].port,
+    )
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Emulate Intex Spa wifi modules")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8990)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--drop-rate", type=float, default=0)
+    parser.add_argument("--malformed-rate", type=float, default=0)
+    parser.add_argument("--max-rate", type=float, default=None)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_async_main(parser.parse_args()))
@@ -5,5 +5,21 @@ class IntexSpaUnreachableException(Exception):
     """Exception raised when spa is unreachable."""
 
 
+class IntexSpaTimeoutException(IntexSpaUnreachableException):
+    """Exception raised when spa does not answer within the intent deadline."""
+
+
 class IntexSpaDnsException(Exception):
     """Exception raised when DNS address cannot be resolved."""
+
+
+class IntexSpaMalformedResponseException(AssertionError):
+    """Exception raised when spa response cannot be rendered."""
+
+
+class IntexSpaChecksumException(IntexSpaMalformedResponseException):
+    """Exception raised when spa response checksum is invalid."""
+
+
+class IntexSpaPreemptedException(Exception):
+    """Exception raised when a queued spa query is cancelled for other work."""
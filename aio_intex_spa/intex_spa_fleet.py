@@ -0,0 +1,130 @@
+"""Load IntexSpaFleet class."""
+
+import logging
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+
+from .intex_spa import IntexSpa
+from .intex_spa_object_status import IntexSpaStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaFleet:
+    """Manage a fleet of Intex Spas.
+
+    AsyncIO-enabled class to run queries across many IntexSpa instances on one event loop,
+    with a global in-flight limit and a per-spa deadline
+
+    Attributes
+    ----------
+    spas : dict[str, IntexSpa]
+      The IntexSpa objects of the fleet, by name
+    max_concurrency : int
+      The maximum number of spas queried at the same time
+    timeout : float
+      The deadline of one spa conversation, in seconds
+
+    """
+
+    def __init__(
+        self,
+        spas: dict[str, IntexSpa] = None,
+        max_concurrency: int = 32,
+        timeout: float = 10.0,
+    ):
+        """Initialize IntexSpaFleet object instance.
+
+        Parameters
+        ----------
+        spas : dict[str, IntexSpa], optional
+          The IntexSpa objects of the fleet, by name
+        max_concurrency : int, default = 32
+          The maximum number of spas queried at the same time
+        timeout : float, default = 10.0
+          The deadline of one spa conversation, in seconds,
+          not counting the time spent waiting for a free slot
+
+        """
+        self.spas: dict[str, IntexSpa] = dict(spas or {})
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def add(self, name: str, spa: IntexSpa) -> None:
+        """Add a spa to the fleet."""
+        self.spas[name] = spa
+
+    def remove(self, name: str) -> IntexSpa:
+        """Remove a spa from the fleet, and return it."""
+        return self.spas.pop(name)
+
+    async def _async_update_one(
+        self, name: str, spa: IntexSpa
+    ) -> tuple[str, IntexSpaStatus | Exception]:
+        """Update the status of one spa, within the fleet limits.
+
+        Exceptions are returned, not raised, so that a failing spa
+        never interrupts the rest of the sweep.
+        """
+        async with self._semaphore:
+            try:
+                async with asyncio.timeout(self.timeout):
+                    return name, await spa.async_update_status()
+            except TimeoutError as err:
+                _LOGGER.info("'%s' spa: deadline exceeded during fleet update", name)
+                return name, err
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.info("'%s' spa: %r during fleet update", name, err)
+                return name, err
+
+    async def async_iter_update_status(
+        self, names: Iterable[str] = None
+    ) -> AsyncIterator[tuple[str, IntexSpaStatus | Exception]]:
+        """Update the status of the spas, yielding each result as soon as it is known.
+
+        Parameters
+        ----------
+        names : Iterable[str], optional
+          The names of the spas to update, all spas by default
+
+        Yields
+        ------
+        name, result : tuple[str, IntexSpaStatus | Exception]
+          The name of the spa, and either its updated status or the exception raised
+
+        """
+        if names is None:
+            names = list(self.spas)
+
+        tasks = [
+            asyncio.create_task(self._async_update_one(name, self.spas[name]))
+            for name in names
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer may stop iterating early
+            for task in tasks:
+                task.cancel()
+
+    async def async_update_status(
+        self, names: Iterable[str] = None
+    ) -> dict[str, IntexSpaStatus | Exception]:
+        """Update the status of the spas.
+
+        Parameters
+        ----------
+        names : Iterable[str], optional
+          The names of the spas to update, all spas by default
+
+        Returns
+        -------
+        results : dict[str, IntexSpaStatus | Exception]
+          Either the updated status or the exception raised, by spa name
+
+        """
+        return {
+            name: result async for name, result in self.async_iter_update_status(names)
+        }
@@ -0,0 +1,256 @@
+"""Load IntexSpaHistory and IntexSpaHistoryWindow classes."""
+
+import logging
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .intex_spa_object_status import IntexSpaStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bits of the functions bitfield, by function
+FUNCTION_MASKS: dict = {
+    "power": 0b1,
+    "filter": 0b10,
+    "heater": 0b100,
+    "jets": 0b1000,
+    "bubbles": 0b10000,
+    "sanitizer": 0b100000,
+}
+
+# Typecodes of the history arrays, by field
+_TYPECODES: dict = {
+    "timestamps": "I",
+    "current_temps": "B",
+    "preset_temps": "B",
+    "functions": "B",
+    "error_codes": "B",
+}
+
+
+class IntexSpaHistoryWindow:
+    """Hold a window of a spa status history, without copying it.
+
+    Attributes
+    ----------
+    base_time : float | None
+        The time the timestamps count from, in seconds since the epoch
+    timestamps : memoryview
+        The times of the samples, in whole seconds since `base_time`
+    current_temps : memoryview
+        The current temperatures of the water, 0 on error
+    preset_temps : memoryview
+        The preset temperatures of the water
+    functions : memoryview
+        The states of the functions, as bitfields of `FUNCTION_MASKS`
+    error_codes : memoryview
+        The error codes of the spa (81 for E81, ...), 0 if none
+
+    """
+
+    __slots__ = ("base_time", *_TYPECODES)
+
+    def __init__(self, base_time: float | None, *views: memoryview):
+        """Initialize IntexSpaHistoryWindow class.
+
+        Parameters
+        ----------
+        base_time : float | None
+            The time the timestamps count from, in seconds since the epoch
+        *views : memoryview
+            The views of the window, in `timestamps`, `current_temps`,
+            `preset_temps`, `functions` and `error_codes` order
+
+        """
+        self.base_time = base_time
+        for name, view in zip(_TYPECODES, views):
+            setattr(self, name, view)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self.timestamps)
+
+
+class IntexSpaHistory:
+    """Hold a rolling history of the status of a spa.
+
+    Fixed-capacity ring buffer of compact typed arrays: a sample takes 8 bytes,
+    instead of hundreds for a status object, its time being stored to the second
+    as an offset from `base_time`. Each sample is written twice, at its index and
+    `capacity` samples later, so that any window of the ring is one contiguous
+    slice of the arrays, and can be viewed without copy: 16 bytes in all.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of samples kept, the oldest being overwritten
+    base_time : float | None
+        The time of the first sample appended, in seconds since the epoch,
+        None until then
+
+    """
+
+    def __init__(self, capacity: int = 8640):
+        """Initialize IntexSpaHistory class.
+
+        Parameters
+        ----------
+        capacity : int, default = 8640
+            The maximum number of samples kept (i.e.: a day of samples every 10s)
+
+        """
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+        self.capacity = capacity
+        self.base_time: float | None = None
+        self._arrays = tuple(
+            array(typecode, bytes(2 * capacity * array(typecode).itemsize))
+            for typecode in _TYPECODES.values()
+        )
+        self._next = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples kept."""
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the history arrays, in bytes."""
+        return sum(len(values) * values.itemsize for values in self._arrays)
+
+    def append(self, status: IntexSpaStatus, timestamp: float = None) -> None:
+        """Add a status sample to the history, in O(1).
+
+        Samples must be appended in chronological order. Unknown statuses are
+        skipped.
+
+        Parameters
+        ----------
+        status : IntexSpaStatus
+            The status of the spa
+        timestamp : float, optional
+            The time of the status, in seconds since the epoch, now by default
+
+        """
+        raw_status = getattr(status, "_raw_status", None)
+        if raw_status is None:
+            return
+
+        if timestamp is None:
+            timestamp = time.time()
+        if self.base_time is None:
+            self.base_time = timestamp
+
+        raw_current_temp = (raw_status >> 88) & 0xFF
+        sample = (
+            max(round(timestamp - self.base_time), 0),
+            # As in decode_raw_status, values from 181 encode errors (E81, ...)
+            raw_current_temp if raw_current_temp < 181 else 0,
+            (raw_status >> 24) & 0xFF,
+            (raw_status >> 104) & 0b111111,
+            raw_current_temp - 100 if raw_current_temp >= 181 else 0,
+        )
+        index = self._next
+        for values, value in zip(self._arrays, sample):
+            values[index] = values[index + self.capacity] = value
+
+        self._next = (index + 1) % self.capacity
+        self._length = min(self._length + 1, self.capacity)
+
+    def window(
+        self, start_time: float = None, end_time: float = None
+    ) -> IntexSpaHistoryWindow:
+        """Return the samples between two times, without copying them.
+
+        Parameters
+        ----------
+        start_time : float, optional
+            The time of the first sample, in seconds since the epoch,
+            the oldest sample by default
+        end_time : float, optional
+            The time of the last sample, in seconds since the epoch,
+            the newest sample by default
+
+        Returns
+        -------
+        window : IntexSpaHistoryWindow
+            The views of the samples, valid until the next `capacity` appends
+
+        """
+        start = (self._next - self._length) % self.capacity
+        stop = start + self._length
+        timestamps = memoryview(self._arrays[0])
+        if start_time is not None and self._length:
+            start = bisect_left(timestamps, start_time - self.base_time, start, stop)
+        if end_time is not None and self._length:
+            stop = bisect_right(timestamps, end_time - self.base_time, start, stop)
+        return IntexSpaHistoryWindow(
+            self.base_time,
+            *(memoryview(values)[start:stop] for values in self._arrays),
+        )
+
+    def downsample(
+        self,
+        field: str,
+        bucket_duration: float,
+        start_time: float = None,
+        end_time: float = None,
+    ) -> list[tuple[float, int, int, float]]:
+        """Aggregate the temperatures into buckets of time, for charts.
+
+        Samples on error are skipped for the current temperature, which they
+        do not hold.
+
+        Parameters
+        ----------
+        field : str
+            The temperature to aggregate: "current_temp" or "preset_temp"
+        bucket_duration : float
+            The duration of each bucket, in seconds
+        start_time : float, optional
+            The time of the first bucket, in seconds since the epoch,
+            the oldest sample by default
+        end_time : float, optional
+            The time of the last sample, in seconds since the epoch,
+            the newest sample by default
+
+        Returns
+        -------
+        buckets : list[tuple[float, int, int, float]]
+            The start time, minimum, maximum and mean of each non-empty bucket
+
+        """
+        if field not in ("current_temp", "preset_temp"):
+            raise ValueError(f"Unknown temperature field: {field}")
+        window = self.window(start_time, end_time)
+        if not len(window):
+            return []
+        values = getattr(window, field + "s")
+        skip_errors = field == "current_temp"
+        origin = window.base_time + window.timestamps[0]
+        if start_time is not None:
+            origin = start_time
+
+        buckets = []
+        bucket = None
+        for offset, value, error_code in zip(
+            window.timestamps, values, window.error_codes
+        ):
+            if error_code and skip_errors:
+                continue
+            index = int((window.base_time + offset - origin) // bucket_duration)
+            if bucket is None or index != bucket[0]:
+                bucket = [index, value, value, 0, 0]
+                buckets.append(bucket)
+            elif value < bucket[1]:
+                bucket[1] = value
+            elif value > bucket[2]:
+                bucket[2] = value
+            bucket[3] += value
+            bucket[4] += 1
+        return [
+            (origin + index * bucket_duration, minimum, maximum, total / count)
+            for index, minimum, maximum, total, count in buckets
+        ]
@@ -0,0 +1,286 @@
+"""Load IntexSpaHistoryFile and IntexSpaHistoryReader classes."""
+
+import logging
+import mmap
+import struct
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from pathlib import Path
+
+from .intex_spa import IntexSpa
+from .intex_spa_object_status import IntexSpaStatus, IntexSpaStatusSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# File header: format name and version
+MAGIC = b"INTEXSH\x01"
+
+# Size of the raw status frame received from the spa, checksum included
+FRAME_SIZE = 19
+
+# Record: timestamp in seconds since the epoch, then the raw status frame
+_RECORD = struct.Struct(f"<d{FRAME_SIZE}s")
+RECORD_SIZE = _RECORD.size
+
+_TIMESTAMP = struct.Struct("<d")
+
+# Frame of the records of unknown statuses, e.g. while the spa is unreachable:
+# never received from a spa, whose frames start with a 0xFF header
+UNKNOWN_FRAME = bytes(FRAME_SIZE)
+
+
+class IntexSpaHistoryFile:
+    """Append the statuses of a spa to a binary history file.
+
+    The file holds a header, then fixed-size records of 27 bytes: the timestamp
+    as a little-endian double, and the raw status frame as received from the spa,
+    or `UNKNOWN_FRAME` once the status is unknown. Records must be appended in
+    chronological order.
+
+    Attributes
+    ----------
+    path : Path
+        The path of the history file
+
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize IntexSpaHistoryFile class.
+
+        The file is created if needed, and opened for appending.
+
+        Parameters
+        ----------
+        path : str | Path
+            The path of the history file, one per spa
+
+        """
+        self.path = Path(path)
+        if self.path.exists() and self.path.stat().st_size:
+            # Leave other files untouched
+            _check_header(self.path)
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+        else:
+            # Drop a record partially written before a crash
+            records_size = (self._file.tell() - len(MAGIC)) // RECORD_SIZE * RECORD_SIZE
+            self._file.truncate(len(MAGIC) + records_size)
+
+    def append(self, status: IntexSpaStatus, timestamp: float = None) -> None:
+        """Append a status record to the file.
+
+        Unknown statuses are recorded as `UNKNOWN_FRAME`, so that the last known
+        status is not taken for the status of the spa while it is unreachable.
+
+        Parameters
+        ----------
+        status : IntexSpaStatus
+            The status of the spa, its raw status frame already validated
+        timestamp : float, optional
+            The time of the status, in seconds since the epoch, now by default
+
+        """
+        raw_status = getattr(status, "_raw_status", None)
+        self._file.write(
+            _RECORD.pack(
+                time.time() if timestamp is None else timestamp,
+                UNKNOWN_FRAME
+                if raw_status is None
+                else raw_status.to_bytes(FRAME_SIZE, "big"),
+            )
+        )
+
+    async def async_record(self, spa: IntexSpa) -> None:
+        """Append every change of the spa status to the file, until cancelled."""
+        changes = spa.changes()
+        try:
+            async for change in changes:
+                self.append(change.status)
+                self.flush()
+        finally:
+            changes.close()
+
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "IntexSpaHistoryFile":
+        """Return the history file, for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the history file."""
+        self.close()
+
+
+class IntexSpaHistoryRange:
+    """Hold a range of records of a history file, decoded on access.
+
+    Items are `(timestamp, status)` tuples, the status being an
+    IntexSpaStatusSnapshot, unknown for `UNKNOWN_FRAME` records.
+    """
+
+    __slots__ = ("_buffer", "_start", "_stop")
+
+    def __init__(self, buffer: mmap.mmap, start: int, stop: int):
+        """Initialize IntexSpaHistoryRange class.
+
+        Parameters
+        ----------
+        buffer : mmap.mmap
+            The memory-mapped history file
+        start : int
+            The index of the first record of the range
+        stop : int
+            The index after the last record of the range
+
+        """
+        self._buffer = buffer
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        """Return the number of records in the range."""
+        return self._stop - self._start
+
+    def __getitem__(self, index: int) -> tuple[float, IntexSpaStatusSnapshot]:
+        """Decode the record at `index` in the range."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history range index out of range")
+        timestamp, frame = _RECORD.unpack_from(
+            self._buffer, len(MAGIC) + (self._start + index) * RECORD_SIZE
+        )
+        return timestamp, _decode_frame(frame)
+
+    def __iter__(self) -> Iterator[tuple[float, IntexSpaStatusSnapshot]]:
+        """Decode the records of the range, in order."""
+        for offset in range(
+            len(MAGIC) + self._start * RECORD_SIZE,
+            len(MAGIC) + self._stop * RECORD_SIZE,
+            RECORD_SIZE,
+        ):
+            timestamp, frame = _RECORD.unpack_from(self._buffer, offset)
+            yield timestamp, _decode_frame(frame)
+
+
+class _Timestamps:
+    """Expose the timestamps of the records of a history file, for bisection."""
+
+    __slots__ = ("_buffer", "_length")
+
+    def __init__(self, buffer: mmap.mmap, length: int):
+        """Initialize _Timestamps class."""
+        self._buffer = buffer
+        self._length = length
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return self._length
+
+    def __getitem__(self, index: int) -> float:
+        """Return the timestamp of the record at `index`."""
+        return _TIMESTAMP.unpack_from(self._buffer, len(MAGIC) + index * RECORD_SIZE)[0]
+
+
+class IntexSpaHistoryReader:
+    """Read a binary history file through a memory map.
+
+    The records written up to the opening of the reader are mapped: range
+    queries bisect their timestamps, and decode the records on access only.
+
+    Attributes
+    ----------
+    path : Path
+        The path of the history file
+
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize IntexSpaHistoryReader class.
+
+        Parameters
+        ----------
+        path : str | Path
+            The path of the history file
+
+        """
+        self.path = Path(path)
+        _check_header(self.path)
+        self._buffer: mmap.mmap | None = None
+        self._length = 0
+        with open(self.path, "rb") as file:
+            size = file.seek(0, 2)
+            self._length = (size - len(MAGIC)) // RECORD_SIZE
+            if self._length:
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        """Return the number of records mapped."""
+        return self._length
+
+    def range(
+        self, start_time: float = None, end_time: float = None
+    ) -> IntexSpaHistoryRange:
+        """Return the records between two times, decoded on access.
+
+        Parameters
+        ----------
+        start_time : float, optional
+            The time of the first record, in seconds since the epoch,
+            the oldest record by default
+        end_time : float, optional
+            The time of the last record, in seconds since the epoch,
+            the newest record by default
+
+        Returns
+        -------
+        records : IntexSpaHistoryRange
+            The `(timestamp, status)` records of the range
+
+        """
+        start, stop = 0, self._length
+        if self._buffer is not None:
+            timestamps = _Timestamps(self._buffer, self._length)
+            if start_time is not None:
+                start = bisect_left(timestamps, start_time)
+            if end_time is not None:
+                stop = bisect_right(timestamps, end_time, start)
+        return IntexSpaHistoryRange(self._buffer, start, max(start, stop))
+
+    def close(self) -> None:
+        """Unmap the history file."""
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+        self._length = 0
+
+    def __enter__(self) -> "IntexSpaHistoryReader":
+        """Return the reader, for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Unmap the history file."""
+        self.close()
+
+
+def _check_header(path: Path) -> None:
+    """Raise ValueError if the file is not a spa history file."""
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a spa history file: {path}")
+
+
+def _decode_frame(frame: bytes) -> IntexSpaStatusSnapshot:
+    """Return the status of a record frame, unknown for `UNKNOWN_FRAME`."""
+    if frame == UNKNOWN_FRAME:
+        return IntexSpaStatusSnapshot()
+    return IntexSpaStatusSnapshot(int.from_bytes(frame, "big"))
@@ -0,0 +1,262 @@
+"""Load IntexSpaMetrics and IntexSpaHistogram classes."""
+
+import logging
+from bisect import bisect_left
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds of the latency buckets, in seconds
+DEFAULT_BUCKETS: tuple = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class IntexSpaHistogram:
+    """Count observed values into fixed buckets.
+
+    Attributes
+    ----------
+    buckets : tuple
+        The upper bounds of the buckets, in increasing order
+    counts : list[int]
+        The number of values by bucket, the last bucket for values above all bounds
+    sum : float
+        The sum of the observed values
+    count : int
+        The number of observed values
+
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        """Initialize IntexSpaHistogram class.
+
+        Parameters
+        ----------
+        buckets : tuple, default = DEFAULT_BUCKETS
+            The upper bounds of the buckets, in increasing order
+
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Count a value into its bucket."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        """Return the number of values lower than or equal to each bucket bound."""
+        cumulative_counts = []
+        total = 0
+        for count in self.counts:
+            total += count
+            cumulative_counts.append(total)
+        return cumulative_counts
+
+    def as_dict(self) -> dict:
+        """Return the histogram as dict."""
+        return {
+            "buckets": dict(
+                zip((*self.buckets, float("inf")), self.cumulative_counts())
+            ),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+def _format_labels(labels: dict) -> str:
+    """Format labels for the Prometheus text format."""
+    if not labels:
+        return ""
+    formatted_labels = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+    return "{" + formatted_labels + "}"
+
+
+class IntexSpaMetrics:
+    """Collect the metrics of the conversations with one spa, or more.
+
+    A metrics object can be shared by several IntexSpa instances, to aggregate
+    their metrics.
+
+    Attributes
+    ----------
+    labels : dict
+        The labels added to every metric in the Prometheus text format
+    latencies : dict[tuple[str, str], IntexSpaHistogram]
+        The latency histograms by intent and phase: "semaphore_wait", "send",
+        "receive" and "parse", in seconds
+    retries : dict[str, int]
+        The number of failed query attempts, by exception class
+    malformed_responses : int
+        The number of malformed spa responses
+    connects : int
+        The number of connections opened to the spa
+    disconnects : int
+        The number of connections closed to the spa
+    status_cache_hits : int
+        The number of status updates served from the known status
+    status_cache_misses : int
+        The number of status updates querying the spa
+    status_coalesced : int
+        The number of status updates sharing an in-flight status query
+
+    """
+
+    def __init__(self, labels: dict = None, buckets: tuple = DEFAULT_BUCKETS):
+        """Initialize IntexSpaMetrics class.
+
+        Parameters
+        ----------
+        labels : dict, optional
+            The labels added to every metric in the Prometheus text format
+            (i.e.: {"spa": "garden"})
+        buckets : tuple, default = DEFAULT_BUCKETS
+            The upper bounds of the latency buckets, in seconds
+
+        """
+        self.labels = dict(labels or {})
+        self.buckets = buckets
+        self.latencies: dict[tuple[str, str], IntexSpaHistogram] = {}
+        self.retries: dict[str, int] = {}
+        self.malformed_responses = 0
+        self.connects = 0
+        self.disconnects = 0
+        self.status_cache_hits = 0
+        self.status_cache_misses = 0
+        self.status_coalesced = 0
+
+    def observe_latency(self, intent: str, phase: str, duration: float) -> None:
+        """Record the duration of a phase of an intent, in seconds."""
+        histogram = self.latencies.get((intent, phase))
+        if histogram is None:
+            histogram = self.latencies[intent, phase] = IntexSpaHistogram(self.buckets)
+        histogram.observe(duration)
+
+    def record_retry(self, error: Exception) -> None:
+        """Record a failed query attempt."""
+        name = type(error).__name__
+        self.retries[name] = self.retries.get(name, 0) + 1
+        if isinstance(error, AssertionError):
+            self.malformed_responses += 1
+
+    @property
+    def status_cache_hit_ratio(self) -> float | None:
+        """Ratio of status updates served without a query of their own."""
+        hits = self.status_cache_hits + self.status_coalesced
+        total = hits + self.status_cache_misses
+        return hits / total if total else None
+
+    def as_dict(self) -> dict:
+        """Return a snapshot of the metrics, as dict.
+
+        Returns
+        -------
+        metrics : dict
+            The metrics, latencies by intent then phase
+
+        """
+        latencies: dict[str, dict] = {}
+        for (intent, phase), histogram in self.latencies.items():
+            latencies.setdefault(intent, {})[phase] = histogram.as_dict()
+        return {
+            "labels": dict(self.labels),
+            "latencies": latencies,
+            "retries": dict(self.retries),
+            "malformed_responses": self.malformed_responses,
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "status_cache_hits": self.status_cache_hits,
+            "status_cache_misses": self.status_cache_misses,
+            "status_coalesced": self.status_coalesced,
+            "status_cache_hit_ratio": self.status_cache_hit_ratio,
+        }
+
+    def as_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        metrics : str
+            The metrics, one sample per line
+
+        """
+        lines = [
+            "# HELP intex_spa_latency_seconds Latency of the spa intents, by phase.",
+            "# TYPE intex_spa_latency_seconds histogram",
+        ]
+        for (intent, phase), histogram in sorted(
+            self.latencies.items(), key=lambda item: tuple(map(str, item[0]))
+        ):
+            labels = {**self.labels, "intent": intent, "phase": phase}
+            for bound, count in zip(
+                (*histogram.buckets, "+Inf"), histogram.cumulative_counts()
+            ):
+                bucket_labels = _format_labels({**labels, "le": bound})
+                lines.append(f"intex_spa_latency_seconds_bucket{bucket_labels} {count}")
+            lines.append(
+                f"intex_spa_latency_seconds_sum{_format_labels(labels)} {histogram.sum}"
+            )
+            lines.append(
+                f"intex_spa_latency_seconds_count{_format_labels(labels)}"
+                f" {histogram.count}"
+            )
+
+        lines += [
+            "# HELP intex_spa_retries_total Failed spa queries, by exception class.",
+            "# TYPE intex_spa_retries_total counter",
+        ]
+        for error, count in sorted(self.retries.items()):
+            labels = _format_labels({**self.labels, "error": error})
+            lines.append(f"intex_spa_retries_total{labels} {count}")
+
+        labels = _format_labels(self.labels)
+        for name, description, value in (
+            (
+                "malformed_responses",
+                "Malformed spa responses.",
+                self.malformed_responses,
+            ),
+            ("connects", "Connections opened to the spa.", self.connects),
+            ("disconnects", "Connections closed to the spa.", self.disconnects),
+            (
+                "status_cache_hits",
+                "Status updates served from the known status.",
+                self.status_cache_hits,
+            ),
+            (
+                "status_cache_misses",
+                "Status updates querying the spa.",
+                self.status_cache_misses,
+            ),
+            (
+                "status_coalesced",
+                "Status updates sharing an in-flight status query.",
+                self.status_coalesced,
+            ),
+        ):
+            lines += [
+                f"# HELP intex_spa_{name}_total {description}",
+                f"# TYPE intex_spa_{name}_total counter",
+                f"intex_spa_{name}_total{labels} {value}",
+            ]
+        return "\n".join(lines) + "\n"
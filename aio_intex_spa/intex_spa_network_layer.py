@@ -2,12 +2,36 @@
 
 import logging
 import asyncio
+import contextlib
+import json
 import socket
+import time
 
+from .intex_spa_connection_pool import IntexSpaConnectionPool
 from .intex_spa_exceptions import IntexSpaDnsException
+from .intex_spa_metrics import IntexSpaMetrics
+from .intex_spa_resolver import DEFAULT_RESOLVER, IntexSpaResolver
+from .intex_spa_tracing import IntexSpaTracer, start_span
 
 _LOGGER = logging.getLogger(__name__)
 
+_SID_PREFIX = b'"sid":"'
+
+
+def response_sid(response_as_bytes: bytes) -> str | None:
+    """Return the sid of a raw spa response, or None if it has none."""
+    start = response_as_bytes.find(_SID_PREFIX)
+    if start != -1:
+        start += len(_SID_PREFIX)
+        end = response_as_bytes.find(b'"', start)
+        if end != -1:
+            return response_as_bytes[start:end].decode()
+    # Not in the compact form sent by the spa: fall back to JSON decoding
+    try:
+        return str(json.loads(response_as_bytes)["sid"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
 
 class IntexSpaNetworkLayer:
     """Manage Network-layer communications.
@@ -24,10 +48,43 @@ class IntexSpaNetworkLayer:
         The StreamReader connected to the spa
     writer : asyncio.StreamWriter
         The StreamWriter connected to the spa
+    max_in_flight : int
+        The maximum number of requests awaiting their response at the same time
+    pipelined : bool
+        Whether responses are dispatched to their requests by sid,
+        allowing more than one request in flight
+    connect_timeout : float | None
+        The timeout of a connection attempt to the spa, in seconds
+    send_timeout : float | None
+        The timeout of sending one request to the spa, in seconds
+    receive_timeout : float | None
+        The timeout of receiving one response from the spa, in seconds
+    resolver : IntexSpaResolver
+        The resolver of the spa hostname
+    pool : IntexSpaConnectionPool | None
+        The pool capping the connections open to a fleet of spas
+    metrics : IntexSpaMetrics | None
+        The metrics of the conversations with the spa
+    tracer : IntexSpaTracer | opentelemetry.trace.Tracer | None
+        The tracer of the conversations with the spa
+    last_activity : float | None
+        The monotonic time of the last connection or request to the spa
 
     """
 
-    def __init__(self, address: str, port: str):
+    def __init__(
+        self,
+        address: str,
+        port: str,
+        max_in_flight: int = 1,
+        connect_timeout: float = 10.0,
+        send_timeout: float = 10.0,
+        receive_timeout: float = 10.0,
+        resolver: IntexSpaResolver = None,
+        pool: IntexSpaConnectionPool = None,
+        metrics: IntexSpaMetrics = None,
+        tracer: IntexSpaTracer = None,
+    ):
         """Initialize IntexSpaNetworkLayer class.
 
         Parameters
@@ -36,25 +93,105 @@ class IntexSpaNetworkLayer:
             The fqdn or IP of the intex spa wifi module
         port : str
             The TCP service port of the intex spa wifi module
+        max_in_flight : int, default = 1
+            The maximum number of requests awaiting their response at the same time.
+            Above 1, a background reader task dispatches responses to requests by sid.
+        connect_timeout : float, default = 10.0
+            The timeout of a connection attempt to the spa, in seconds
+        send_timeout : float, default = 10.0
+            The timeout of sending one request to the spa, in seconds
+        receive_timeout : float, default = 10.0
+            The timeout of receiving one response from the spa, in seconds
+        resolver : IntexSpaResolver, optional
+            The resolver of the spa hostname, shared by all spas by default
+        pool : IntexSpaConnectionPool, optional
+            The pool capping the connections open to a fleet of spas.
+            By default, the connection is not capped.
+        metrics : IntexSpaMetrics, optional
+            The metrics of the conversations with the spa. By default, no metrics
+            are collected.
+        tracer : IntexSpaTracer | opentelemetry.trace.Tracer, optional
+            The tracer of the conversations with the spa. By default, no spans
+            are emitted.
 
         """
         self.address = address
         self.port = port
+        self.max_in_flight = max_in_flight
+        self.pipelined = max_in_flight > 1
+        self.connect_timeout = connect_timeout
+        self.send_timeout = send_timeout
+        self.receive_timeout = receive_timeout
+        self.resolver = resolver or DEFAULT_RESOLVER
+        self.pool = pool
+        self.metrics = metrics
+        self.tracer = tracer
 
         self.reader: asyncio.StreamReader = None
         self.writer: asyncio.StreamWriter = None
 
+        self._connect_lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._pending: dict[str, asyncio.Future] = {}
+        self._reader_task: asyncio.Task = None
+
+        self.last_activity: float = None
+        self._active_requests = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the connection to the spa is open, as far as known."""
+        return (
+            self.writer is not None
+            and self.reader is not None
+            and not self.writer.is_closing()
+            and not self.reader.at_eof()
+        )
+
+    @property
+    def idle_time(self) -> float:
+        """Time since the last activity on the connection, in seconds.
+
+        Zero while a request is in progress, or if the spa was never connected.
+        """
+        if self._active_requests or self.last_activity is None:
+            return 0.0
+        return time.monotonic() - self.last_activity
+
+    @property
+    def busy(self) -> bool:
+        """Whether a request, or a connection attempt, is in progress."""
+        return bool(self._active_requests) or self._connect_lock.locked()
+
     async def _async_connect(self) -> None:
         """Initialize a connection to the spa."""
+        with start_span(self.tracer, "intex_spa.connect"):
+            await self._async_connect_traced()
+
+    async def _async_connect_traced(self) -> None:
+        """Initialize a connection to the spa, within its span."""
         _LOGGER.debug(
             "Opening TCP connection with the spa at %s:%s with asyncio...",
             self.address,
             self.port,
         )
+        pool_slot = (
+            self.pool.async_connecting(self)
+            if self.pool is not None
+            else contextlib.nullcontext()
+        )
         try:
-            self.reader, self.writer = await asyncio.open_connection(
-                self.address, self.port
-            )
+            async with asyncio.timeout(self.connect_timeout), pool_slot:
+                addresses = await self.resolver.async_resolve(self.address, self.port)
+                for index, address in enumerate(addresses):
+                    try:
+                        await self._async_open_connection(address)
+                        break
+                    except OSError:
+                        if index == len(addresses) - 1:
+                            # The spa may have moved: resolve it again next time
+                            self.resolver.forget(self.address)
+                            raise
 
         except socket.gaierror as err:
             if err.args[0] == socket.EAI_NONAME:
@@ -64,16 +201,32 @@ class IntexSpaNetworkLayer:
             else:
                 raise socket.gaierror(err) from err
 
+        self.last_activity = time.monotonic()
+        if self.metrics is not None:
+            self.metrics.connects += 1
         _LOGGER.info(
             "TCP connection established with the spa",
         )
 
+    async def _async_open_connection(self, address: str) -> None:
+        """Open the TCP connection to the spa, at the given IP address."""
+        self.reader, self.writer = await asyncio.open_connection(address, self.port)
+        if self.pipelined:
+            self._reader_task = asyncio.create_task(self._async_dispatch(self.reader))
+
     async def _async_disconnect(self) -> None:
         """Close the connection to the spa."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        self._fail_pending(ConnectionResetError("Connection to the spa closed"))
+
         # If there is a writer to send a disconnect message
         try:
             _LOGGER.debug("Closing previous TCP connection to the spa with asyncio...")
             self.writer.close()
+            if self.metrics is not None:
+                self.metrics.disconnects += 1
             await self.writer.wait_closed()
             _LOGGER.info("Previous TCP connection closed with the spa")
         except AttributeError:
@@ -85,27 +238,144 @@ class IntexSpaNetworkLayer:
         finally:
             self.reader = None
             self.writer = None
+            if self.pool is not None:
+                self.pool.release(self)
+
+    def _fail_pending(self, exception: Exception) -> None:
+        """Fail every request awaiting its response."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(exception)
+        self._pending.clear()
+
+    async def _async_dispatch(self, reader: asyncio.StreamReader) -> None:
+        """Dispatch the responses read from the spa to their requests, by sid."""
+        try:
+            while response_as_bytes := await reader.readline():
+                _LOGGER.debug("Receiving bytes from the spa: %s", response_as_bytes)
+                future = self._pending.pop(response_sid(response_as_bytes), None)
+                if future is None:
+                    _LOGGER.debug("Dropping spa response matching no request")
+                elif not future.done():
+                    future.set_result(response_as_bytes)
+            exception = ConnectionResetError("Connection closed by the spa")
+        except (ConnectionError, OSError, ValueError) as err:
+            exception = ConnectionResetError(f"Spa connection failure: {err!r}")
+        self._fail_pending(exception)
 
     async def async_force_disconnect(self) -> None:
         """Force reconnecting to the spa."""
         await self._async_disconnect()
 
+    async def async_connect(self) -> None:
+        """Connect, or reconnect, to the spa ahead of any request, if needed."""
+        await self._async_ensure_connected()
+
+    async def _async_ensure_connected(self) -> None:
+        """Connect, or reconnect, to the spa if needed."""
+        async with self._connect_lock:
+            if self.writer is None or self.reader is None:
+                _LOGGER.info("Not connected to the spa, trying to connect...")
+                await self._async_connect()
+            elif self.writer.is_closing() or self.reader.at_eof():
+                _LOGGER.info("Connection with the spa seems to be broken")
+                await self._async_disconnect()
+                await self._async_connect()
+
     async def async_send(self, bytes_to_write: bytes = None) -> None:
         """Send command to the spa."""
-        if self.writer is None or self.reader is None:
-            _LOGGER.info("Not connected to the spa, trying to connect...")
-            await self._async_connect()
-        elif self.writer.is_closing() or self.reader.at_eof():
-            _LOGGER.info("Connection with the spa seems to be broken")
-            await self._async_disconnect()
-            await self._async_connect()
+        await self._async_ensure_connected()
 
         _LOGGER.debug("Sending bytes to the spa: %s", bytes_to_write)
         self.writer.write(bytes_to_write)
-        await self.writer.drain()
+        async with asyncio.timeout(self.send_timeout):
+            await self.writer.drain()
 
     async def async_receive(self) -> None:
         """Receive response from the spa."""
-        response_as_bytes = await self.reader.readline()
+        async with asyncio.timeout(self.receive_timeout):
+            response_as_bytes = await self.reader.readline()
         _LOGGER.debug("Receiving bytes from the spa: %s", response_as_bytes)
+        if not response_as_bytes:
+            raise ConnectionResetError("Connection closed by the spa")
         return response_as_bytes
+
+    async def async_request(
+        self, bytes_to_write: bytes, sid: str, intent: str = None
+    ) -> bytes:
+        """Send a request to the spa, and receive its response.
+
+        Parameters
+        ----------
+        bytes_to_write : bytes
+            The full message request to send
+        sid : str
+            The sid of the request, echoed in its response
+        intent : str, optional
+            The intent of the request, labelling its metrics
+
+        Returns
+        -------
+        response_as_bytes : bytes
+            The response received from the spa
+
+        """
+        if self.pool is not None:
+            self.pool.touch(self)
+        self._active_requests += 1
+        try:
+            return await self._async_request(bytes_to_write, sid, intent)
+        finally:
+            self._active_requests -= 1
+            self.last_activity = time.monotonic()
+            if self.pool is not None:
+                self.pool.idle(self)
+
+    def _observe_latency(self, intent: str, phase: str, start: float) -> float:
+        """Record the duration of a phase since `start`, and return the time now."""
+        now = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.observe_latency(intent, phase, now - start)
+        return now
+
+    async def _async_request(
+        self, bytes_to_write: bytes, sid: str, intent: str = None
+    ) -> bytes:
+        """Send a request to the spa, and receive its response."""
+        tracer = self.tracer
+        if not self.pipelined:
+            if self.metrics is None and tracer is None:
+                await self.async_send(bytes_to_write)
+                return await self.async_receive()
+            # Keep connecting out of the send phase
+            await self._async_ensure_connected()
+            start = time.perf_counter()
+            with start_span(tracer, "intex_spa.send", intent, sid):
+                await self.async_send(bytes_to_write)
+            start = self._observe_latency(intent, "send", start)
+            with start_span(tracer, "intex_spa.receive", intent, sid):
+                response_as_bytes = await self.async_receive()
+            self._observe_latency(intent, "receive", start)
+            return response_as_bytes
+
+        async with self._in_flight:
+            await self._async_ensure_connected()
+            # Register the request before sending it, as its response can come anytime
+            future = asyncio.get_running_loop().create_future()
+            self._pending[sid] = future
+            try:
+                start = time.perf_counter()
+                with start_span(tracer, "intex_spa.send", intent, sid):
+                    _LOGGER.debug("Sending bytes to the spa: %s", bytes_to_write)
+                    self.writer.write(bytes_to_write)
+                    async with asyncio.timeout(self.send_timeout):
+                        await self.writer.drain()
+                start = self._observe_latency(intent, "send", start)
+                with start_span(tracer, "intex_spa.receive", intent, sid):
+                    async with asyncio.timeout(self.receive_timeout):
+                        response_as_bytes = await future
+                self._observe_latency(intent, "receive", start)
+                return response_as_bytes
+            finally:
+                if self._pending.get(sid) is future:
+                    del self._pending[sid]
@@ -4,97 +4,151 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+STATUS_FIELDS: tuple = (
+    "power",
+    "filter",
+    "heater",
+    "jets",
+    "bubbles",
+    "sanitizer",
+    "unit",
+    "current_temp",
+    "preset_temp",
+    "error_code",
+)
+
+# Bits of the raw status each field is decoded from
+STATUS_FIELD_MASKS: dict = {
+    "power": 1 << 104,
+    "filter": 1 << 105,
+    "heater": 1 << 106,
+    "jets": 1 << 107,
+    "bubbles": 1 << 108,
+    "sanitizer": 1 << 109,
+    "unit": 0xFF << 24,
+    "current_temp": 0xFF << 88,
+    "preset_temp": 0xFF << 24,
+    "error_code": 0xFF << 88,
+}
+
+_STATUS_MASK: int = 0
+for _mask in STATUS_FIELD_MASKS.values():
+    _STATUS_MASK |= _mask
+
+
+def decode_raw_status(raw_status: int) -> tuple:
+    """Decode every status field from the raw integer-encoded status data.
+
+    Parameters
+    ----------
+    raw_status : int
+        The raw response data received from the spa
+
+    Returns
+    -------
+    fields : tuple
+        The decoded field values, in `STATUS_FIELDS` order
+
+    """
+    functions = raw_status >> 104
+    raw_current_temp = (raw_status >> 88) & 0xFF
+    preset_temp = (raw_status >> 24) & 0xFF
+
+    # If current_temp encodes a temperature, error_code is False
+    if raw_current_temp < 181:
+        current_temp = raw_current_temp
+        error_code = False
+    # Else if current_temp encodes an error (E81, ...), current_temp is False
+    else:
+        current_temp = False
+        error_code = f"E{raw_current_temp - 100}"
+
+    return (
+        bool(functions & 0b1),
+        bool(functions & 0b10),
+        bool(functions & 0b100),
+        bool(functions & 0b1000),
+        bool(functions & 0b10000),
+        bool(functions & 0b100000),
+        "°C" if preset_temp <= 40 else "°F",
+        current_temp,
+        preset_temp,
+        error_code,
+    )
+
+
+def changed_status_fields(
+    previous: "IntexSpaStatus", status: "IntexSpaStatus"
+) -> tuple:
+    """Return the fields which differ between two statuses.
+
+    The raw status data are XOR-ed against the field masks: only the fields
+    whose bits changed are decoded and compared.
+
+    Parameters
+    ----------
+    previous : IntexSpaStatus
+        The previous status of the spa
+    status : IntexSpaStatus
+        The new status of the spa
+
+    Returns
+    -------
+    fields : tuple
+        The names of the changed fields, in `STATUS_FIELDS` order
+
+    """
+    previous_raw_status = getattr(previous, "_raw_status", None)
+    raw_status = getattr(status, "_raw_status", None)
+    if previous_raw_status is None or raw_status is None:
+        # Every field appears or disappears, unless both statuses are unknown
+        return () if previous_raw_status is raw_status else STATUS_FIELDS
+
+    diff = (previous_raw_status ^ raw_status) & _STATUS_MASK
+    if not diff:
+        return ()
+    # Fields decoded from the same bits may still be equal (i.e.: error_code
+    # when current_temp changes)
+    return tuple(
+        name
+        for name, mask in STATUS_FIELD_MASKS.items()
+        if diff & mask and getattr(previous, name) != getattr(status, name)
+    )
+
 
 class IntexSpaStatus:
     """Hold and expose the status response objects.
 
+    All fields are decoded once, when the raw status is set.
+
     Attributes
     ----------
     _raw_status : int
         The raw integer-encoded status data, as received from the spa
     power : bool
+        Power state of the spa
     filter : bool
+        State of the filter function
     heater : bool
+        State of the heater function
     jets : bool
+        State of the jets function
     bubbles : bool
+        State of the bubbles function
     sanitizer : bool
+        State of sanitizer function
     unit : str
-    current_temp : int
+        Unit of the temperature values: "°C" for Celsius, "°F" for Farenheit
+    current_temp : int | bool
+        Current temperature of the water, expressed in `unit`, or False on error
     preset_temp : int
+        Preset temperature of the water, expressed in `unit`
+    error_code : str | bool
+        Current error code of the spa (E81, ...), or False
 
     """
 
-    @property
-    def power(self) -> bool:
-        """Power state of the spa."""
-        return bool((self._raw_status >> 104) & 0b1)
-
-    @property
-    def filter(self) -> bool:
-        """State of the filter function."""
-        return bool((self._raw_status >> 105) & 0b1)
-
-    @property
-    def heater(self) -> bool:
-        """State of the heater function."""
-        return bool((self._raw_status >> 106) & 0b1)
-
-    @property
-    def jets(self) -> bool:
-        """State of the jets function."""
-        return bool((self._raw_status >> 107) & 0b1)
-
-    @property
-    def bubbles(self) -> bool:
-        """State of the bubbles function."""
-        return bool((self._raw_status >> 108) & 0b1)
-
-    @property
-    def sanitizer(self) -> bool:
-        """State of sanitizer function."""
-        return bool((self._raw_status >> 109) & 0b1)
-
-    @property
-    def unit(self) -> str:
-        """Unit of the temperature values.
-
-        * "°C" for Celsius*
-        * "°F" for Farenheit*
-        """
-        if self.preset_temp <= 40:
-            return "°C"
-        else:
-            return "°F"
-
-    @property
-    def current_temp(self) -> int | bool:
-        """Current temperature of the water, expressed in `unit`."""
-        raw_current_temp = (self._raw_status >> 88) & 0xFF
-
-        # If current_temp encodes a temperature, return the temperature
-        if raw_current_temp < 181:
-            return raw_current_temp
-        # Else if current_temp encodes an error (E81, ...), return False
-        else:
-            return False
-
-    @property
-    def error_code(self) -> int | bool:
-        """Current error code of the spa."""
-        raw_current_temp = (self._raw_status >> 88) & 0xFF
-
-        # If current_temp encodes an error (E81, ...), return the error code
-        if raw_current_temp >= 181:
-            error_no = raw_current_temp - 100
-            return f"E{error_no}"
-        # Else if current_temp encodes a temperature, return False
-        else:
-            return False
-
-    @property
-    def preset_temp(self) -> int:
-        """Preset temperature of the water, expressed in `unit`."""
-        return (self._raw_status >> 24) & 0xFF
+    __slots__ = ("_raw_status", *STATUS_FIELDS)
 
     def __init__(self, raw_status: int = None):
         """Initialize IntexSpaStatus class.
@@ -108,6 +162,14 @@ class IntexSpaStatus:
         if raw_status is not None:
             self.update(raw_status)
 
+    def _set(self, raw_status: int) -> None:
+        """Set the raw status, and decode its fields."""
+        # Write the slots directly, bypassing any __setattr__ override
+        for set_slot, value in zip(
+            _SLOT_SETTERS, (raw_status, *decode_raw_status(raw_status))
+        ):
+            set_slot(self, value)
+
     def update(self, raw_status: int):
         """Update the status of the spa from the received raw response.
 
@@ -117,9 +179,20 @@ class IntexSpaStatus:
             The raw response data received from the spa
 
         """
-        self._raw_status = raw_status
+        self._set(raw_status)
         _LOGGER.debug("Spa status: '%s'", self)
 
+    def snapshot(self) -> "IntexSpaStatusSnapshot":
+        """Return an immutable and hashable copy of the status.
+
+        Returns
+        -------
+        snapshot : IntexSpaStatusSnapshot
+            The immutable status
+
+        """
+        return IntexSpaStatusSnapshot(getattr(self, "_raw_status", None))
+
     def as_dict(self) -> dict:
         """Return main status attributes only, as dict.
 
@@ -160,3 +233,60 @@ class IntexSpaStatus:
     def __repr__(self) -> str:
         """Represent IntexSpaStatus main attributes."""
         return repr(self.as_dict())
+
+
+_SLOT_SETTERS: tuple = tuple(
+    getattr(IntexSpaStatus, name).__set__ for name in IntexSpaStatus.__slots__
+)
+
+
+class IntexSpaStatusSnapshot(IntexSpaStatus):
+    """Hold an immutable status response object.
+
+    Snapshots are hashable, and equal when their raw status data are equal.
+    They never equal a mutable IntexSpaStatus, which hashes by identity.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, raw_status: int = None):
+        """Initialize IntexSpaStatusSnapshot class.
+
+        Parameters
+        ----------
+        raw_status : int, optional
+            The raw response data received from the spa
+
+        """
+        if raw_status is not None:
+            self._set(raw_status)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Forbid any change to the snapshot."""
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Forbid any change to the snapshot."""
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def update(self, raw_status: int):
+        """Forbid any change to the snapshot."""
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def snapshot(self) -> "IntexSpaStatusSnapshot":
+        """Return the snapshot itself, already immutable."""
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the raw status data of both snapshots."""
+        if not isinstance(other, IntexSpaStatusSnapshot):
+            return NotImplemented
+        return getattr(self, "_raw_status", None) == getattr(other, "_raw_status", None)
+
+    def __hash__(self) -> int:
+        """Hash the raw status data."""
+        return hash(getattr(self, "_raw_status", None))
+
+    def __reduce__(self) -> tuple:
+        """Pickle the snapshot from its raw status data."""
+        return (type(self), (getattr(self, "_raw_status", None),))
@@ -0,0 +1,244 @@
+"""Load IntexSpaPollScheduler class."""
+
+import logging
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections.abc import Callable
+
+from .intex_spa import IntexSpa
+from .intex_spa_object_status import IntexSpaStatus, changed_status_fields
+from .intex_spa_priority_semaphore import PRIORITY_BACKGROUND
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_heating(status: IntexSpaStatus) -> bool:
+    """Return whether the water of the spa is heating towards its preset."""
+    return bool(
+        getattr(status, "power", False)
+        and status.heater
+        and status.current_temp is not False
+        and status.current_temp < status.preset_temp
+    )
+
+
+class IntexSpaPollScheduler:
+    """Poll the status of spas at intervals adapted to their activity.
+
+    AsyncIO-enabled class running all the polls from one timer heap: a single
+    background loop sleeps until the next poll is due, then updates the status of
+    the due spas, within a global in-flight limit
+
+    A heating spa is polled every `fast_interval`. A spa whose status changed
+    otherwise is polled every `interval`, and the interval of an off, stable or
+    unreachable spa doubles after each poll, up to `max_interval`. Any command sent
+    to a spa resets it to fast polling, until its status is seen changing.
+
+    Attributes
+    ----------
+    spas : dict[str, IntexSpa]
+      The polled IntexSpa objects, by name
+    intervals : dict[str, float]
+      The current poll interval by spa name, in seconds
+    fast_interval : float
+      The poll interval of heating spas, and after a command, in seconds
+    interval : float
+      The poll interval of spas whose status changed, in seconds
+    max_interval : float
+      The maximum poll interval of off, stable or unreachable spas, in seconds
+    timeout : float
+      The deadline of one poll, in seconds
+    polls : int
+      The number of polls run
+
+    """
+
+    def __init__(
+        self,
+        spas: dict[str, IntexSpa] = None,
+        fast_interval: float = 10.0,
+        interval: float = 60.0,
+        max_interval: float = 900.0,
+        max_concurrency: int = 32,
+        timeout: float = 10.0,
+    ):
+        """Initialize IntexSpaPollScheduler class.
+
+        Parameters
+        ----------
+        spas : dict[str, IntexSpa], optional
+          The IntexSpa objects to poll, by name
+        fast_interval : float, default = 10.0
+          The poll interval of heating spas, and after a command, in seconds
+        interval : float, default = 60.0
+          The poll interval of spas whose status changed, in seconds
+        max_interval : float, default = 900.0
+          The maximum poll interval of off, stable or unreachable spas, in seconds
+        max_concurrency : int, default = 32
+          The maximum number of spas polled at the same time
+        timeout : float, default = 10.0
+          The deadline of one poll, in seconds,
+          not counting the time spent waiting for a free slot
+
+        """
+        self.spas: dict[str, IntexSpa] = {}
+        self.intervals: dict[str, float] = {}
+        self.fast_interval = fast_interval
+        self.interval = interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.polls = 0
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Timer heap of [due time, sequence, name]: entries whose due time is no
+        # longer the one in _due are stale, and skipped
+        self._heap: list[tuple[float, int, str]] = []
+        self._due: dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._statuses: dict[str, IntexSpaStatus] = {}
+        self._remove_listeners: dict[str, Callable[[], None]] = {}
+        self._polling: dict[str, asyncio.Task] = {}
+        # Spas polled fast until their status changes, and spas to poll again
+        # as soon as their poll in progress is over
+        self._boosted: set[str] = set()
+        self._poll_again: set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task = None
+
+        for name, spa in (spas or {}).items():
+            self.add(name, spa)
+
+    def add(self, name: str, spa: IntexSpa) -> None:
+        """Add a spa to poll, first as soon as possible."""
+        if name in self.spas:
+            self.remove(name)
+        self.spas[name] = spa
+        self.intervals[name] = self.interval
+        self._remove_listeners[name] = spa.add_command_listener(
+            lambda _intent: self.poll_soon(name)
+        )
+        self._schedule(name, 0.0)
+
+    def remove(self, name: str) -> IntexSpa:
+        """Stop polling a spa, and return it."""
+        spa = self.spas.pop(name)
+        del self.intervals[name]
+        self._due.pop(name, None)
+        self._statuses.pop(name, None)
+        self._boosted.discard(name)
+        self._poll_again.discard(name)
+        self._remove_listeners.pop(name)()
+        return spa
+
+    def poll_soon(self, name: str) -> None:
+        """Reset a spa to fast polling, until its status is seen changing."""
+        self.intervals[name] = self.fast_interval
+        self._boosted.add(name)
+        if name in self._polling:
+            # Poll again once the poll in progress is over
+            self._poll_again.add(name)
+        else:
+            self._schedule(name, self.fast_interval)
+
+    def _schedule(self, name: str, delay: float) -> None:
+        """Schedule the next poll of a spa in `delay`, unless one is due earlier."""
+        due = time.monotonic() + delay
+        if self._due.get(name, due) < due or name in self._polling:
+            return
+        self._due[name] = due
+        heapq.heappush(self._heap, (due, next(self._sequence), name))
+        if self._heap[0][0] == due:
+            # Shorten the sleep of the loop
+            self._wakeup.set()
+
+    def _next_interval(self, name: str, status: IntexSpaStatus | None) -> float:
+        """Return the interval until the next poll of a spa, given its new status."""
+        interval = self.intervals[name]
+        previous = self._statuses.get(name)
+        if status is None or not getattr(status, "power", False):
+            # Unreachable or off
+            self._boosted.discard(name)
+            return min(interval * 2, self.max_interval)
+        self._statuses[name] = status
+        changed = previous is None or bool(changed_status_fields(previous, status))
+        if changed:
+            self._boosted.discard(name)
+        if is_heating(status) or name in self._boosted:
+            return self.fast_interval
+        if changed:
+            return self.interval
+        # Stable
+        return min(interval * 2, self.max_interval)
+
+    async def _async_poll(self, name: str, spa: IntexSpa) -> None:
+        """Update the status of a spa, and schedule its next poll."""
+        status = None
+        try:
+            async with self._semaphore:
+                self.polls += 1
+                async with asyncio.timeout(self.timeout):
+                    # A status refreshed meanwhile by other intents is fresh enough
+                    status = await spa.async_update_status(
+                        max_age=self.intervals[name] / 2, priority=PRIORITY_BACKGROUND
+                    )
+        except TimeoutError:
+            _LOGGER.info("'%s' spa: deadline exceeded during poll", name)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.info("'%s' spa: %r during poll", name, err)
+        finally:
+            self._polling.pop(name, None)
+
+        if self.spas.get(name) is not spa:
+            # Removed meanwhile, or replaced by another spa to poll at once
+            if name in self.spas:
+                self._schedule(name, 0.0)
+            return
+        interval = self.intervals[name] = self._next_interval(name, status)
+        if name in self._poll_again:
+            self._poll_again.discard(name)
+            interval = 0.0
+        _LOGGER.debug("'%s' spa: next poll in %.1fs", name, interval)
+        self._schedule(name, interval)
+
+    async def _async_run(self) -> None:
+        """Poll the spas as they are due, until stopped."""
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                due, _, name = heapq.heappop(self._heap)
+                if self._due.get(name) != due:
+                    continue
+                del self._due[name]
+                self._polling[name] = asyncio.create_task(
+                    self._async_poll(name, self.spas[name])
+                )
+
+            delay = self._heap[0][0] - now if self._heap else None
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(delay):
+                    await self._wakeup.wait()
+
+    def start(self) -> None:
+        """Start polling the spas in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._async_run())
+
+    async def async_stop(self) -> None:
+        """Stop polling the spas."""
+        interrupted = list(self._polling)
+        tasks = [*self._polling.values(), self._task] if self._task else []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._task = None
+        self._polling.clear()
+        # Poll the interrupted spas first on restart
+        for name in interrupted:
+            if name in self.spas:
+                self._schedule(name, 0.0)
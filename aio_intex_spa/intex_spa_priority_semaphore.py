@@ -0,0 +1,131 @@
+"""Load IntexSpaPrioritySemaphore class."""
+
+import logging
+import asyncio
+import contextlib
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+
+from .intex_spa_exceptions import IntexSpaPreemptedException
+
+_LOGGER = logging.getLogger(__name__)
+
+# Priorities of the spa queries, the lowest first
+PRIORITY_COMMAND: int = 0
+PRIORITY_STATUS: int = 1
+PRIORITY_BACKGROUND: int = 2
+
+
+class IntexSpaPrioritySemaphore:
+    """Grant the spa conversation slots by priority.
+
+    AsyncIO-enabled semaphore whose waiters are granted a slot lowest priority first,
+    then first come, first served. Queued waiters can be given a higher priority,
+    or cancelled when their work is no longer wanted.
+
+    Attributes
+    ----------
+    value : int
+        The number of free slots
+
+    """
+
+    def __init__(self, value: int = 1):
+        """Initialize IntexSpaPrioritySemaphore class.
+
+        Parameters
+        ----------
+        value : int, default = 1
+            The number of slots
+
+        """
+        self.value = value
+        # Heap of [priority, sequence, key, future] waiters
+        self._waiters: list[list] = []
+        self._sequence = itertools.count()
+
+    def locked(self) -> bool:
+        """Whether a slot cannot be acquired immediately."""
+        return self.value == 0
+
+    async def async_acquire(self, priority: int = PRIORITY_STATUS, key: str = None):
+        """Acquire a slot, waiting behind waiters of lower or equal priority.
+
+        Parameters
+        ----------
+        priority : int, default = PRIORITY_STATUS
+            The priority of the work, the lowest first
+        key : str, optional
+            The key to find the waiter back, to give it a higher priority
+
+        """
+        if self.value > 0 and not self._waiters:
+            self.value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [priority, next(self._sequence), key, future])
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release a slot, handing it over to the first waiter by priority."""
+        while self._waiters:
+            future = heapq.heappop(self._waiters)[3]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.value += 1
+
+    @contextlib.asynccontextmanager
+    async def hold(
+        self, priority: int = PRIORITY_STATUS, key: str = None
+    ) -> AsyncIterator[None]:
+        """Hold a slot, acquired with the given priority, for the context duration."""
+        await self.async_acquire(priority, key)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def reprioritize(self, key: str, priority: int) -> None:
+        """Give the queued waiters with the given key a higher priority."""
+        changed = False
+        for waiter in self._waiters:
+            if waiter[2] == key and waiter[0] > priority:
+                waiter[0] = priority
+                changed = True
+        if changed:
+            heapq.heapify(self._waiters)
+
+    def cancel_waiters(self, priority: int) -> int:
+        """Cancel the queued waiters of the given priority or lower.
+
+        Cancelled waiters raise IntexSpaPreemptedException.
+
+        Returns
+        -------
+        count : int
+            The number of cancelled waiters
+
+        """
+        kept = []
+        count = 0
+        for waiter in self._waiters:
+            if waiter[0] < priority:
+                kept.append(waiter)
+            elif not waiter[3].done():
+                waiter[3].set_exception(
+                    IntexSpaPreemptedException("Queued spa query cancelled")
+                )
+                count += 1
+        heapq.heapify(kept)
+        self._waiters = kept
+        _LOGGER.debug("Cancelled %s queued spa queries", count)
+        return count
@@ -0,0 +1,261 @@
+"""Load IntexSpaProtocol and IntexSpaProtocolNetworkLayer classes."""
+
+import logging
+import asyncio
+import time
+from collections import deque
+
+from .intex_spa_network_layer import IntexSpaNetworkLayer, response_sid
+from .intex_spa_tracing import start_span
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaProtocol(asyncio.Protocol):
+    """Frame the responses of Intex Spa wifi module at the transport level.
+
+    Low-level asyncio protocol: received data is split on newlines into a reusable
+    buffer, and each response resolves its waiting future straight from
+    `data_received`, in order, or by sid when pipelined
+
+    Attributes
+    ----------
+    pipelined : bool
+        Whether responses are dispatched to their requests by sid
+    closed : bool
+        Whether the connection is lost
+    writing_paused : bool
+        Whether the transport asked to stop writing, its buffer being full
+
+    """
+
+    def __init__(self, pipelined: bool = False):
+        """Initialize IntexSpaProtocol class.
+
+        Parameters
+        ----------
+        pipelined : bool, default = False
+            Whether responses are dispatched to their requests by sid
+
+        """
+        self.pipelined = pipelined
+        self.closed = False
+        self.writing_paused = False
+
+        self._transport: asyncio.Transport = None
+        self._buffer = bytearray()
+        # Responses not awaited yet, and futures awaiting a response, in order
+        self._responses: deque[bytes] = deque()
+        self._waiters: deque[asyncio.Future] = deque()
+        # Futures awaiting a response, by sid
+        self._pending: dict[str, asyncio.Future] = {}
+        # Futures awaiting the transport to resume writing
+        self._drain_waiters: deque[asyncio.Future] = deque()
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        """Keep the transport of the new connection."""
+        self._transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        """Split the received data into responses, and dispatch them."""
+        buffer = self._buffer
+        buffer += data
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            self._dispatch(bytes(buffer[start : end + 1]))
+            start = end + 1
+        del buffer[:start]
+
+    def _dispatch(self, response_as_bytes: bytes) -> None:
+        """Resolve the future awaiting the response."""
+        _LOGGER.debug("Receiving bytes from the spa: %s", response_as_bytes)
+        if self.pipelined:
+            future = self._pending.pop(response_sid(response_as_bytes), None)
+            if future is None:
+                _LOGGER.debug("Dropping spa response matching no request")
+            elif not future.done():
+                future.set_result(response_as_bytes)
+            return
+
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(response_as_bytes)
+                return
+        self._responses.append(response_as_bytes)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Fail every request awaiting its response."""
+        self.closed = True
+        exception = ConnectionResetError(
+            f"Connection to the spa lost: {exc!r}"
+            if exc
+            else "Connection to the spa closed"
+        )
+        for future in (*self._waiters, *self._pending.values(), *self._drain_waiters):
+            if not future.done():
+                future.set_exception(exception)
+        self._waiters.clear()
+        self._pending.clear()
+        self._drain_waiters.clear()
+
+    def pause_writing(self) -> None:
+        """Stop writing, the transport buffer being full."""
+        self.writing_paused = True
+
+    def resume_writing(self) -> None:
+        """Resume writing, the transport buffer being drained."""
+        self.writing_paused = False
+        while self._drain_waiters:
+            future = self._drain_waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+
+    def write(self, bytes_to_write: bytes) -> None:
+        """Send bytes to the spa."""
+        if self.closed:
+            raise ConnectionResetError("Connection to the spa closed")
+        _LOGGER.debug("Sending bytes to the spa: %s", bytes_to_write)
+        self._transport.write(bytes_to_write)
+
+    def close(self) -> None:
+        """Close the connection to the spa."""
+        if self._transport is not None:
+            self._transport.close()
+
+    async def async_drain(self) -> None:
+        """Wait for the transport to resume writing, if paused."""
+        if self.closed:
+            raise ConnectionResetError("Connection to the spa closed")
+        if not self.writing_paused:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(future)
+        await future
+
+    async def async_readline(self) -> bytes:
+        """Receive the next response from the spa, in order."""
+        if self._responses:
+            return self._responses.popleft()
+        if self.closed:
+            raise ConnectionResetError("Connection to the spa closed")
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        return await future
+
+    def expect(self, sid: str) -> asyncio.Future:
+        """Return a future for the response to the request with the given sid."""
+        if self.closed:
+            raise ConnectionResetError("Connection to the spa closed")
+        future = asyncio.get_running_loop().create_future()
+        self._pending[sid] = future
+        return future
+
+    def forget(self, sid: str, future: asyncio.Future) -> None:
+        """Stop awaiting the response to the request with the given sid."""
+        if self._pending.get(sid) is future:
+            del self._pending[sid]
+
+
+class IntexSpaProtocolNetworkLayer(IntexSpaNetworkLayer):
+    """Manage Network-layer communications with an asyncio protocol.
+
+    Same as IntexSpaNetworkLayer, without StreamReader buffering and per-read
+    coroutines; sends only wait, up to `send_timeout`, while the transport buffer is
+    full. A lost connection is noticed as soon as the transport reports it
+
+    Attributes
+    ----------
+    protocol : IntexSpaProtocol
+        The protocol connected to the spa
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize IntexSpaProtocolNetworkLayer class.
+
+        Parameters are the same as IntexSpaNetworkLayer ones.
+        """
+        super().__init__(*args, **kwargs)
+        self.protocol: IntexSpaProtocol = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the connection to the spa is open, as far as known."""
+        return self.protocol is not None and not self.protocol.closed
+
+    async def _async_open_connection(self, address: str) -> None:
+        """Open the TCP connection to the spa, at the given IP address."""
+        _, self.protocol = await asyncio.get_running_loop().create_connection(
+            lambda: IntexSpaProtocol(self.pipelined), address, self.port
+        )
+
+    async def _async_disconnect(self) -> None:
+        """Close the connection to the spa."""
+        if self.pool is not None:
+            self.pool.release(self)
+        if self.protocol is None:
+            _LOGGER.debug("No previous spa connection known")
+            return
+        _LOGGER.debug("Closing previous TCP connection to the spa with asyncio...")
+        self.protocol.close()
+        self.protocol = None
+        if self.metrics is not None:
+            self.metrics.disconnects += 1
+        _LOGGER.info("Previous TCP connection closed with the spa")
+
+    async def _async_ensure_connected(self) -> None:
+        """Connect, or reconnect, to the spa if needed."""
+        if self.connected:
+            return
+        async with self._connect_lock:
+            if self.protocol is None:
+                _LOGGER.info("Not connected to the spa, trying to connect...")
+                await self._async_connect()
+            elif self.protocol.closed:
+                _LOGGER.info("Connection with the spa seems to be broken")
+                await self._async_disconnect()
+                await self._async_connect()
+
+    async def async_send(self, bytes_to_write: bytes = None) -> None:
+        """Send command to the spa."""
+        await self._async_ensure_connected()
+        self.protocol.write(bytes_to_write)
+        await self._async_drain(self.protocol)
+
+    async def _async_drain(self, protocol: IntexSpaProtocol) -> None:
+        """Wait for the sent bytes to be buffered, within `send_timeout`."""
+        if protocol.writing_paused:
+            async with asyncio.timeout(self.send_timeout):
+                await protocol.async_drain()
+
+    async def async_receive(self) -> bytes:
+        """Receive response from the spa."""
+        async with asyncio.timeout(self.receive_timeout):
+            return await self.protocol.async_readline()
+
+    async def _async_request(
+        self, bytes_to_write: bytes, sid: str, intent: str = None
+    ) -> bytes:
+        """Send a request to the spa, and receive its response."""
+        if not self.pipelined:
+            return await super()._async_request(bytes_to_write, sid, intent)
+
+        tracer = self.tracer
+        async with self._in_flight:
+            await self._async_ensure_connected()
+            protocol = self.protocol
+            future = protocol.expect(sid)
+            try:
+                start = time.perf_counter()
+                with start_span(tracer, "intex_spa.send", intent, sid):
+                    protocol.write(bytes_to_write)
+                    await self._async_drain(protocol)
+                start = self._observe_latency(intent, "send", start)
+                with start_span(tracer, "intex_spa.receive", intent, sid):
+                    async with asyncio.timeout(self.receive_timeout):
+                        response_as_bytes = await future
+                self._observe_latency(intent, "receive", start)
+                return response_as_bytes
+            finally:
+                protocol.forget(sid, future)
@@ -2,6 +2,13 @@
 
 import time
 import json
+from collections.abc import Iterable
+
+from .intex_spa_exceptions import (
+    IntexSpaMalformedResponseException,
+    IntexSpaChecksumException,
+)
+from .intex_spa_tracing import IntexSpaTracer, start_span
 
 TYPE: dict = {
     "command": 1,
@@ -49,18 +56,98 @@ COMMAND: dict = {
 }
 
 
+_last_intex_timestamp = 0
+
+
+def _next_intex_timestamp() -> str:
+    """Return a new 10th of milliseconds timestamp, unique within the process.
+
+    Responses are matched to their requests by this timestamp (the "sid"),
+    so two queries must never share one, even when created within the same 100µs.
+    """
+    global _last_intex_timestamp  # pylint: disable=global-statement
+    _last_intex_timestamp = max(int(time.time() * 10000), _last_intex_timestamp + 1)
+    return str(_last_intex_timestamp)
+
+
+def checksum_of_bytes(data: bytes) -> int:
+    """Return integer checksum for the given raw bytes, as expected by Intex Spa protocol.
+
+    The checksum is 0xFF minus the sum of the bytes, modulo 0xFF.
+    """
+    calculated_checksum = (0xFF - sum(data)) % 0xFF
+    # Fix: https://github.com/mathieu-mp/aio-intex-spa/issues/27
+    return calculated_checksum or 0xFF
+
+
 def checksum_as_int(data: str) -> int:
     """Return integer checksum for the given data, as expected by Intex Spa protocol."""
-    calculated_checksum = 0xFF
-    for index in range(0, len(data), 2):
-        calculated_checksum = calculated_checksum - (
-            int("0x" + data[index : index + 2], 16)
-        )
-    calculated_checksum = calculated_checksum % 0xFF
-    # Fix: https://github.com/mathieu-mp/aio-intex-spa/issues/27
-    if calculated_checksum == 0x00:
-        calculated_checksum = 0xFF
-    return calculated_checksum
+    if len(data) % 2:
+        # A trailing single hex digit counts as one byte
+        return checksum_of_bytes(bytes.fromhex(data[:-1]) + bytes((int(data[-1], 16),)))
+    return checksum_of_bytes(bytes.fromhex(data))
+
+
+STATUS_FRAME_LENGTH = 19
+
+
+def decode_status_frame(frame: bytes | str) -> int:
+    """Validate a status frame checksum, and decode the frame in the same pass.
+
+    Parameters
+    ----------
+    frame : bytes | str
+        The status frame, checksum included, as raw bytes or as a hex string
+
+    Returns
+    -------
+    raw_status : int
+        The raw integer-encoded status data, as used by IntexSpaStatus
+
+    Raises
+    ------
+    IntexSpaMalformedResponseException
+        If the frame is not a status frame
+    IntexSpaChecksumException
+        If the frame checksum is invalid
+
+    """
+    if isinstance(frame, str):
+        try:
+            frame = bytes.fromhex(frame)
+        except ValueError as err:
+            raise IntexSpaMalformedResponseException(
+                f"Invalid status frame: {err}"
+            ) from err
+    if len(frame) != STATUS_FRAME_LENGTH:
+        raise IntexSpaMalformedResponseException("Invalid status frame length")
+    if checksum_of_bytes(frame[:-1]) != frame[-1]:
+        raise IntexSpaChecksumException("Invalid status frame checksum")
+    return int.from_bytes(frame, "big")
+
+
+def decode_status_frames(frames: Iterable[bytes | str]) -> list[int | None]:
+    """Validate and decode a batch of status frames, i.e. from recorded traffic.
+
+    Parameters
+    ----------
+    frames : Iterable[bytes | str]
+        The status frames, checksums included, as raw bytes or as hex strings
+
+    Returns
+    -------
+    raw_statuses : list[int | None]
+        The raw integer-encoded status data of each frame, or None if invalid
+
+    """
+    raw_statuses = []
+    append = raw_statuses.append
+    for frame in frames:
+        try:
+            append(decode_status_frame(frame))
+        except AssertionError:
+            append(None)
+    return raw_statuses
 
 
 def checksum_as_str(data: str) -> str:
@@ -69,6 +156,82 @@ def checksum_as_str(data: str) -> str:
     return hex(checksum_as_int(data))[2:].upper()
 
 
+def _build_request_template(request: str, request_type: int) -> tuple[bytes, bytes]:
+    """Return the full message request bytes before and after its sid."""
+    request_bytes = json.dumps(
+        {
+            "data": request + checksum_as_str(request),
+            "sid": "{sid}",
+            "type": request_type,
+        }
+    ).encode()
+    before_sid, after_sid = request_bytes.split(b"{sid}")
+    return before_sid, after_sid
+
+
+# Full message request bytes of every intent and temperature preset, around the sid
+REQUEST_TEMPLATES: dict = {
+    (command["request"], command["type"]): _build_request_template(
+        command["request"], command["type"]
+    )
+    for intent, command in COMMAND.items()
+    if intent != "preset_temp"
+}
+REQUEST_TEMPLATES.update(
+    {
+        (request, TYPE["command"]): _build_request_template(request, TYPE["command"])
+        for request in (
+            COMMAND["preset_temp"]["request"] + hex(preset_temp)[2:].upper()
+            for preset_temp in range(0x100)
+        )
+    }
+)
+
+_STATUS_RESPONSE_BEFORE_SID = b'{"sid":"'
+_STATUS_RESPONSE_BEFORE_DATA = b'","data":"'
+_STATUS_RESPONSE_AFTER_DATA = b'","result":"ok","type":2}'
+_STATUS_DATA_LENGTH = 38
+
+
+def parse_status_response(received_bytes: bytes, sid: str) -> int | None:
+    """Render a status response in the compact form sent by Intex Spa wifi module.
+
+    Fast path for the fixed-shape successful status response, working on bytes.
+
+    Parameters
+    ----------
+    received_bytes : bytes
+        The response received from Intex Spa wifi module, as bytes or memoryview
+    sid : str
+        The sid of the request
+
+    Returns
+    -------
+    response_data : int | None
+        The new data, rendered from the spa response, or None if the response
+        is not a valid status response in the compact form
+
+    """
+    received_bytes = bytes(received_bytes)
+    data_start = (
+        len(_STATUS_RESPONSE_BEFORE_SID) + len(sid) + len(_STATUS_RESPONSE_BEFORE_DATA)
+    )
+    data_end = data_start + _STATUS_DATA_LENGTH
+    if (
+        received_bytes[data_end:].rstrip() != _STATUS_RESPONSE_AFTER_DATA
+        or received_bytes[:data_start]
+        != _STATUS_RESPONSE_BEFORE_SID + sid.encode() + _STATUS_RESPONSE_BEFORE_DATA
+    ):
+        return None
+
+    try:
+        return decode_status_frame(
+            bytes.fromhex(received_bytes[data_start:data_end].decode())
+        )
+    except (AssertionError, ValueError):
+        return None
+
+
 class IntexSpaQuery:
     """Manage one application-layer query with Intex Spa wifi module.
 
@@ -76,8 +239,12 @@ class IntexSpaQuery:
 
     Attributes
     ----------
+    intent : str
+        The intent of the query (i.e.: "status", "heater", "preset_temp", ...)
     intex_timestamp : str
         The 10th of milliseconds timestamp, as expected by Intex Spa protocol
+    tracer : IntexSpaTracer | opentelemetry.trace.Tracer | None
+        The tracer of the response rendering
     request : str
         The request data to send, as expected by Intex Spa protocol
     request_bytes : bytes
@@ -87,9 +254,13 @@ class IntexSpaQuery:
 
     """
 
-    def __init__(self, intent: str, preset_temp: int = None):
+    def __init__(
+        self, intent: str, preset_temp: int = None, tracer: IntexSpaTracer = None
+    ):
         """Init."""
-        self.intex_timestamp = str(int(time.time() * 10000))
+        self.intent = intent
+        self.intex_timestamp = _next_intex_timestamp()
+        self.tracer = tracer
 
         self.request: str = COMMAND[intent]["request"]
         if intent == "preset_temp":
@@ -102,6 +273,14 @@ class IntexSpaQuery:
     @property
     def request_bytes(self) -> bytes:
         """The full message request to send, as expected by Intex Spa protocol, encoded as bytes."""
+        try:
+            before_sid, after_sid = REQUEST_TEMPLATES[self.request, self.type]
+        except KeyError:
+            return self._request_bytes_json()
+        return before_sid + self.intex_timestamp.encode() + after_sid
+
+    def _request_bytes_json(self) -> bytes:
+        """Encode the full message request to send with the general JSON encoder."""
         request_dict = {
             "data": self.request + checksum_as_str(self.request),
             "sid": self.intex_timestamp,
@@ -123,31 +302,62 @@ class IntexSpaQuery:
             The new data, rendered from the spa response
 
         """
-        response = json.loads(received_bytes.decode())
-
-        # Timestamp correspondance check
-        assert response["sid"] == self.intex_timestamp
-        assert response["result"] == "ok"
+        if self.tracer is not None:
+            with start_span(
+                self.tracer, "intex_spa.parse", self.intent, self.intex_timestamp
+            ):
+                return self._render_response_data(received_bytes)
+        return self._render_response_data(received_bytes)
 
+    def _render_response_data(self, received_bytes: bytes):
+        """Render response data from `received_bytes`, fast path first."""
         if self.type == TYPE["command"]:
-            assert response["type"] == TYPE["status"]
+            response_data = parse_status_response(received_bytes, self.intex_timestamp)
+            if response_data is not None:
+                self.response_data = response_data
+                return self.response_data
+
+        return self._render_response_data_json(received_bytes)
+
+    def _render_response_data_json(self, received_bytes: bytes):
+        """Render response data from `received_bytes` with the general JSON decoder."""
+        try:
+            response = json.loads(bytes(received_bytes).decode())
+
+            # Timestamp correspondance check
+            if response["sid"] != self.intex_timestamp:
+                raise IntexSpaMalformedResponseException("Unexpected response sid")
+            if response["result"] != "ok":
+                raise IntexSpaMalformedResponseException("Unexpected response result")
+
+            if self.type == TYPE["command"]:
+                if response["type"] != TYPE["status"]:
+                    raise IntexSpaMalformedResponseException("Unexpected response type")
+
+                # Checksum comparison
+                checksum_calculated = checksum_as_int(response["data"][:-2])
+                checksum_in_response = int("0x" + response["data"][-2:], 16)
+                if checksum_calculated != checksum_in_response:
+                    raise IntexSpaChecksumException("Invalid response checksum")
 
-            # Checksum comparison
-            checksum_calculated = checksum_as_int(response["data"][:-2])
-            checksum_in_response = int("0x" + response["data"][-2:], 16)
-            assert checksum_calculated == checksum_in_response
+                self.response_data = int("0x" + response["data"], 16)
 
-            self.response_data = int("0x" + response["data"], 16)
+            elif self.type == TYPE["info"]:
+                if response["type"] != TYPE["info"]:
+                    raise IntexSpaMalformedResponseException("Unexpected response type")
+                data = json.loads(response["data"])
+                if data["dtype"] != "spa":
+                    raise IntexSpaMalformedResponseException("Unexpected spa dtype")
 
-        elif self.type == TYPE["info"]:
-            assert response["type"] == TYPE["info"]
-            data = json.loads(response["data"])
-            assert data["dtype"] == "spa"
+                self.response_data = {
+                    "ip": data["ip"],
+                    "uid": data["uid"],
+                    "dtype": data["dtype"],
+                }
 
-            self.response_data = {
-                "ip": data["ip"],
-                "uid": data["uid"],
-                "dtype": data["dtype"],
-            }
+        except (ValueError, KeyError, TypeError) as err:
+            raise IntexSpaMalformedResponseException(
+                f"Cannot decode spa response: {err!r}"
+            ) from err
 
         return self.response_data
@@ -0,0 +1,117 @@
+"""Load IntexSpaRateLimiter class."""
+
+import logging
+import asyncio
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaRateLimiter:
+    """Limit the rate of the queries sent to a spa.
+
+    Token bucket holding up to `burst` tokens, refilled at `rate` tokens per second:
+    each query takes a token, and waits for it when the bucket is empty. Waiting
+    queries reserve their token in turn, so that they are sent in order.
+
+    Attributes
+    ----------
+    rate : float
+        The sustained rate of queries, per second
+    burst : int
+        The maximum number of queries sent back-to-back
+    acquired : int
+        The number of tokens taken, one per query sent
+    throttled : int
+        The number of queries delayed by the limiter
+    throttle_time : float
+        The total delay of the throttled queries, in seconds
+    max_throttle_delay : float
+        The longest delay of a throttled query, in seconds
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize IntexSpaRateLimiter class.
+
+        Parameters
+        ----------
+        rate : float
+            The sustained rate of queries, per second
+        burst : int, default = 1
+            The maximum number of queries sent back-to-back
+
+        """
+        self.rate = rate
+        self.burst = burst
+        self.acquired = 0
+        self.throttled = 0
+        self.throttle_time = 0.0
+        self.max_throttle_delay = 0.0
+
+        self._tokens = float(burst)
+        self._refill_time = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refill_time) * self.rate
+        )
+        self._refill_time = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without waiting.
+
+        Returns
+        -------
+        acquired : bool
+            Whether a token was taken
+
+        """
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.acquired += 1
+        return True
+
+    async def async_acquire(self) -> None:
+        """Take a token, waiting for it if needed."""
+        self._refill()
+        self._tokens -= 1
+        self.acquired += 1
+        if self._tokens >= 0:
+            return
+
+        # Reserve the token, and wait for it to be earned
+        delay = -self._tokens / self.rate
+        self.throttled += 1
+        self.throttle_time += delay
+        self.max_throttle_delay = max(self.max_throttle_delay, delay)
+        _LOGGER.debug("Spa query throttled for %.3fs", delay)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Give the reserved token back
+            self._tokens += 1
+            self.acquired -= 1
+            raise
+
+    def stats(self) -> dict:
+        """Return the throttling statistics of the limiter.
+
+        Returns
+        -------
+        stats : dict
+            The limiter settings and throttling statistics, delays in seconds
+
+        """
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "throttle_time": self.throttle_time,
+            "max_throttle_delay": self.max_throttle_delay,
+        }
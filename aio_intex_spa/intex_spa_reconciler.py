@@ -0,0 +1,149 @@
+"""Load IntexSpaReconciler class."""
+
+import logging
+import asyncio
+import contextlib
+
+from .intex_spa import IntexSpa
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaReconciler:
+    """Drive a spa towards a declared target state.
+
+    AsyncIO-enabled class running one background loop per spa: the loop compares
+    the target state with the spa status, sends the minimal set of commands,
+    and backs off while the spa stays converged and nothing changes
+
+    As the spa commands are toggles, a command is only ever sent when the status
+    of the spa, updated in the same conversation, differs from the target.
+
+    Attributes
+    ----------
+    spa : IntexSpa
+      The spa to reconcile
+    target : dict[str, bool | int]
+      The expected state by function, or temperature preset
+    converged : bool
+      Whether the spa status matched the target at the last reconciliation
+    interval : float
+      The delay between reconciliations after the target changes, or until the
+      spa converges, in seconds
+    max_interval : float
+      The maximum delay between reconciliations, in seconds
+
+    """
+
+    def __init__(
+        self,
+        spa: IntexSpa,
+        target: dict[str, bool | int] = None,
+        interval: float = 30.0,
+        max_interval: float = 600.0,
+    ):
+        """Initialize IntexSpaReconciler class.
+
+        Parameters
+        ----------
+        spa : IntexSpa
+          The spa to reconcile
+        target : dict[str, bool | int], optional
+          The expected state by function, or temperature preset
+          (i.e.: {"heater": True, "preset_temp": 38})
+        interval : float, default = 30.0
+          The delay between reconciliations after the target changes, or until
+          the spa converges, in seconds, doubled after each converged
+          reconciliation until `max_interval`
+        max_interval : float, default = 600.0
+          The maximum delay between reconciliations, in seconds
+
+        """
+        self.spa = spa
+        self.target: dict[str, bool | int] = dict(target or {})
+        self.converged = False
+        self.interval = interval
+        self.max_interval = max_interval
+
+        self._target_changed = asyncio.Event()
+        self._task: asyncio.Task = None
+
+    def set_target(self, **expected_states: bool | int) -> None:
+        """Update the target state, and reconcile as soon as possible.
+
+        Parameters
+        ----------
+        **expected_states : bool | int
+          The expected state by function, or temperature preset
+          (i.e.: heater=True, preset_temp=38)
+
+        """
+        self.target.update(expected_states)
+        self.converged = False
+        self._target_changed.set()
+
+    def clear_target(self, *parameters: str) -> None:
+        """Stop reconciling the given functions, or all functions by default."""
+        if parameters:
+            for parameter in parameters:
+                self.target.pop(parameter, None)
+        else:
+            self.target.clear()
+
+    async def async_reconcile(self) -> bool:
+        """Reconcile the spa with the target state once.
+
+        Returns
+        -------
+        converged : bool
+          Whether the spa status matches the target
+
+        """
+        # The target may change while the commands are sent
+        target = dict(self.target)
+        if target:
+            status = await self.spa.async_apply(target)
+            self.converged = all(
+                getattr(status, parameter) == expected_state
+                for parameter, expected_state in target.items()
+            )
+        else:
+            self.converged = True
+        return self.converged
+
+    async def _async_run(self) -> None:
+        """Reconcile the spa until stopped."""
+        interval = self.interval
+        while True:
+            self._target_changed.clear()
+            try:
+                if not await self.async_reconcile():
+                    _LOGGER.info("Spa did not converge towards its target state")
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.info("Spa reconciliation failed: %r", err)
+                self.converged = False
+
+            if not self.converged:
+                # Retry at the short interval until the spa converges
+                interval = self.interval
+            try:
+                async with asyncio.timeout(interval):
+                    await self._target_changed.wait()
+            except TimeoutError:
+                # Nothing changed on our side: back off
+                interval = min(interval * 2, self.max_interval)
+            else:
+                interval = self.interval
+
+    def start(self) -> None:
+        """Start reconciling the spa in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._async_run())
+
+    async def async_stop(self) -> None:
+        """Stop reconciling the spa."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
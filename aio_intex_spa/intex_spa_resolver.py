@@ -0,0 +1,123 @@
+"""Load IntexSpaResolver class."""
+
+import logging
+import asyncio
+import ipaddress
+import socket
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntexSpaResolver:
+    """Resolve spa hostnames, with a cache shared by all spas.
+
+    AsyncIO-enabled class caching the addresses of each hostname for `ttl` seconds,
+    and resolution failures for `negative_ttl` seconds. Concurrent lookups of the
+    same hostname share one `getaddrinfo` call, and literal IP addresses are never
+    looked up.
+
+    Attributes
+    ----------
+    ttl : float
+        The time the addresses of a hostname are cached, in seconds
+    negative_ttl : float
+        The time a hostname resolution failure is cached, in seconds
+
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 30.0):
+        """Initialize IntexSpaResolver class.
+
+        Parameters
+        ----------
+        ttl : float, default = 300.0
+            The time the addresses of a hostname are cached, in seconds
+        negative_ttl : float, default = 30.0
+            The time a hostname resolution failure is cached, in seconds
+
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+        # Expiry time, and addresses or resolution failure, by hostname
+        self._cache: dict[str, tuple[float, list[str] | socket.gaierror]] = {}
+        # Lookups in progress, by hostname
+        self._lookups: dict[str, asyncio.Task] = {}
+
+    async def _async_lookup(self, host: str, port: str) -> list[str]:
+        """Look the hostname up, and cache the result."""
+        _LOGGER.debug("Resolving DNS address for %s...", host)
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+        except socket.gaierror as err:
+            self._cache[host] = (time.monotonic() + self.negative_ttl, err)
+            raise
+        # Keep the resolution order, without duplicates
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[host] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def _on_lookup_done(self, host: str, task: asyncio.Task) -> None:
+        """Forget the lookup once done."""
+        if self._lookups.get(host) is task:
+            del self._lookups[host]
+        # Mark the exception as retrieved, even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def async_resolve(self, host: str, port: str) -> list[str]:
+        """Return the IP addresses of a spa hostname.
+
+        Parameters
+        ----------
+        host : str
+            The fqdn or IP of the intex spa wifi module
+        port : str
+            The TCP service port of the intex spa wifi module
+
+        Returns
+        -------
+        addresses : list[str]
+            The IP addresses of the spa, in resolution order
+
+        Raises
+        ------
+        socket.gaierror
+            If the hostname cannot be resolved, now or within `negative_ttl`
+
+        """
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            pass
+        else:
+            return [host]
+
+        cached = self._cache.get(host)
+        if cached is not None and cached[0] > time.monotonic():
+            if isinstance(cached[1], socket.gaierror):
+                raise socket.gaierror(*cached[1].args)
+            return cached[1]
+
+        lookup = self._lookups.get(host)
+        if lookup is None:
+            lookup = asyncio.create_task(self._async_lookup(host, port))
+            self._lookups[host] = lookup
+            lookup.add_done_callback(lambda task: self._on_lookup_done(host, task))
+        # Let the other callers get the result, even if this one is cancelled
+        return await asyncio.shield(lookup)
+
+    def forget(self, host: str) -> None:
+        """Forget the cached addresses of a hostname, if they turned out stale."""
+        self._cache.pop(host, None)
+
+    def clear(self) -> None:
+        """Forget every cached address and resolution failure."""
+        self._cache.clear()
+
+
+# Resolver shared by all spas by default
+DEFAULT_RESOLVER = IntexSpaResolver()
@@ -0,0 +1,165 @@
+"""Load IntexSpaRetryPolicy and IntexSpaRetryStrategy classes."""
+
+import asyncio
+import random
+
+from .intex_spa_exceptions import IntexSpaChecksumException
+
+NETWORK_ERRORS: tuple = (
+    TimeoutError,
+    asyncio.IncompleteReadError,
+    ConnectionRefusedError,
+    ConnectionResetError,
+    ConnectionError,
+    OSError,
+)
+
+
+class IntexSpaRetryPolicy:
+    """Define the retries of a spa query, for one kind of error.
+
+    The delay before the n-th retry is `base_delay * backoff ** (n - 1)`,
+    capped to `max_delay`, then reduced by up to `jitter` times itself at random,
+    so that spas failing together do not retry in lockstep.
+
+    Attributes
+    ----------
+    max_attempts : int
+        The maximum number of failed attempts for this kind of error
+    base_delay : float
+        The delay before the first retry, in seconds
+    backoff : float
+        The factor applied to the delay after each retry
+    max_delay : float
+        The maximum delay before a retry, in seconds
+    jitter : float
+        The maximum random reduction of a delay, as a fraction of the delay
+
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 2.0,
+        backoff: float = 1.0,
+        max_delay: float = 60.0,
+        jitter: float = 0.0,
+    ):
+        """Initialize IntexSpaRetryPolicy class.
+
+        Parameters
+        ----------
+        max_attempts : int, default = 3
+            The maximum number of failed attempts for this kind of error
+        base_delay : float, default = 2.0
+            The delay before the first retry, in seconds
+        backoff : float, default = 1.0
+            The factor applied to the delay after each retry, 1.0 for a fixed delay
+        max_delay : float, default = 60.0
+            The maximum delay before a retry, in seconds
+        jitter : float, default = 0.0
+            The maximum random reduction of a delay, as a fraction of the delay,
+            from 0.0 for no jitter to 1.0 for full jitter
+
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def get_delay(self, retry: int) -> float:
+        """Return the delay before the `retry`-th retry, in seconds."""
+        delay = min(self.base_delay * self.backoff ** (retry - 1), self.max_delay)
+        if self.jitter:
+            delay -= delay * self.jitter * random.random()
+        return delay
+
+
+class IntexSpaRetryStrategy:
+    """Select the retry policy of a spa query, by kind of error.
+
+    Default policies retry every error 2 seconds later, 3 attempts at most.
+    For instance, a strategy recovering faster from isolated errors, and spreading
+    reconnections when many spas fail together, could be:
+
+        IntexSpaRetryStrategy(
+            network=IntexSpaRetryPolicy(5, base_delay=0.5, backoff=2, jitter=1),
+            protocol=IntexSpaRetryPolicy(3, base_delay=1),
+            checksum=IntexSpaRetryPolicy(2, base_delay=0),
+            budget=5,
+        )
+
+    Attributes
+    ----------
+    network : IntexSpaRetryPolicy
+        The retry policy for network errors (timeouts, refused or reset connections)
+    protocol : IntexSpaRetryPolicy
+        The retry policy for malformed spa responses
+    checksum : IntexSpaRetryPolicy
+        The retry policy for spa responses with an invalid checksum
+    budget : int
+        The maximum number of attempts of a query, whatever the errors
+
+    """
+
+    def __init__(
+        self,
+        network: IntexSpaRetryPolicy = None,
+        protocol: IntexSpaRetryPolicy = None,
+        checksum: IntexSpaRetryPolicy = None,
+        budget: int = 3,
+    ):
+        """Initialize IntexSpaRetryStrategy class.
+
+        Parameters
+        ----------
+        network : IntexSpaRetryPolicy, optional
+            The retry policy for network errors (timeouts, refused or reset connections)
+        protocol : IntexSpaRetryPolicy, optional
+            The retry policy for malformed spa responses
+        checksum : IntexSpaRetryPolicy, optional
+            The retry policy for spa responses with an invalid checksum,
+            the protocol retry policy by default
+        budget : int, default = 3
+            The maximum number of attempts of a query, whatever the errors
+
+        """
+        self.network = network or IntexSpaRetryPolicy()
+        self.protocol = protocol or IntexSpaRetryPolicy()
+        self.checksum = checksum or self.protocol
+        self.budget = budget
+
+    def get_policy(self, error: Exception) -> IntexSpaRetryPolicy:
+        """Return the retry policy for the given error."""
+        if isinstance(error, IntexSpaChecksumException):
+            return self.checksum
+        if isinstance(error, AssertionError):
+            return self.protocol
+        return self.network
+
+    def get_delay(self, error: Exception, failures: dict) -> float | None:
+        """Record a failed attempt, and return the delay before retrying.
+
+        Parameters
+        ----------
+        error : Exception
+            The error raised by the failed attempt
+        failures : dict
+            The failed attempts of the query by policy, updated in place,
+            initially empty
+
+        Returns
+        -------
+        delay : float | None
+            The delay before retrying, in seconds, or None to stop retrying
+
+        """
+        policy = self.get_policy(error)
+        failures[policy] = failures.get(policy, 0) + 1
+        if (
+            failures[policy] >= policy.max_attempts
+            or sum(failures.values()) >= self.budget
+        ):
+            return None
+        return policy.get_delay(failures[policy])
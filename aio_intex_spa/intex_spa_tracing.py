@@ -0,0 +1,164 @@
+"""Load IntexSpaTracer and IntexSpaSpan classes."""
+
+import logging
+import contextlib
+import contextvars
+import time
+from collections.abc import Callable, Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Context manager standing for a span when no tracer is attached
+NO_SPAN = contextlib.nullcontext()
+
+_CURRENT_SPAN: contextvars.ContextVar = contextvars.ContextVar(
+    "intex_spa_current_span", default=None
+)
+
+
+def start_span(tracer, name: str, intent: str = None, sid: str = None):
+    """Return a span of the query pipeline, tagged with its intent and sid.
+
+    Parameters
+    ----------
+    tracer : IntexSpaTracer | opentelemetry.trace.Tracer | None
+        The tracer starting the span, or None for no span
+    name : str
+        The name of the span (i.e.: "intex_spa.send")
+    intent : str, optional
+        The intent the span belongs to
+    sid : str, optional
+        The sid of the query the span belongs to
+
+    Returns
+    -------
+    span : contextlib.AbstractContextManager
+        The span, to be entered as a context manager
+
+    """
+    if tracer is None:
+        return NO_SPAN
+    attributes = {}
+    if intent is not None:
+        attributes["intex_spa.intent"] = intent
+    if sid is not None:
+        attributes["intex_spa.sid"] = sid
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+class IntexSpaSpan:
+    """Hold one stage of a conversation with a spa.
+
+    Attributes
+    ----------
+    name : str
+        The name of the span (i.e.: "intex_spa.send")
+    attributes : dict
+        The attributes of the span, such as "intex_spa.intent" and "intex_spa.sid"
+    parent : IntexSpaSpan | None
+        The span this span is nested in
+    start_time : float
+        The monotonic time the span started at, in seconds
+    end_time : float | None
+        The monotonic time the span ended at, in seconds, None while in progress
+    exception : BaseException | None
+        The exception raised within the span
+
+    """
+
+    __slots__ = ("name", "attributes", "parent", "start_time", "end_time", "exception")
+
+    def __init__(self, name: str, attributes: dict = None, parent=None):
+        """Initialize IntexSpaSpan class."""
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent: IntexSpaSpan | None = parent
+        self.start_time = time.perf_counter()
+        self.end_time: float | None = None
+        self.exception: BaseException | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Duration of the span, in seconds, None while in progress."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record the exception raised within the span."""
+        self.exception = exception
+
+    def __repr__(self) -> str:
+        """Represent IntexSpaSpan main attributes."""
+        return f"IntexSpaSpan({self.name!r}, {self.attributes!r}, {self.duration!r})"
+
+
+class IntexSpaTracer:
+    """Report the spans of the conversations with spas to callbacks.
+
+    Lightweight tracer exposing the `start_as_current_span` method of
+    OpenTelemetry tracers, which the spa objects call: an OpenTelemetry tracer
+    can be attached instead, without this package depending on OpenTelemetry.
+
+    Attributes
+    ----------
+    on_start : Callable[[IntexSpaSpan], None] | None
+        The callback called with each span when it starts
+    on_end : Callable[[IntexSpaSpan], None] | None
+        The callback called with each span when it ends
+
+    """
+
+    def __init__(
+        self,
+        on_start: Callable[[IntexSpaSpan], None] = None,
+        on_end: Callable[[IntexSpaSpan], None] = None,
+    ):
+        """Initialize IntexSpaTracer class.
+
+        Parameters
+        ----------
+        on_start : Callable[[IntexSpaSpan], None], optional
+            The callback called with each span when it starts
+        on_end : Callable[[IntexSpaSpan], None], optional
+            The callback called with each span when it ends,
+            its duration and exception known
+
+        """
+        self.on_start = on_start
+        self.on_end = on_end
+
+    @contextlib.contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: dict = None, **kwargs
+    ) -> Iterator[IntexSpaSpan]:
+        """Start a span, nested in the current span, for the context duration.
+
+        Parameters
+        ----------
+        name : str
+            The name of the span
+        attributes : dict, optional
+            The attributes of the span
+        **kwargs
+            Other OpenTelemetry arguments, ignored
+
+        """
+        span = IntexSpaSpan(name, attributes, _CURRENT_SPAN.get())
+        token = _CURRENT_SPAN.set(span)
+        if self.on_start is not None:
+            self.on_start(span)
+        try:
+            yield span
+        except BaseException as err:
+            span.record_exception(err)
+            raise
+        finally:
+            span.end_time = time.perf_counter()
+            _CURRENT_SPAN.reset(token)
+            if self.on_end is not None:
+                self.on_end(span)
@@ -0,0 +1,177 @@
+"""Benchmark the protocol codec hot path.
+
+Usage:
+    python benchmarks/bench_codec.py [--json results.json] [--compare baseline.json]
+
+Each benchmark is timed with `timeit`, repeated, and reported in nanoseconds per call.
+The JSON output can be kept as a baseline, and later runs compared against it.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aio_intex_spa.intex_spa_object_status import IntexSpaStatus  # noqa: E402
+from aio_intex_spa.intex_spa_query import (  # noqa: E402
+    IntexSpaQuery,
+    checksum_as_int,
+    checksum_as_str,
+    checksum_of_bytes,
+    decode_status_frame,
+    decode_status_frames,
+    parse_status_response,
+)
+
+SID = "12345678901234"
+STATUS_DATA = "FFFF110F010700220000000080808022000012"
+STATUS_RESPONSE = (
+    b'{"sid":"' + SID.encode() + b'","data":"' + STATUS_DATA.encode() + b'",'
+    b'"result":"ok","type":2}\n'
+)
+INFO_RESPONSE = (
+    b'{"sid":"' + SID.encode() + b'","data":"{\\"ip\\":\\"192.168.1.2\\",'
+    b'\\"uid\\":\\"0123456789\\",\\"dtype\\":\\"spa\\"}","result":"ok","type":3}\n'
+)
+STATUS_INT = int("0x" + STATUS_DATA, 16)
+
+BENCHMARKS: dict[str, Callable[[], object]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark function under `name`."""
+
+    def _register(function: Callable[[], object]) -> Callable[[], object]:
+        BENCHMARKS[name] = function
+        return function
+
+    return _register
+
+
+def _query(intent: str, preset_temp: int = None) -> IntexSpaQuery:
+    query = IntexSpaQuery(intent, preset_temp)
+    query.intex_timestamp = SID
+    return query
+
+
+# Checksums
+
+benchmark("checksum_as_int")(lambda: checksum_as_int(STATUS_DATA[:-2]))
+benchmark("checksum_as_str")(lambda: checksum_as_str("8888060F014000"))
+_status_frame = bytes.fromhex(STATUS_DATA)
+benchmark("checksum_of_bytes")(lambda: checksum_of_bytes(_status_frame[:-1]))
+benchmark("decode_status_frame[bytes]")(lambda: decode_status_frame(_status_frame))
+benchmark("decode_status_frame[str]")(lambda: decode_status_frame(STATUS_DATA))
+_status_frames = [_status_frame] * 1000
+benchmark("decode_status_frames[x1000]")(lambda: decode_status_frames(_status_frames))
+
+# Requests
+
+benchmark("query_init[status]")(lambda: IntexSpaQuery("status"))
+benchmark("query_init[preset_temp]")(lambda: IntexSpaQuery("preset_temp", 38))
+
+_status_query = _query("status")
+_preset_temp_query = _query("preset_temp", 38)
+benchmark("request_bytes[status]")(lambda: _status_query.request_bytes)
+benchmark("request_bytes[preset_temp]")(lambda: _preset_temp_query.request_bytes)
+benchmark("request_bytes[status,json]")(_status_query._request_bytes_json)
+
+# Responses
+
+benchmark("render_response_data[status]")(
+    lambda: _status_query.render_response_data(STATUS_RESPONSE)
+)
+benchmark("render_response_data[status,json]")(
+    lambda: _status_query._render_response_data_json(STATUS_RESPONSE)
+)
+benchmark("parse_status_response")(lambda: parse_status_response(STATUS_RESPONSE, SID))
+_info_query = _query("info")
+benchmark("render_response_data[info]")(
+    lambda: _info_query.render_response_data(INFO_RESPONSE)
+)
+
+# Status
+
+benchmark("status_init")(lambda: IntexSpaStatus(STATUS_INT))
+_status = IntexSpaStatus(STATUS_INT)
+for _property in (
+    "power",
+    "filter",
+    "heater",
+    "jets",
+    "bubbles",
+    "sanitizer",
+    "unit",
+    "current_temp",
+    "error_code",
+    "preset_temp",
+):
+    benchmark(f"status.{_property}")(
+        lambda _property=_property: getattr(_status, _property)
+    )
+benchmark("status.as_dict")(_status.as_dict)
+
+
+def run(function: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """Time `function`, and return its statistics in nanoseconds per call."""
+    timer = timeit.Timer(function)
+    number, duration = timer.autorange()
+    # Scale the number of loops so that each repeat lasts at least min_time
+    if duration < min_time:
+        number = int(number * min_time / duration) + 1
+    timings = [duration * 1e9 / number for duration in timer.repeat(repeat, number)]
+    return {
+        "loops": number,
+        "min_ns": min(timings),
+        "median_ns": statistics.median(timings),
+        "stdev_ns": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def main() -> None:
+    """Run the benchmarks and report their results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare against this JSON results file")
+    parser.add_argument("--filter", default="", help="only run matching benchmarks")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["benchmarks"]
+
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = run(function, args.repeat, args.min_time)
+        line = f"{name:<40} {results[name]['min_ns']:>10.1f} ns"
+        if name in baseline:
+            ratio = baseline[name]["min_ns"] / results[name]["min_ns"]
+            line += f"  x{ratio:.2f} vs baseline"
+        print(line)
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "machine": platform.machine(),
+                    "benchmarks": results,
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark spa conversations against local emulated spas.
+
+Usage:
+    python benchmarks/bench_network.py [--spas 100] [--queries 20] [--json results.json]
+
+Each emulated spa is queried sequentially, all spas concurrently on one event loop,
+over asyncio streams, over the asyncio protocol network layer, and over asyncio
+streams with metrics collected.
+Throughput and latency percentiles are reported for each.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aio_intex_spa import IntexSpa, IntexSpaMetrics  # noqa: E402
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator  # noqa: E402
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the given percentile of the values."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def async_run(spas: list[IntexSpa], queries: int) -> dict:
+    """Query every spa `queries` times, and return throughput and latencies."""
+    latencies = []
+
+    async def _async_query_spa(spa: IntexSpa) -> None:
+        for _ in range(queries):
+            start = time.perf_counter()
+            await spa.async_update_status()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_async_query_spa(spa) for spa in spas))
+    duration = time.perf_counter() - start
+
+    return {
+        "queries": len(latencies),
+        "throughput_qps": len(latencies) / duration,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    """Run the benchmarks against fresh emulated spas."""
+    emulators = [IntexSpaEmulator(latency=args.latency) for _ in range(args.spas)]
+    for emulator in emulators:
+        await emulator.async_start()
+
+    results = {}
+    for name, use_protocol, metrics in (
+        ("streams", False, None),
+        ("protocol", True, None),
+        ("streams+metrics", False, IntexSpaMetrics()),
+    ):
+        spas = [
+            IntexSpa(
+                "127.0.0.1", emulator.port, use_protocol=use_protocol, metrics=metrics
+            )
+            for emulator in emulators
+        ]
+        # Warm up connections
+        await asyncio.gather(*(spa.async_update_status() for spa in spas))
+        results[name] = await async_run(spas, args.queries)
+        print(
+            f"{name:<16} {results[name]['throughput_qps']:>10.0f} q/s"
+            f"  p50 {results[name]['p50_ms']:.2f} ms"
+            f"  p99 {results[name]['p99_ms']:.2f} ms"
+        )
+        for spa in spas:
+            await spa.network.async_force_disconnect()
+    # Let the emulators notice the closed connections
+    await asyncio.sleep(0.1)
+
+    for emulator in emulators:
+        await emulator.async_stop()
+    return results
+
+
+def main() -> None:
+    """Run the benchmarks and report their results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spas", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_main(args))
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "arguments": vars(args),
+                    "benchmarks": results,
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Find the highest query rate a spa handles without errors.
+
+Usage:
+    python benchmarks/bench_rate_limit.py [--max-rate 20] [--queries 50] [--json results.json]
+
+Status queries are sent back-to-back through an IntexSpaRateLimiter to an emulated
+spa overloaded above `--max-rate` queries per second, or to a real spa with
+`--address`. The limiter rate is searched by bisection, each rate being kept only
+if all its queries succeed without retry.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aio_intex_spa import (  # noqa: E402
+    IntexSpa,
+    IntexSpaRateLimiter,
+    IntexSpaRetryStrategy,
+    IntexSpaUnreachableException,
+)
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator  # noqa: E402
+
+
+async def async_run(address: str, port: str, rate: float, args) -> dict:
+    """Send `queries` status queries at `rate`, and return their results."""
+    rate_limiter = IntexSpaRateLimiter(rate, args.burst)
+    spa = IntexSpa(
+        address,
+        port,
+        retry_strategy=IntexSpaRetryStrategy(budget=1),
+        rate_limiter=rate_limiter,
+    )
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(args.queries):
+        try:
+            await spa.async_update_status()
+        except IntexSpaUnreachableException:
+            errors += 1
+    duration = time.perf_counter() - start
+    await spa.network.async_force_disconnect()
+    # Let the device recover before the next run
+    await asyncio.sleep(args.cooldown)
+    return {
+        "rate": rate,
+        "errors": errors,
+        "throughput_qps": args.queries / duration,
+        **{f"limiter_{key}": value for key, value in rate_limiter.stats().items()},
+    }
+
+
+async def async_bisect(address: str, port: str, args) -> dict:
+    """Search the highest error-free rate between `--low` and `--high`."""
+    runs = []
+    low, high = args.low, args.high
+    best = None
+    while high - low > args.precision:
+        rate = (low + high) / 2
+        result = await async_run(address, port, rate, args)
+        runs.append(result)
+        print(
+            f"rate {rate:>8.2f} q/s  errors {result['errors']:>4}"
+            f"  throughput {result['throughput_qps']:>8.2f} q/s"
+            f"  throttled {result['limiter_throttled']:>4}"
+        )
+        if result["errors"]:
+            high = rate
+        else:
+            low = rate
+            best = rate
+    print(f"highest error-free rate: {best} q/s" if best else "no error-free rate")
+    return {"safe_rate": best, "runs": runs}
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    """Run the benchmark against a real or emulated spa."""
+    if args.address:
+        return await async_bisect(args.address, args.port, args)
+    async with IntexSpaEmulator(max_rate=args.max_rate) as emulator:
+        return await async_bisect("127.0.0.1", emulator.port, args)
+
+
+def main() -> None:
+    """Run the benchmark and report its results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--address", help="benchmark this spa instead of an emulator")
+    parser.add_argument("--port", default="8990")
+    parser.add_argument("--max-rate", type=float, default=20.0)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--low", type=float, default=1.0)
+    parser.add_argument("--high", type=float, default=100.0)
+    parser.add_argument("--precision", type=float, default=1.0)
+    parser.add_argument("--cooldown", type=float, default=1.0)
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_main(args))
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "arguments": vars(args),
+                    "benchmarks": results,
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
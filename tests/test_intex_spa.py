@@ -0,0 +1,218 @@
+"""Load IntexSpa tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import (
+    IntexSpa,
+    IntexSpaPreemptedException,
+    IntexSpaTimeoutException,
+)
+from aio_intex_spa.intex_spa_emulator import FUNCTION_BITS, IntexSpaEmulator
+from aio_intex_spa.intex_spa_object_status import STATUS_FIELDS
+
+
+def test_intex_spa_update_status_coalescing():
+    """Assert concurrent status updates share one spa query."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.05) as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            statuses = await asyncio.gather(
+                *(spa.async_update_status() for _ in range(10))
+            )
+            assert emulator.requests_count == 1
+            assert all(status is statuses[0] for status in statuses)
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_update_status_max_age():
+    """Assert a fresh enough status is returned without querying the spa."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            assert spa.status_age is None
+            status = await spa.async_update_status(max_age=60)
+            assert emulator.requests_count == 1
+            assert await spa.async_update_status(max_age=60) is status
+            assert emulator.requests_count == 1
+            await spa.async_update_status(max_age=0)
+            assert emulator.requests_count == 2
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_command_with_fresh_status():
+    """Assert commands skip the preliminary query, and correct stale toggles."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port, command_status_max_age=60)
+            await spa.async_update_status()
+            assert emulator.requests_count == 1
+
+            status = await spa.async_set_jets(True)
+            assert status.jets
+            assert emulator.requests_count == 2
+
+            # The heater is turned off behind the back of the known status
+            emulator.raw_status ^= 1 << FUNCTION_BITS["heater"]
+            status = await spa.async_set_heater(False)
+            assert status.heater is False
+            assert emulator.requests_count == 4
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_apply():
+    """Assert a batch of expected states only sends the needed commands."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            status = await spa.async_apply(
+                {"heater": True, "jets": True, "bubbles": False, "preset_temp": 38}
+            )
+            assert status.heater
+            assert status.jets
+            assert status.bubbles is False
+            assert status.preset_temp == 38
+            # One status update, then the jets and preset_temp commands
+            assert emulator.requests_count == 3
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_command_listeners(caplog):
+    """Assert command listener errors are logged, without failing the command."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            intents = []
+
+            def _failing_listener(_intent):
+                raise RuntimeError("listener error")
+
+            spa.add_command_listener(_failing_listener)
+            remove_listener = spa.add_command_listener(intents.append)
+            status = await spa.async_apply({"jets": True, "preset_temp": 38})
+            assert status.jets
+            assert status.preset_temp == 38
+            assert intents == ["jets", "preset_temp"]
+            assert "command listener error" in caplog.text
+
+            remove_listener()
+            remove_listener()
+            await spa.async_set_jets(False)
+            assert intents == ["jets", "preset_temp"]
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_pipelined():
+    """Assert pipelined queries and sequential commands on one connection."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.01) as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port, max_in_flight=4)
+            info, _, status = await asyncio.gather(
+                spa.async_update_info(),
+                spa.async_set_heater(False),
+                spa.async_set_jets(True),
+            )
+            assert info.dtype == "spa"
+            assert status.jets
+            assert spa.status.heater is False
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_timeout():
+    """Assert an intent never outlasts its deadline."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=5) as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port, timeout=0.2)
+            with pytest.raises(IntexSpaTimeoutException):
+                await spa.async_set_heater(False)
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_command_priority():
+    """Assert commands are sent before queued queries, and can cancel them."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.01) as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            done = []
+
+            def _create_task(name, coroutine):
+                task = asyncio.create_task(coroutine)
+                task.add_done_callback(lambda _: done.append(name))
+                return task
+
+            # Queue an info query, then a command, while the spa is busy
+            async with spa._semaphore.hold():
+                info = _create_task("info", spa.async_update_info())
+                await asyncio.sleep(0.01)
+                command = _create_task("command", spa.async_set_jets(True))
+                await asyncio.sleep(0.01)
+            await asyncio.gather(info, command)
+            assert done == ["command", "info"]
+            assert spa.status.jets
+
+            # Queued queries are cancelled, commands go on
+            async with spa._semaphore.hold():
+                info = asyncio.create_task(spa.async_update_info())
+                command = asyncio.create_task(spa.async_set_jets(False))
+                await asyncio.sleep(0.01)
+                assert spa.cancel_queued_queries() == 1
+            with pytest.raises(IntexSpaPreemptedException):
+                await info
+            assert (await command).jets is False
+
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_changes():
+    """Assert every subscriber gets the changed fields only, in order."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            first, second = spa.changes(), spa.changes()
+            await spa.async_update_status()
+            await spa.async_update_status(max_age=0)
+            await spa.async_set_jets(True)
+
+            for changes in (first, second):
+                change = await anext(changes)
+                assert change.fields == STATUS_FIELDS
+                assert change.previous.as_dict()["jets"] is None
+                change = await anext(changes)
+                assert change.as_dict() == {"jets": True}
+                assert change.status is spa.status
+
+            # A subscriber waits for the next change
+            task = asyncio.create_task(anext(first))
+            await asyncio.sleep(0)
+            emulator.raw_status ^= 1 << FUNCTION_BITS["bubbles"]
+            await spa.async_update_status(max_age=0)
+            assert (await task).as_dict() == {"bubbles": True}
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
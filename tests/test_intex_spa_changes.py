@@ -0,0 +1,78 @@
+"""Load IntexSpaChangeFeed tests."""
+
+import asyncio
+import gc
+
+from aio_intex_spa.intex_spa_changes import IntexSpaChangeFeed, IntexSpaStatusChange
+
+
+def _change(number: int) -> IntexSpaStatusChange:
+    return IntexSpaStatusChange((f"field_{number}",), None, None)
+
+
+async def _async_consume(changes) -> list:
+    return [change async for change in changes]
+
+
+def test_intex_spa_change_feed_backlog():
+    """Assert slow subscribers skip the oldest changes, memory staying bounded."""
+
+    async def _async_test():
+        feed = IntexSpaChangeFeed(max_backlog=3)
+        slow, fast = feed.subscribe(), feed.subscribe()
+        for number in range(5):
+            feed.publish(_change(number))
+            assert (await anext(fast)).fields == (f"field_{number}",)
+        assert len(feed._changes) == 3
+
+        assert [(await anext(slow)).fields for _ in range(3)] == [
+            ("field_2",),
+            ("field_3",),
+            ("field_4",),
+        ]
+        assert slow.dropped == 2
+        assert fast.dropped == 0
+
+        # A waiting subscriber gets the next change
+        task = asyncio.create_task(anext(slow))
+        await asyncio.sleep(0)
+        feed.publish(_change(5))
+        assert (await task).fields == ("field_5",)
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_change_feed_close():
+    """Assert closed or dropped subscriptions stop the publication of changes."""
+
+    async def _async_test():
+        feed = IntexSpaChangeFeed()
+        assert not feed.subscribed
+        changes = feed.subscribe()
+        assert feed.subscribed
+
+        await changes.aclose()
+        assert not feed.subscribed
+        feed.publish(_change(0))
+        assert len(feed._changes) == 0
+        assert [change async for change in changes] == []
+
+        # A consumer waiting for a change stops once the subscription is closed
+        changes, other_changes = feed.subscribe(), feed.subscribe()
+        task = asyncio.create_task(anext(other_changes))
+        consumer = asyncio.create_task(_async_consume(changes))
+        await asyncio.sleep(0)
+        await changes.aclose()
+        async with asyncio.timeout(1):
+            assert await consumer == []
+        assert not task.done()
+        feed.publish(_change(1))
+        assert (await task).fields == ("field_1",)
+        other_changes.close()
+
+        changes = feed.subscribe()
+        del changes
+        gc.collect()
+        assert not feed.subscribed
+
+    asyncio.run(_async_test())
@@ -0,0 +1,119 @@
+"""Load connection manager tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import IntexSpa, IntexSpaConnectionManager, IntexSpaMetrics
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+
+
+async def _async_wait_for(condition) -> None:
+    async with asyncio.timeout(2):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.parametrize("use_protocol", [False, True])
+def test_intex_spa_connection_manager_idle_timeout(use_protocol: bool):
+    """Assert an idle connection is closed, and reopened on demand."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port, use_protocol=use_protocol)
+            manager = IntexSpaConnectionManager(
+                spa, idle_timeout=0.05, check_interval=0.01
+            )
+            manager.start()
+            await spa.async_update_status()
+            assert spa.network.connected
+
+            await _async_wait_for(lambda: not spa.network.connected)
+            # The connection closed for idleness is not reopened in the background
+            await asyncio.sleep(0.05)
+            assert not spa.network.connected
+
+            status = await spa.async_update_status()
+            assert status.preset_temp == 34
+
+            await manager.async_stop()
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+@pytest.mark.parametrize("use_protocol", [False, True])
+def test_intex_spa_connection_manager_reconnect(use_protocol: bool):
+    """Assert a lost connection is reopened in the background."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port, use_protocol=use_protocol)
+            manager = IntexSpaConnectionManager(spa, check_interval=0.01)
+            manager.start()
+            await spa.async_update_status()
+            await _async_wait_for(lambda: manager._keep_connected)
+
+            # The connection is lost between two requests
+            await spa.network.async_force_disconnect()
+            assert not spa.network.connected
+            await _async_wait_for(lambda: spa.network.connected)
+
+            # The next request does not pay for the reconnection
+            requests_count = emulator.requests_count
+            await spa.async_update_status()
+            assert emulator.requests_count == requests_count + 1
+
+            await manager.async_stop()
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_connection_manager_heartbeat():
+    """Assert an idle connection is probed, and reopened once the spa is back."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            metrics = IntexSpaMetrics()
+            spa = IntexSpa("127.0.0.1", emulator.port, metrics=metrics)
+            manager = IntexSpaConnectionManager(
+                spa, heartbeat_interval=0.05, check_interval=0.01, reconnect_delay=0.01
+            )
+            manager.start()
+
+            # The connection is opened, then kept warm with status queries
+            await _async_wait_for(lambda: emulator.requests_count >= 3)
+            assert spa.status.preset_temp == 34
+            assert spa.network.connected
+
+            # The spa drops the probes: the known status is kept
+            status = spa.status
+            changes = spa.changes()
+            emulator.drop_rate = 1
+            await _async_wait_for(lambda: metrics.disconnects >= 2)
+            assert spa.status is status
+            assert spa.status_age >= 0.05
+            emulator.drop_rate = 0
+
+            # The connection is reopened, and probed again
+            await _async_wait_for(lambda: spa.status_age < 0.05)
+            assert spa.network.connected
+            assert spa.status == status
+            # No change was ever published
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.01):
+                    await anext(changes)
+
+            await manager.async_stop()
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_connection_manager_conflicting_options():
+    """Assert a connection cannot both time out and be kept warm."""
+    with pytest.raises(ValueError):
+        IntexSpaConnectionManager(
+            IntexSpa("127.0.0.1"), idle_timeout=60, heartbeat_interval=10
+        )
@@ -0,0 +1,80 @@
+"""Load connection pool tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import IntexSpa, IntexSpaConnectionPool
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+
+
+@pytest.mark.parametrize("use_protocol", [False, True])
+def test_intex_spa_connection_pool_eviction(use_protocol: bool):
+    """Assert the least recently used idle connections are closed."""
+
+    async def _async_test():
+        emulators = [IntexSpaEmulator() for _ in range(3)]
+        for emulator in emulators:
+            await emulator.async_start()
+        pool = IntexSpaConnectionPool(max_connections=2)
+        spa1, spa2, spa3 = (
+            IntexSpa("127.0.0.1", emulator.port, use_protocol=use_protocol, pool=pool)
+            for emulator in emulators
+        )
+
+        await spa1.async_update_status()
+        await spa2.async_update_status()
+        # spa2 is now the least recently used
+        await spa1.async_update_status()
+        assert pool.open_connections == 2
+
+        await spa3.async_update_status()
+        assert pool.open_connections == 2
+        assert spa1.network.connected
+        assert not spa2.network.connected
+        assert spa3.network.connected
+
+        await spa2.async_update_status()
+        assert not spa1.network.connected
+
+        stats = pool.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 4
+        assert stats["hit_rate"] == 0.2
+        assert stats["evictions"] == 2
+        assert stats["connects"] == 4
+        assert stats["mean_connect_time"] > 0
+
+        for spa in (spa1, spa2, spa3):
+            await spa.network.async_force_disconnect()
+        assert pool.open_connections == 0
+        for emulator in emulators:
+            await emulator.async_stop()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_connection_pool_wait():
+    """Assert connections wait for a slot while all connections are busy."""
+
+    async def _async_test():
+        emulators = [IntexSpaEmulator(latency=0.05) for _ in range(5)]
+        for emulator in emulators:
+            await emulator.async_start()
+        pool = IntexSpaConnectionPool(max_connections=2)
+        spas = [
+            IntexSpa("127.0.0.1", emulator.port, pool=pool) for emulator in emulators
+        ]
+
+        statuses = await asyncio.gather(*(spa.async_update_status() for spa in spas))
+        assert all(status.preset_temp == 34 for status in statuses)
+        assert pool.open_connections <= 2
+        assert sum(spa.network.connected for spa in spas) <= 2
+        assert pool.wait_time > 0
+
+        for spa in spas:
+            await spa.network.async_force_disconnect()
+        for emulator in emulators:
+            await emulator.async_stop()
+
+    asyncio.run(_async_test())
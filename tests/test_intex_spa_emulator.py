@@ -0,0 +1,69 @@
+"""Load emulator tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import IntexSpa
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+from aio_intex_spa.intex_spa_network_layer import IntexSpaNetworkLayer
+from aio_intex_spa.intex_spa_query import IntexSpaQuery
+
+
+def test_intex_spa_emulator_conversation():
+    """Assert IntexSpa can update, command and query info on the emulator."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+
+            status = await spa.async_update_status()
+            assert status.heater
+            assert status.jets is False
+
+            status = await spa.async_set_heater(False)
+            assert status.heater is False
+            status = await spa.async_set_jets(True)
+            assert status.jets
+            status = await spa.async_set_preset_temp(38)
+            assert status.preset_temp == 38
+            # Setting an already reached state sends no command
+            requests_count = emulator.requests_count
+            await spa.async_set_jets(True)
+            assert emulator.requests_count == requests_count + 1
+
+            info = await spa.async_update_info()
+            assert info.dtype == "spa"
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_emulator_malformed_reply():
+    """Assert malformed emulator replies are rejected by IntexSpaQuery."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(malformed_rate=1) as emulator:
+            network = IntexSpaNetworkLayer("127.0.0.1", emulator.port)
+            query = IntexSpaQuery("status")
+            await network.async_send(query.request_bytes)
+            received_bytes = await network.async_receive()
+            await network.async_force_disconnect()
+        with pytest.raises(AssertionError):
+            query.render_response_data(received_bytes)
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_emulator_dropped_connection():
+    """Assert the emulator can drop connections instead of replying."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(drop_rate=1) as emulator:
+            network = IntexSpaNetworkLayer("127.0.0.1", emulator.port)
+            await network.async_send(IntexSpaQuery("status").request_bytes)
+            with pytest.raises(ConnectionResetError):
+                await network.async_receive()
+            await network.async_force_disconnect()
+
+    asyncio.run(_async_test())
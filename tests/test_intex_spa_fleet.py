@@ -0,0 +1,105 @@
+"""Load fleet tests."""
+
+import asyncio
+import time
+
+from aio_intex_spa import IntexSpa, IntexSpaFleet, IntexSpaUnreachableException
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+from aio_intex_spa.intex_spa_object_status import IntexSpaStatus
+
+STATUS_INT = int("0x" + "FFFF110F010700220000000080808022000012", 16)
+
+
+class FakeIntexSpa(IntexSpa):
+    """IntexSpa answering after `delay` seconds, or failing."""
+
+    def __init__(self, delay: float = 0, error: Exception = None):
+        """Initialize FakeIntexSpa."""
+        super().__init__()
+        self.delay = delay
+        self.error = error
+
+    async def async_update_status(self) -> IntexSpaStatus:
+        """Fake a status update."""
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        self.status = IntexSpaStatus(STATUS_INT)
+        return self.status
+
+
+async def _async_sweep(fleet: IntexSpaFleet) -> list:
+    return [item async for item in fleet.async_iter_update_status()]
+
+
+def test_intex_spa_fleet_isolates_failing_spas():
+    """Assert slow and failing spas neither block nor break the sweep."""
+    spas = {f"spa{index}": FakeIntexSpa(delay=0.01) for index in range(50)}
+    spas["slow"] = FakeIntexSpa(delay=60)
+    spas["broken"] = FakeIntexSpa(error=IntexSpaUnreachableException())
+    fleet = IntexSpaFleet(spas, max_concurrency=10, timeout=0.2)
+
+    start = time.monotonic()
+    results = asyncio.run(_async_sweep(fleet))
+    assert time.monotonic() - start < 2
+
+    names = [name for name, _ in results]
+    assert sorted(names) == sorted(spas)
+    # Results are delivered as each spa answers
+    assert names[-1] == "slow"
+
+    results = dict(results)
+    assert isinstance(results["slow"], TimeoutError)
+    assert isinstance(results["broken"], IntexSpaUnreachableException)
+    assert results["spa0"].current_temp == 34
+
+
+def test_intex_spa_fleet_limits_concurrency():
+    """Assert no more than `max_concurrency` spas are queried at once."""
+    in_flight = 0
+    peak = 0
+
+    class CountingIntexSpa(FakeIntexSpa):
+        async def async_update_status(self) -> IntexSpaStatus:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await super().async_update_status()
+            finally:
+                in_flight -= 1
+
+    spas = {f"spa{index}": CountingIntexSpa(delay=0.01) for index in range(40)}
+    fleet = IntexSpaFleet(spas, max_concurrency=5)
+    results = asyncio.run(fleet.async_update_status())
+    assert len(results) == 40
+    assert peak == 5
+
+
+def test_intex_spa_fleet_with_emulators():
+    """Assert an unresponsive spa is abandoned, and its query cancelled."""
+
+    async def _async_test():
+        emulators = [IntexSpaEmulator() for _ in range(5)]
+        emulators.append(IntexSpaEmulator(latency=60))
+        for emulator in emulators:
+            await emulator.async_start()
+        spas = {
+            emulator.port: IntexSpa("127.0.0.1", emulator.port)
+            for emulator in emulators
+        }
+        fleet = IntexSpaFleet(spas, timeout=0.5)
+
+        results = await fleet.async_update_status()
+        assert isinstance(results.pop(emulators[-1].port), TimeoutError)
+        assert all(status.heater for status in results.values())
+        # The abandoned conversation is cancelled and its connection dropped
+        await asyncio.sleep(0.1)
+        assert spas[emulators[-1].port].network.writer is None
+
+        for spa in spas.values():
+            await spa.network.async_force_disconnect()
+        for emulator in emulators:
+            await emulator.async_stop()
+
+    asyncio.run(_async_test())
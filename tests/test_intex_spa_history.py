@@ -0,0 +1,99 @@
+"""Load IntexSpaHistory tests."""
+
+import pytest
+
+from aio_intex_spa import IntexSpaHistory
+from aio_intex_spa.intex_spa_emulator import DEFAULT_RAW_STATUS, FUNCTION_BITS
+from aio_intex_spa.intex_spa_history import FUNCTION_MASKS
+from aio_intex_spa.intex_spa_object_status import (
+    IntexSpaStatus,
+    IntexSpaStatusSnapshot,
+)
+
+
+def _status(current_temp: int, jets: bool = False) -> IntexSpaStatusSnapshot:
+    raw_status = DEFAULT_RAW_STATUS ^ (0x22 ^ current_temp) << 88
+    if jets:
+        raw_status ^= 1 << FUNCTION_BITS["jets"]
+    return IntexSpaStatusSnapshot(raw_status)
+
+
+def test_intex_spa_history_ring():
+    """Assert the history keeps the newest samples, viewed without copy."""
+    history = IntexSpaHistory(capacity=4)
+    history.append(IntexSpaStatus(), timestamp=0.0)
+    assert len(history) == 0
+    assert len(history.window()) == 0
+
+    for second in range(6):
+        history.append(_status(30 + second, jets=second % 2), timestamp=second)
+    assert len(history) == 4
+
+    window = history.window()
+    assert list(window.timestamps) == [2.0, 3.0, 4.0, 5.0]
+    assert list(window.current_temps) == [32, 33, 34, 35]
+    assert list(window.preset_temps) == [34] * 4
+    assert [bool(bits & FUNCTION_MASKS["jets"]) for bits in window.functions] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert isinstance(window.timestamps, memoryview)
+
+    assert list(history.window(3, 4).timestamps) == [3.0, 4.0]
+    assert list(history.window(start_time=4.5).current_temps) == [35]
+    assert len(history.window(end_time=1)) == 0
+
+    # From a temperature to an error code, E81
+    history.append(_status(0xB5), timestamp=6)
+    assert history.window(6).current_temps[0] == 0
+    assert history.window(6).error_codes[0] == 81
+
+    # A sample costs 8 bytes, written twice
+    assert history.nbytes / history.capacity == 16
+
+
+def test_intex_spa_history_base_time():
+    """Assert the times are kept to the second, from the first sample."""
+    history = IntexSpaHistory(capacity=4)
+    assert history.base_time is None
+    assert len(history.window(0, 10)) == 0
+
+    for second in range(4):
+        history.append(_status(30), timestamp=1_700_000_000.4 + second)
+    assert history.base_time == 1_700_000_000.4
+
+    window = history.window(start_time=1_700_000_001)
+    assert window.base_time == history.base_time
+    assert list(window.timestamps) == [1, 2, 3]
+
+
+def test_intex_spa_history_downsample():
+    """Assert the temperatures are aggregated by bucket, errors skipped."""
+    history = IntexSpaHistory(capacity=100)
+    for second, current_temp in enumerate((30, 32, 31, 0xB5, 33, 35, 36)):
+        history.append(_status(current_temp), timestamp=100 + second)
+
+    assert history.downsample("current_temp", 3) == [
+        (100, 30, 32, 31.0),
+        (103, 33, 35, 34.0),
+        (106, 36, 36, 36.0),
+    ]
+    assert history.downsample("preset_temp", 10, start_time=95) == [
+        (95, 34, 34, 34.0),
+        (105, 34, 34, 34.0),
+    ]
+    assert history.downsample("current_temp", 3, start_time=200) == []
+
+    # The preset temperature is still known on error
+    raw_status = DEFAULT_RAW_STATUS ^ (0x22 ^ 0xB5) << 88 ^ (34 ^ 40) << 24
+    history.append(IntexSpaStatusSnapshot(raw_status), timestamp=107)
+    assert history.downsample("preset_temp", 10, start_time=100) == [
+        (100, 34, 40, 34.75),
+    ]
+    assert history.downsample("current_temp", 10, start_time=100) == [
+        (100, 30, 36, 32.833333333333336),
+    ]
+    with pytest.raises(ValueError):
+        history.downsample("jets", 3)
@@ -0,0 +1,125 @@
+"""Load IntexSpaHistoryFile tests."""
+
+import asyncio
+import contextlib
+import gc
+
+import pytest
+
+from aio_intex_spa import (
+    IntexSpa,
+    IntexSpaHistoryFile,
+    IntexSpaHistoryReader,
+    IntexSpaRetryPolicy,
+    IntexSpaRetryStrategy,
+    IntexSpaUnreachableException,
+)
+from aio_intex_spa.intex_spa_emulator import (
+    DEFAULT_RAW_STATUS,
+    FUNCTION_BITS,
+    IntexSpaEmulator,
+)
+from aio_intex_spa.intex_spa_history_file import MAGIC, RECORD_SIZE
+from aio_intex_spa.intex_spa_object_status import (
+    IntexSpaStatus,
+    IntexSpaStatusSnapshot,
+)
+
+
+def _status(current_temp: int) -> IntexSpaStatusSnapshot:
+    return IntexSpaStatusSnapshot(DEFAULT_RAW_STATUS ^ (0x22 ^ current_temp) << 88)
+
+
+def test_intex_spa_history_file(tmp_path):
+    """Assert records are appended, then range queried through a memory map."""
+    path = tmp_path / "garden.history"
+    with IntexSpaHistoryFile(path) as history_file:
+        for second in range(10):
+            history_file.append(_status(30 + second), timestamp=1000.0 + second)
+    assert path.stat().st_size == len(MAGIC) + 10 * RECORD_SIZE
+
+    # A partially written record is dropped on reopening
+    with open(path, "ab") as file:
+        file.write(b"\x00" * 5)
+    with IntexSpaHistoryFile(path) as history_file:
+        history_file.append(_status(40), timestamp=1010.0)
+        # An outage, the status being unknown until the spa is reachable again
+        history_file.append(IntexSpaStatus(), timestamp=1011.0)
+        history_file.append(_status(41), timestamp=1020.0)
+
+    with IntexSpaHistoryReader(path) as reader:
+        assert len(reader) == 13
+        records = reader.range(1003, 1005.5)
+        assert len(records) == 3
+        assert [status.current_temp for _, status in records] == [33, 34, 35]
+        timestamp, status = records[-1]
+        assert timestamp == 1005.0
+        assert status == _status(35)
+        assert reader.range(1010)[0][1].current_temp == 40
+        assert list(reader.range(1010.5, 1019)) == [(1011.0, IntexSpaStatusSnapshot())]
+        assert reader.range(1019)[0][1].current_temp == 41
+        assert len(reader.range(end_time=999)) == 0
+        assert len(reader.range(2000)) == 0
+        assert len(reader.range()) == 13
+        with pytest.raises(IndexError):
+            records[3]
+
+    (tmp_path / "other.json").write_text("{}")
+    with pytest.raises(ValueError):
+        IntexSpaHistoryReader(tmp_path / "other.json")
+
+
+@pytest.mark.filterwarnings("error::ResourceWarning")
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_intex_spa_history_file_bad_header(tmp_path):
+    """Assert other files are refused, left untouched and closed."""
+    path = tmp_path / "other.json"
+    path.write_text('{"spa": "garden"}')
+    with pytest.raises(ValueError):
+        IntexSpaHistoryFile(path)
+    gc.collect()
+    assert path.read_text() == '{"spa": "garden"}'
+
+
+def test_intex_spa_history_file_record(tmp_path):
+    """Assert the changes of the spa status are recorded."""
+    path = tmp_path / "garden.history"
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa(
+                "127.0.0.1",
+                emulator.port,
+                retry_strategy=IntexSpaRetryStrategy(
+                    network=IntexSpaRetryPolicy(base_delay=0)
+                ),
+            )
+            with IntexSpaHistoryFile(path) as history_file:
+                task = asyncio.create_task(history_file.async_record(spa))
+                await asyncio.sleep(0)
+                await spa.async_update_status()
+                await spa.async_update_status(max_age=0)
+                emulator.raw_status ^= 1 << FUNCTION_BITS["bubbles"]
+                await spa.async_update_status(max_age=0)
+                # An outage
+                emulator.drop_rate = 1
+                with pytest.raises(IntexSpaUnreachableException):
+                    await spa.async_update_status(max_age=0)
+                emulator.drop_rate = 0
+                await spa.async_update_status(max_age=0)
+                await asyncio.sleep(0)
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+                # Unsubscribed once cancelled
+                assert not spa._change_feed.subscribed
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+    with IntexSpaHistoryReader(path) as reader:
+        assert [getattr(status, "bubbles", None) for _, status in reader.range()] == [
+            False,
+            True,
+            None,
+            True,
+        ]
@@ -0,0 +1,105 @@
+"""Load metrics tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import (
+    IntexSpa,
+    IntexSpaMetrics,
+    IntexSpaRetryPolicy,
+    IntexSpaRetryStrategy,
+    IntexSpaUnreachableException,
+)
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+from aio_intex_spa.intex_spa_metrics import IntexSpaHistogram
+
+
+def test_intex_spa_histogram():
+    """Assert values are counted into their buckets."""
+    histogram = IntexSpaHistogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative_counts() == [2, 3, 4]
+    assert histogram.as_dict() == {
+        "buckets": {0.1: 2, 1.0: 3, float("inf"): 4},
+        "sum": 2.65,
+        "count": 4,
+    }
+
+
+@pytest.mark.parametrize("use_protocol", [False, True])
+def test_intex_spa_metrics(use_protocol: bool):
+    """Assert spa conversations are measured."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.01) as emulator:
+            metrics = IntexSpaMetrics(labels={"spa": "test"})
+            spa = IntexSpa(
+                "127.0.0.1",
+                emulator.port,
+                use_protocol=use_protocol,
+                metrics=metrics,
+            )
+            await asyncio.gather(*(spa.async_update_status() for _ in range(3)))
+            await spa.async_update_status(max_age=60)
+            await spa.async_set_jets(True)
+            await spa.network.async_force_disconnect()
+
+            assert metrics.connects == 1
+            assert metrics.disconnects == 1
+            assert metrics.status_cache_misses == 1
+            assert metrics.status_coalesced == 2
+            assert metrics.status_cache_hits == 1
+            assert metrics.status_cache_hit_ratio == 0.75
+            assert metrics.retries == {}
+
+            latencies = metrics.as_dict()["latencies"]
+            assert set(latencies) == {"status", "jets"}
+            assert set(latencies["status"]) == {
+                "semaphore_wait",
+                "send",
+                "receive",
+                "parse",
+            }
+            assert latencies["status"]["receive"]["count"] == 2
+            assert latencies["status"]["receive"]["sum"] >= 0.02
+            assert latencies["jets"]["parse"]["count"] == 1
+
+            prometheus = metrics.as_prometheus()
+            assert (
+                'intex_spa_latency_seconds_bucket{spa="test",intent="jets",'
+                'phase="receive",le="+Inf"} 1\n'
+            ) in prometheus
+            assert 'intex_spa_connects_total{spa="test"} 1\n' in prometheus
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_metrics_retries():
+    """Assert failed query attempts are counted by exception class."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(malformed_rate=1) as emulator:
+            metrics = IntexSpaMetrics()
+            spa = IntexSpa(
+                "127.0.0.1",
+                emulator.port,
+                retry_strategy=IntexSpaRetryStrategy(
+                    protocol=IntexSpaRetryPolicy(base_delay=0)
+                ),
+                metrics=metrics,
+            )
+            with pytest.raises(IntexSpaUnreachableException):
+                await spa.async_update_status()
+            await spa.network.async_force_disconnect()
+
+            assert metrics.retries == {"IntexSpaChecksumException": 3}
+            assert metrics.malformed_responses == 3
+            assert (
+                'intex_spa_retries_total{error="IntexSpaChecksumException"} 3\n'
+                in metrics.as_prometheus()
+            )
+
+    asyncio.run(_async_test())
@@ -0,0 +1,108 @@
+"""Load network layer tests."""
+
+import asyncio
+import json
+
+import pytest
+
+from aio_intex_spa import IntexSpa
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+from aio_intex_spa.intex_spa_network_layer import IntexSpaNetworkLayer
+from aio_intex_spa.intex_spa_protocol import (
+    IntexSpaProtocol,
+    IntexSpaProtocolNetworkLayer,
+)
+from aio_intex_spa.intex_spa_query import IntexSpaQuery
+
+
+def test_intex_spa_network_layer_pipelined():
+    """Assert pipelined responses are dispatched to their requests by sid."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.01) as emulator:
+            network = IntexSpaNetworkLayer("127.0.0.1", emulator.port, max_in_flight=4)
+            queries = [IntexSpaQuery("info" if i % 2 else "status") for i in range(10)]
+            assert len({query.intex_timestamp for query in queries}) == 10
+
+            responses = await asyncio.gather(
+                *(
+                    network.async_request(query.request_bytes, query.intex_timestamp)
+                    for query in queries
+                )
+            )
+            for query, response in zip(queries, responses, strict=True):
+                assert json.loads(response)["sid"] == query.intex_timestamp
+                query.render_response_data(response)
+            await network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 4])
+def test_intex_spa_protocol_network_layer(max_in_flight):
+    """Assert IntexSpa works over the asyncio protocol network layer."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.01) as emulator:
+            spa = IntexSpa(
+                "127.0.0.1",
+                emulator.port,
+                max_in_flight=max_in_flight,
+                use_protocol=True,
+            )
+            assert isinstance(spa.network, IntexSpaProtocolNetworkLayer)
+            info, status = await asyncio.gather(
+                spa.async_update_info(), spa.async_set_jets(True)
+            )
+            assert info.dtype == "spa"
+            assert status.jets
+
+            # A lost connection is noticed, and reopened on the next request
+            spa.network.protocol.close()
+            await asyncio.sleep(0.01)
+            assert spa.network.protocol.closed
+            assert (await spa.async_set_jets(False)).jets is False
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_protocol_framing():
+    """Assert responses split across or packed within reads are framed on newlines."""
+
+    async def _async_test():
+        protocol = IntexSpaProtocol()
+        protocol.data_received(b'{"first": ')
+        protocol.data_received(b'1}\n{"second": 2}\n{"thi')
+        assert await protocol.async_readline() == b'{"first": 1}\n'
+        readline = asyncio.ensure_future(protocol.async_readline())
+        assert await protocol.async_readline() == b'{"second": 2}\n'
+        protocol.data_received(b'rd": 3}\n')
+        # Waiters are served in order
+        assert await readline == b'{"third": 3}\n'
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_protocol_flow_control():
+    """Assert sends wait while the transport buffer is full, up to send_timeout."""
+
+    async def _async_test():
+        protocol = IntexSpaProtocol()
+        await protocol.async_drain()
+        protocol.pause_writing()
+        drain = asyncio.ensure_future(protocol.async_drain())
+        await asyncio.sleep(0)
+        assert not drain.done()
+        protocol.resume_writing()
+        await drain
+
+        network = IntexSpaProtocolNetworkLayer("127.0.0.1", 8990, send_timeout=0.01)
+        protocol.pause_writing()
+        with pytest.raises(TimeoutError):
+            await network._async_drain(protocol)
+        protocol.connection_lost(None)
+        with pytest.raises(ConnectionResetError):
+            await protocol.async_drain()
+
+    asyncio.run(_async_test())
@@ -0,0 +1,84 @@
+"""Load IntexSpaPollScheduler tests."""
+
+import asyncio
+
+from aio_intex_spa import IntexSpa, IntexSpaPollScheduler
+from aio_intex_spa.intex_spa_emulator import (
+    DEFAULT_RAW_STATUS,
+    FUNCTION_BITS,
+    IntexSpaEmulator,
+)
+
+# Heater on, 30°C current temperature, 34°C preset temperature
+HEATING_RAW_STATUS = DEFAULT_RAW_STATUS ^ (0x22 ^ 0x1E) << 88
+OFF_RAW_STATUS = DEFAULT_RAW_STATUS ^ 1 << FUNCTION_BITS["power"]
+
+
+def test_intex_spa_poll_scheduler():
+    """Assert heating spas are polled fast, idle ones back off until a command."""
+
+    async def _async_test():
+        async with (
+            IntexSpaEmulator(raw_status=HEATING_RAW_STATUS) as heating_emulator,
+            IntexSpaEmulator(raw_status=OFF_RAW_STATUS) as off_emulator,
+            IntexSpaEmulator() as stable_emulator,
+        ):
+            spas = {
+                "heating": IntexSpa("127.0.0.1", heating_emulator.port),
+                "off": IntexSpa("127.0.0.1", off_emulator.port),
+                "stable": IntexSpa("127.0.0.1", stable_emulator.port),
+            }
+            scheduler = IntexSpaPollScheduler(
+                spas, fast_interval=0.02, interval=0.05, max_interval=0.2
+            )
+            scheduler.start()
+            await asyncio.sleep(0.6)
+
+            assert scheduler.intervals == {
+                "heating": 0.02,
+                "off": 0.2,
+                "stable": 0.2,
+            }
+            assert heating_emulator.requests_count > 2 * off_emulator.requests_count
+            assert heating_emulator.requests_count > 2 * stable_emulator.requests_count
+
+            # A command resets the spa to fast polling
+            requests_count = stable_emulator.requests_count
+            polls = scheduler.polls
+            await spas["stable"].async_set_jets(True)
+            assert scheduler.intervals["stable"] == 0.02
+            await asyncio.sleep(0.05)
+            assert stable_emulator.requests_count > requests_count + 2
+
+            # Back to the adaptive interval once the change is seen
+            assert scheduler.polls > polls
+            assert scheduler.intervals["stable"] == 0.05
+
+            await scheduler.async_stop()
+            for spa in spas.values():
+                await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_poll_scheduler_poll_soon_during_poll():
+    """Assert a command during a poll is followed by another poll."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.05) as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            scheduler = IntexSpaPollScheduler(
+                {"spa": spa}, fast_interval=1.0, interval=10.0, max_interval=10.0
+            )
+            scheduler.start()
+            while "spa" not in scheduler._polling:
+                await asyncio.sleep(0.005)
+
+            scheduler.poll_soon("spa")
+            await asyncio.sleep(0.2)
+            assert scheduler.polls == 2
+
+            await scheduler.async_stop()
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
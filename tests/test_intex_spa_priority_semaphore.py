@@ -0,0 +1,72 @@
+"""Load priority semaphore tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import IntexSpaPreemptedException
+from aio_intex_spa.intex_spa_priority_semaphore import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    PRIORITY_STATUS,
+    IntexSpaPrioritySemaphore,
+)
+
+
+def test_intex_spa_priority_semaphore_order():
+    """Assert slots are granted by priority, then first come, first served."""
+
+    async def _async_test():
+        semaphore = IntexSpaPrioritySemaphore()
+        order = []
+
+        async def _async_work(name: str, priority: int, key: str = None):
+            async with semaphore.hold(priority, key):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await semaphore.async_acquire()
+        assert semaphore.locked()
+        tasks = [
+            asyncio.create_task(_async_work("background", PRIORITY_BACKGROUND)),
+            asyncio.create_task(_async_work("status", PRIORITY_STATUS, "status")),
+            asyncio.create_task(_async_work("info", PRIORITY_STATUS)),
+            asyncio.create_task(_async_work("command", PRIORITY_COMMAND)),
+        ]
+        cancelled = asyncio.create_task(_async_work("cancelled", PRIORITY_COMMAND))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        semaphore.reprioritize("status", PRIORITY_COMMAND)
+        semaphore.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["status", "command", "info", "background"]
+        assert not semaphore.locked()
+        assert semaphore.value == 1
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_priority_semaphore_cancel_waiters():
+    """Assert queued waiters of low priority can be cancelled."""
+
+    async def _async_test():
+        semaphore = IntexSpaPrioritySemaphore()
+        await semaphore.async_acquire()
+        status = asyncio.create_task(semaphore.async_acquire(PRIORITY_STATUS))
+        background = asyncio.create_task(semaphore.async_acquire(PRIORITY_BACKGROUND))
+        command = asyncio.create_task(semaphore.async_acquire(PRIORITY_COMMAND))
+        await asyncio.sleep(0)
+
+        assert semaphore.cancel_waiters(PRIORITY_STATUS) == 2
+        with pytest.raises(IntexSpaPreemptedException):
+            await status
+        with pytest.raises(IntexSpaPreemptedException):
+            await background
+
+        semaphore.release()
+        await command
+        semaphore.release()
+        assert semaphore.value == 1
+
+    asyncio.run(_async_test())
@@ -0,0 +1,46 @@
+"""Load query encoding and decoding tests."""
+
+import json
+
+import pytest
+
+from aio_intex_spa.intex_spa_query import COMMAND, IntexSpaQuery, parse_status_response
+
+STATUS_DATA = "FFFF110F010700220000000080808022000012"
+
+
+@pytest.mark.parametrize(
+    "intent", [intent for intent in COMMAND if intent != "preset_temp"]
+)
+def test_intex_spa_request_bytes(intent):
+    """Assert request templates encode exactly as the JSON encoder."""
+    query = IntexSpaQuery(intent)
+    assert query.request_bytes == query._request_bytes_json()
+    assert json.loads(query.request_bytes)["sid"] == query.intex_timestamp
+
+
+def test_intex_spa_request_bytes_preset_temp():
+    """Assert request templates cover every temperature preset."""
+    for preset_temp in range(10, 105):
+        query = IntexSpaQuery("preset_temp", preset_temp)
+        assert query.request_bytes == query._request_bytes_json()
+
+
+def test_intex_spa_status_response_fast_path():
+    """Assert the compact status response parser matches the JSON decoder."""
+    query = IntexSpaQuery("status")
+    sid = query.intex_timestamp
+    response = (
+        f'{{"sid":"{sid}","data":"{STATUS_DATA}","result":"ok","type":2}}\n'.encode()
+    )
+    assert parse_status_response(response, sid) == int(STATUS_DATA, 16)
+    assert parse_status_response(memoryview(response), sid) == int(STATUS_DATA, 16)
+    assert query.render_response_data(response) == int(STATUS_DATA, 16)
+
+    # Other sids and other layouts are left to the JSON decoder
+    assert parse_status_response(response, "12345678901234") is None
+    spaced_response = json.dumps(
+        {"sid": sid, "data": STATUS_DATA, "result": "ok", "type": 2}
+    ).encode()
+    assert parse_status_response(spaced_response, sid) is None
+    assert query.render_response_data(spaced_response) == int(STATUS_DATA, 16)
@@ -1,6 +1,15 @@
 """Load checksum tests."""
 
-from aio_intex_spa.intex_spa_query import IntexSpaQuery
+import json
+
+from aio_intex_spa.intex_spa_exceptions import IntexSpaChecksumException
+from aio_intex_spa.intex_spa_query import (
+    IntexSpaQuery,
+    checksum_as_int,
+    checksum_of_bytes,
+    decode_status_frame,
+    decode_status_frames,
+)
 
 import pytest
 
@@ -30,3 +39,35 @@ def test_invalid_intex_spa_checksums(status_response):
     query.intex_timestamp = "12345678901234"
     with pytest.raises(AssertionError):
         query.render_response_data(received_bytes=status_response)
+
+
+def test_intex_spa_checksum_of_bytes():
+    """Assert raw bytes checksums match hex string checksums."""
+    for status_response in valid_status_responses:
+        data = json.loads(status_response)["data"]
+        frame = bytes.fromhex(data)
+        assert checksum_of_bytes(frame[:-1]) == checksum_as_int(data[:-2]) == frame[-1]
+    # Fix: https://github.com/mathieu-mp/aio-intex-spa/issues/27
+    assert checksum_of_bytes(b"\xff") == 0xFF
+    assert checksum_of_bytes(b"") == 0xFF
+
+
+def test_intex_spa_decode_status_frames():
+    """Assert status frames are validated and decoded in one pass."""
+    frames = [json.loads(response)["data"] for response in valid_status_responses]
+    invalid_frames = [
+        json.loads(response)["data"] for response in invalid_status_responses
+    ]
+
+    for frame in frames:
+        assert decode_status_frame(frame) == int(frame, 16)
+        assert decode_status_frame(bytes.fromhex(frame)) == int(frame, 16)
+    for frame in invalid_frames:
+        with pytest.raises(IntexSpaChecksumException):
+            decode_status_frame(frame)
+    with pytest.raises(AssertionError):
+        decode_status_frame(frames[0][:-2])
+
+    assert decode_status_frames(frames + invalid_frames + ["not hex"]) == [
+        int(frame, 16) for frame in frames
+    ] + [None] * (len(invalid_frames) + 1)
@@ -0,0 +1,66 @@
+"""Load rate limiter tests."""
+
+import asyncio
+import contextlib
+import time
+
+from aio_intex_spa import (
+    IntexSpa,
+    IntexSpaRateLimiter,
+    IntexSpaRetryStrategy,
+    IntexSpaUnreachableException,
+)
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+
+
+def test_intex_spa_rate_limiter():
+    """Assert queries beyond the burst are delayed to the sustained rate."""
+
+    async def _async_test():
+        rate_limiter = IntexSpaRateLimiter(rate=100, burst=2)
+        start = time.monotonic()
+        await asyncio.gather(*(rate_limiter.async_acquire() for _ in range(6)))
+        duration = time.monotonic() - start
+
+        # 2 queries in the burst, then 4 queries 10ms apart
+        assert 0.035 <= duration < 0.2
+        assert rate_limiter.throttled == 4
+        assert 0.09 <= rate_limiter.throttle_time <= 0.11
+        assert 0.035 <= rate_limiter.max_throttle_delay <= 0.045
+        assert not rate_limiter.try_acquire()
+        assert rate_limiter.acquired == 6
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_rate_limiter_overloaded_emulator():
+    """Assert a rate-limited spa does not overload its wifi module."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(max_rate=50) as emulator:
+            # Without rate limiter, back-to-back queries overload the spa
+            spa = IntexSpa(
+                "127.0.0.1",
+                emulator.port,
+                retry_strategy=IntexSpaRetryStrategy(budget=1),
+            )
+            for _ in range(5):
+                with contextlib.suppress(IntexSpaUnreachableException):
+                    await spa.async_update_status()
+            assert emulator.malformed_count > 0
+            await spa.network.async_force_disconnect()
+            await asyncio.sleep(0.05)
+
+            requests_count = emulator.requests_count
+            rate_limiter = IntexSpaRateLimiter(25)
+            spa = IntexSpa("127.0.0.1", emulator.port, rate_limiter=rate_limiter)
+            start = time.monotonic()
+            for _ in range(5):
+                await spa.async_update_status()
+            # Every query sent took a token, and tokens are earned at 25 per second
+            assert rate_limiter.acquired == emulator.requests_count - requests_count
+            assert rate_limiter.acquired >= 5
+            assert time.monotonic() - start >= 4 / 25 - 0.005
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
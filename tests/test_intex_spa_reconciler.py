@@ -0,0 +1,90 @@
+"""Load reconciler tests."""
+
+import asyncio
+
+from aio_intex_spa import IntexSpa, IntexSpaReconciler
+from aio_intex_spa.intex_spa_emulator import FUNCTION_BITS, IntexSpaEmulator
+
+
+async def _async_wait_converged(reconciler: IntexSpaReconciler) -> None:
+    async with asyncio.timeout(2):
+        while not reconciler.converged:
+            await asyncio.sleep(0.01)
+
+
+def test_intex_spa_reconciler():
+    """Assert the reconciler converges, and corrects drifts."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            reconciler = IntexSpaReconciler(
+                spa, {"heater": False, "jets": True}, interval=0.05, max_interval=0.1
+            )
+            reconciler.start()
+            await _async_wait_converged(reconciler)
+            assert spa.status.heater is False
+            assert spa.status.jets
+
+            # Converged reconciliations only update the status
+            requests_count = emulator.requests_count
+            await reconciler.async_reconcile()
+            assert emulator.requests_count == requests_count + 1
+
+            reconciler.set_target(preset_temp=38)
+            await _async_wait_converged(reconciler)
+            assert spa.status.preset_temp == 38
+
+            # The heater is turned on behind the back of the reconciler
+            emulator.raw_status ^= 1 << FUNCTION_BITS["heater"]
+            reconciler.converged = False
+            await _async_wait_converged(reconciler)
+            assert spa.status.heater is False
+
+            await reconciler.async_stop()
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_reconciler_target_cleared_during_reconcile():
+    """Assert clearing a target during a reconciliation does not break it."""
+
+    async def _async_test():
+        async with IntexSpaEmulator(latency=0.05) as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port)
+            reconciler = IntexSpaReconciler(spa, {"heater": False, "jets": True})
+            task = asyncio.create_task(reconciler.async_reconcile())
+            await asyncio.sleep(0.01)
+            reconciler.clear_target("jets")
+            # The reconciliation goes on with the target it started with
+            assert await task
+            assert spa.status.jets
+            assert reconciler.target == {"heater": False}
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_reconciler_retries_until_converged():
+    """Assert the reconciler only backs off once the spa has converged."""
+
+    async def _async_test():
+        reconciler = IntexSpaReconciler(
+            IntexSpa("127.0.0.1"), {"heater": False}, interval=0.02, max_interval=10
+        )
+        reconciliations = []
+
+        async def _async_reconcile():
+            reconciliations.append(reconciler.converged)
+            reconciler.converged = len(reconciliations) > 5
+            return reconciler.converged
+
+        reconciler.async_reconcile = _async_reconcile
+        reconciler.start()
+        await asyncio.sleep(0.3)
+        await reconciler.async_stop()
+        # 6 reconciliations 20ms apart, then 40ms, 80ms and 160ms apart
+        assert 6 <= len(reconciliations) <= 8
+
+    asyncio.run(_async_test())
@@ -0,0 +1,110 @@
+"""Load resolver tests."""
+
+import asyncio
+import socket
+
+import pytest
+
+from aio_intex_spa import IntexSpa, IntexSpaDnsException
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+from aio_intex_spa.intex_spa_network_layer import IntexSpaNetworkLayer
+from aio_intex_spa.intex_spa_resolver import IntexSpaResolver
+
+
+@pytest.fixture
+def getaddrinfo_calls(monkeypatch) -> list[str]:
+    """Fake getaddrinfo, resolving "spa" hostnames only, and record its calls."""
+    calls = []
+
+    def _getaddrinfo(host, port, *args, **kwargs):
+        calls.append(host)
+        if not host.startswith("spa"):
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", int(port))),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", int(port))),
+        ]
+
+    monkeypatch.setattr(socket, "getaddrinfo", _getaddrinfo)
+    return calls
+
+
+def test_intex_spa_resolver_cache(getaddrinfo_calls: list[str]):
+    """Assert hostnames are cached, and lookups coalesced."""
+
+    async def _async_test():
+        resolver = IntexSpaResolver(ttl=60)
+        results = await asyncio.gather(
+            *(resolver.async_resolve("spa1", "8990") for _ in range(10))
+        )
+        assert results == [["127.0.0.1"]] * 10
+        assert getaddrinfo_calls == ["spa1"]
+
+        assert await resolver.async_resolve("spa1", "8990") == ["127.0.0.1"]
+        assert getaddrinfo_calls == ["spa1"]
+
+        resolver.forget("spa1")
+        await resolver.async_resolve("spa1", "8990")
+        assert getaddrinfo_calls == ["spa1", "spa1"]
+
+        # Literal IP addresses are never looked up
+        assert await resolver.async_resolve("192.168.1.2", "8990") == ["192.168.1.2"]
+        assert await resolver.async_resolve("::1", "8990") == ["::1"]
+        assert getaddrinfo_calls == ["spa1", "spa1"]
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_resolver_expiry(getaddrinfo_calls: list[str]):
+    """Assert cached addresses and failures expire."""
+
+    async def _async_test():
+        resolver = IntexSpaResolver(ttl=0, negative_ttl=60)
+        await resolver.async_resolve("spa1", "8990")
+        await resolver.async_resolve("spa1", "8990")
+        assert getaddrinfo_calls == ["spa1", "spa1"]
+
+        # Failures are cached too
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                await resolver.async_resolve("unknown", "8990")
+        assert getaddrinfo_calls == ["spa1", "spa1", "unknown"]
+
+        resolver.clear()
+        with pytest.raises(socket.gaierror):
+            await resolver.async_resolve("unknown", "8990")
+        assert getaddrinfo_calls == ["spa1", "spa1", "unknown", "unknown"]
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_network_layer_dns_exception(getaddrinfo_calls: list[str]):
+    """Assert unresolvable hostnames still raise IntexSpaDnsException."""
+
+    async def _async_test():
+        network = IntexSpaNetworkLayer(
+            "unknown", "8990", resolver=IntexSpaResolver(negative_ttl=60)
+        )
+        for _ in range(2):
+            with pytest.raises(IntexSpaDnsException):
+                await network.async_connect()
+        assert getaddrinfo_calls == ["unknown"]
+
+    asyncio.run(_async_test())
+
+
+def test_intex_spa_network_layer_resolver(getaddrinfo_calls: list[str]):
+    """Assert spas are reached through the resolver, and not resolved again."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            resolver = IntexSpaResolver()
+            spa = IntexSpa("spa1", emulator.port)
+            spa.network.resolver = resolver
+            await spa.async_update_status()
+            await spa.network.async_force_disconnect()
+            await spa.async_update_status()
+            assert getaddrinfo_calls == ["spa1"]
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
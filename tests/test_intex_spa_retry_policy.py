@@ -0,0 +1,72 @@
+"""Load retry policy tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import (
+    IntexSpa,
+    IntexSpaChecksumException,
+    IntexSpaMalformedResponseException,
+    IntexSpaRetryPolicy,
+    IntexSpaRetryStrategy,
+    IntexSpaUnreachableException,
+)
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+
+
+def test_intex_spa_retry_policy_delays():
+    """Assert exponential backoff, capping and jitter of retry delays."""
+    policy = IntexSpaRetryPolicy(base_delay=1, backoff=2, max_delay=5)
+    assert [policy.get_delay(retry) for retry in range(1, 5)] == [1, 2, 4, 5]
+
+    policy = IntexSpaRetryPolicy(base_delay=1, jitter=0.5)
+    delays = [policy.get_delay(1) for _ in range(100)]
+    assert all(0.5 <= delay <= 1 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_intex_spa_retry_strategy_budget():
+    """Assert retry policies are selected by error, within the overall budget."""
+    strategy = IntexSpaRetryStrategy(
+        network=IntexSpaRetryPolicy(max_attempts=3, base_delay=1),
+        protocol=IntexSpaRetryPolicy(max_attempts=3, base_delay=2),
+        checksum=IntexSpaRetryPolicy(max_attempts=2, base_delay=0),
+        budget=4,
+    )
+    failures = {}
+    assert strategy.get_delay(IntexSpaChecksumException(), failures) == 0
+    assert strategy.get_delay(IntexSpaMalformedResponseException(), failures) == 2
+    assert strategy.get_delay(ConnectionResetError(), failures) == 1
+    # The budget of 4 attempts is spent
+    assert strategy.get_delay(ConnectionResetError(), failures) is None
+
+    failures = {}
+    assert strategy.get_delay(IntexSpaChecksumException(), failures) == 0
+    # The checksum policy allows 2 attempts only
+    assert strategy.get_delay(IntexSpaChecksumException(), failures) is None
+
+
+def test_intex_spa_retries_on_emulator():
+    """Assert IntexSpa recovers from malformed replies and dropped connections."""
+    strategy = IntexSpaRetryStrategy(
+        network=IntexSpaRetryPolicy(max_attempts=20, base_delay=0),
+        protocol=IntexSpaRetryPolicy(max_attempts=20, base_delay=0),
+        budget=40,
+    )
+
+    async def _async_test():
+        async with IntexSpaEmulator(
+            malformed_rate=0.3, drop_rate=0.3, seed=1
+        ) as emulator:
+            spa = IntexSpa("127.0.0.1", emulator.port, retry_strategy=strategy)
+            for _ in range(10):
+                assert (await spa.async_update_status()).heater
+            assert emulator.requests_count > 10
+
+            emulator.malformed_rate = 1
+            with pytest.raises(IntexSpaUnreachableException):
+                await spa.async_update_status()
+            await spa.network.async_force_disconnect()
+
+    asyncio.run(_async_test())
@@ -1,6 +1,15 @@
 """Load Status parsing tests."""
 
-from aio_intex_spa.intex_spa_object_status import IntexSpaStatus
+import pickle
+
+import pytest
+
+from aio_intex_spa.intex_spa_object_status import (
+    STATUS_FIELDS,
+    IntexSpaStatus,
+    IntexSpaStatusSnapshot,
+    changed_status_fields,
+)
 
 
 def test_intex_spa_status():
@@ -35,3 +44,52 @@ def test_intex_spa_error_code():
     assert intex_spa_status.current_temp is False
     assert intex_spa_status.error_code == "E81"
     assert intex_spa_status.preset_temp == 34
+
+
+def test_intex_spa_status_snapshot():
+    """Test function for IntexSpaStatusSnapshot immutability and hashing."""
+    status_int = int("0x" + "FFFF110F010700220000000080808022000012", 16)
+    intex_spa_status = IntexSpaStatus(status_int)
+    snapshot = intex_spa_status.snapshot()
+    assert isinstance(snapshot, IntexSpaStatusSnapshot)
+    assert snapshot.as_dict() == intex_spa_status.as_dict()
+    assert snapshot == IntexSpaStatusSnapshot(status_int)
+    assert len({snapshot, IntexSpaStatusSnapshot(status_int)}) == 1
+    assert snapshot != IntexSpaStatusSnapshot(status_int ^ (1 << 104))
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+    # Mutable statuses hash by identity: never equal to a snapshot
+    assert snapshot != intex_spa_status
+    assert intex_spa_status != snapshot
+
+    with pytest.raises(AttributeError):
+        snapshot.power = False
+    with pytest.raises(AttributeError):
+        snapshot.update(status_int)
+
+    # Mutable statuses can still be updated
+    intex_spa_status.update(status_int ^ (1 << 104))
+    assert intex_spa_status.power is False
+    assert snapshot.power
+
+
+def test_intex_spa_status_empty():
+    """Test function for IntexSpaStatus without input status."""
+    assert set(IntexSpaStatus().as_dict().values()) == {None}
+    assert set(IntexSpaStatusSnapshot().as_dict().values()) == {None}
+    assert IntexSpaStatusSnapshot() == IntexSpaStatusSnapshot()
+
+
+def test_intex_spa_changed_status_fields():
+    """Test function for changed_status_fields bitmask diffing."""
+    status_int = int("0x" + "FFFF110F010700220000000080808022000012", 16)
+    status = IntexSpaStatus(status_int)
+    # Toggled jets, and current_temp from 34 to 35
+    changed = IntexSpaStatus(status_int ^ (1 << 107) ^ (0x22 ^ 0x23) << 88)
+    assert changed_status_fields(status, changed) == ("jets", "current_temp")
+    # Bits out of any field (i.e.: the checksum) are ignored
+    assert changed_status_fields(status, IntexSpaStatus(status_int ^ 0xFF)) == ()
+    # From a temperature to an error code
+    error = IntexSpaStatus(status_int ^ (0x22 ^ 0xB5) << 88)
+    assert changed_status_fields(status, error) == ("current_temp", "error_code")
+    assert changed_status_fields(IntexSpaStatus(), status) == STATUS_FIELDS
+    assert changed_status_fields(IntexSpaStatus(), IntexSpaStatusSnapshot()) == ()
@@ -0,0 +1,79 @@
+"""Load IntexSpaTracer tests."""
+
+import asyncio
+
+import pytest
+
+from aio_intex_spa import IntexSpa, IntexSpaTracer
+from aio_intex_spa.intex_spa_emulator import IntexSpaEmulator
+from aio_intex_spa.intex_spa_tracing import NO_SPAN, start_span
+
+
+def test_intex_spa_tracer_nesting():
+    """Assert spans nest, record exceptions, and are skipped without tracer."""
+    ended = []
+    tracer = IntexSpaTracer(on_end=ended.append)
+
+    assert start_span(None, "intex_spa.intent", "status") is NO_SPAN
+    with (
+        start_span(tracer, "intex_spa.intent", "status") as parent,
+        pytest.raises(ValueError),
+        start_span(tracer, "intex_spa.query", sid="1"),
+    ):
+        raise ValueError
+
+    child, root = ended
+    assert root is parent
+    assert child.parent is parent
+    assert root.parent is None
+    assert isinstance(child.exception, ValueError)
+    assert child.attributes == {"intex_spa.sid": "1"}
+    assert root.attributes == {"intex_spa.intent": "status"}
+    assert root.duration >= child.duration >= 0
+
+
+@pytest.mark.parametrize("use_protocol", [False, True])
+def test_intex_spa_tracing(use_protocol):
+    """Assert each stage of a command is traced, tagged with its intent and sid."""
+
+    async def _async_test():
+        async with IntexSpaEmulator() as emulator:
+            ended = []
+            spa = IntexSpa(
+                "127.0.0.1",
+                emulator.port,
+                use_protocol=use_protocol,
+                tracer=IntexSpaTracer(on_end=ended.append),
+            )
+            await spa.async_set_jets(True)
+            await spa.network.async_force_disconnect()
+
+        names = [span.name for span in ended]
+        for name in (
+            "intex_spa.semaphore_wait",
+            "intex_spa.preliminary_update",
+            "intex_spa.connect",
+            "intex_spa.send",
+            "intex_spa.receive",
+            "intex_spa.parse",
+        ):
+            assert name in names
+        assert names[-1] == "intex_spa.intent"
+        assert names.count("intex_spa.query") == 2
+
+        intent = ended[-1]
+        for span in ended:
+            if span.name in ("intex_spa.send", "intex_spa.receive", "intex_spa.parse"):
+                assert span.parent.name == "intex_spa.query"
+                assert (
+                    span.attributes["intex_spa.sid"]
+                    == (span.parent.attributes["intex_spa.sid"])
+                )
+        commands = [
+            span
+            for span in ended
+            if span.name == "intex_spa.query" and span.parent is intent
+        ]
+        assert [span.attributes["intex_spa.intent"] for span in commands] == ["jets"]
+
+    asyncio.run(_async_test())